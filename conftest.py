@@ -1,33 +1,397 @@
 import pytest
 import os
+import sys
 from dotenv import load_dotenv
 import allure
+import allure_commons
+from playwright.async_api import async_playwright
 from playwright.sync_api import sync_playwright
 
 # ✅ Load environment variables from .env at the very beginning
 load_dotenv()
 
+from utils.a11y import a11y
+from utils.aio import AsyncTestPlugin, LoopThread
+from utils.api_client import TaskApi, TaskDataLayer
+from utils.auth import AuthStateCache
+from utils.browser_pool import BrowserPool
+from utils.browser_server import BrowserServer, SharedBrowser
+from pages.TaskBoard_page import TaskBoardPage
+from pages.base_page import BasePage
+from utils.config import Config
+from utils.failure_artifacts import failure_artifacts
+from utils.flaky import flaky_tests
+from utils.locators import invalid_selectors
+from utils.network_archive import archive_for, archive_registry
+from utils.page_timings import page_timings
+from utils.reconciliation import reconciler
+from utils.report_sink import ReportBuilder, ResultSink
+from utils.route_profiles import PROFILES, ContextRouter, ResourceSizes
+from utils.scheduler import TestHistory, select_for_changed_pages
+from utils.stub_server import StubData, StubServer
+from utils.trace_ring import trace_ring
+from utils.viewports import viewport_matrix
+from utils.waits import wait_stats
+from utils.web_perf import CATEGORY_NAME, PerformanceBudgetExceeded, web_perf
 
-import pytest
-from playwright.sync_api import sync_playwright
 
-@pytest.fixture(scope="module")  # ✅ Use module scope
-def page():
+def pytest_addoption(parser):
+    parser.addini("report_stream", "Stream results to Config.REPORT_STREAM_DIR and rebuild its report incrementally",
+                  type="bool", default=False)
+    parser.addini("history_schedule", "Run recently failed modules first, then the rest longest-first",
+                  type="bool", default=False)
+    parser.addini("flaky_retries", "Times a failing test is retried on its module page (0 = off; --retries N "
+                  "turns it on), within FLAKY_RETRY_BUDGET_S", default="0")
+    group = parser.getgroup("rak", "RAK-WBG framework")
+    group.addoption("--no-report-stream", action="store_true", help="Disable the streaming results sink for this run")
+    group.addoption("--no-history-schedule", action="store_true", help="Keep collection order for this run")
+    group.addoption("--changed-pages", metavar="REF",
+                    help="Only run test modules affected by changes under pages/ since the git ref REF")
+    group.addoption("--retries", type=int, metavar="N", help="Override flaky_retries for this run (0 disables)")
+    group.addoption("--quarantine", default="run", choices=["run", "skip", "only"],
+                    help="Quarantined flaky tests: run non-blocking in place, leave out, or run only them")
+    group.addoption("--record", action="store_true", help="Record each module's network traffic to hars/<module>.har")
+    group.addoption("--replay", action="store_true", help="Serve network traffic from hars/<module>.har (offline)")
+    group.addoption("--replay-strict", action="store_true", help="With --replay, fail tests that made unmatched requests")
+    group.addoption("--route-profile", default="full", choices=sorted(PROFILES),
+                    help="Default resource-blocking profile for tests without a route_profile marker")
+    group.addoption("--page-timings", action="store_true",
+                    help="Time every page-object method; Allure flame table per test, JSON summary per run")
+    group.addoption("--web-perf", action="store_true",
+                    help="Capture web-perf metrics on every visit/sidebar navigation and enforce page budgets")
+    group.addoption("--trace-failures", action="store_true",
+                    help="Trace each test as its own chunk; attach the last TRACE_RING_SIZE chunks when a test fails")
+    group.addoption("--visual-update", action="store_true",
+                    help="Record the current screenshot as the baseline for visual checks that fail")
+    group.addoption("--shared-browser", action="store_true",
+                    help="Attach to the machine-wide Chromium (started once, restarted if it dies) instead of launching")
+    group.addoption("--stub-server", action="store_true", help="Run against the bundled local stand-in server")
+    group.addoption("--stub-seed", type=int, default=0, help="Data seed for --stub-server")
+    group.addoption("--stub-latency-ms", type=float, default=0, help="Per-response latency for --stub-server")
+
+
+def pytest_configure(config):
+    config.pluginmanager.register(AsyncTestPlugin(), "rak-async-tests")
+    retries = config.getoption("--retries")
+    flaky_tests.configure(int(config.getini("flaky_retries")) if retries is None else retries,
+                          config.getoption("--quarantine"))
+    config.pluginmanager.register(flaky_tests, "rak-flaky-tests")
+    if config.getini("report_stream") and not config.getoption("--no-report-stream"):
+        config.report_sink = ResultSink()
+        config.pluginmanager.register(config.report_sink, "rak-report-sink")
+        allure_commons.plugin_manager.register(config.report_sink)
+    if config.getoption("--record") and config.getoption("--replay"):
+        raise pytest.UsageError("--record and --replay cannot be combined.")
+    if config.getoption("--stub-server"):
+        data = StubData.generate(config.getoption("--stub-seed"), username=Config.TEST_EMAIL, password=Config.PASSWORD)
+        config.stub_server = StubServer(data=data, latency_ms=config.getoption("--stub-latency-ms")).start()
+        Config.point_to(config.stub_server.url)
+    if config.getoption("--page-timings"):
+        page_timings.enable()
+    if config.getoption("--web-perf"):
+        web_perf.enabled = True
+    if config.getoption("--trace-failures"):
+        trace_ring.enable()
+    if config.getoption("--visual-update"):
+        from utils.visual import visual_baselines  # numpy and Pillow are only needed for visual checks
+        visual_baselines.update = True
+
+
+def pytest_collection_modifyitems(config, items):
+    if not config.getoption("--stub-server"):
+        # Masks hide live figures, but row and card counts still move a table's or board's layout
+        for item in items:
+            marker = item.get_closest_marker("visual")
+            if marker and marker.kwargs.get("stub_only"):
+                item.add_marker(pytest.mark.skip(reason="visual baseline needs the seeded --stub-server data"))
+    modules = list(dict.fromkeys(str(item.path) for item in items))
+    ref = config.getoption("--changed-pages")
+    if ref:
+        keep = set(select_for_changed_pages(modules, ref))
+        deselected = [item for item in items if str(item.path) not in keep]
+        if deselected:
+            config.hook.pytest_deselected(items=deselected)
+            items[:] = [item for item in items if str(item.path) in keep]
+        modules = [m for m in modules if m in keep]
+    if config.getini("history_schedule") and not config.getoption("--no-history-schedule") and len(modules) > 1:
+        # Whole modules move; the tests inside one keep their order
+        rank = {module: i for i, module in enumerate(TestHistory.load().order(modules))}
+        items.sort(key=lambda item: rank[str(item.path)])
+
+
+def pytest_collection_finish(session):
+    # Every page object has been imported by the collected test modules by now
+    errors = invalid_selectors(BasePage)
+    if errors:
+        raise pytest.UsageError("Invalid page-object selectors:\n  " + "\n  ".join(errors))
+    if page_timings.enabled:
+        page_timings.instrument(BasePage)
+
+
+def pytest_unconfigure(config):
+    sink = getattr(config, "report_sink", None)
+    if sink:
+        allure_commons.plugin_manager.unregister(sink)
+        sink.close()
+    stub = getattr(config, "stub_server", None)
+    if stub:
+        stub.stop()
+
+
+@pytest.fixture(scope="session")
+def browser(pytestconfig):
     with sync_playwright() as p:
-        browser = p.chromium.launch(headless=False)
-        context = browser.new_context()
-        page = context.new_page()
-        yield page
+        if pytestconfig.getoption("--shared-browser"):
+            # ✅ Launched once per machine; this session only connects (and reconnects after a crash)
+            browser = SharedBrowser(p)
+        else:
+            browser = p.chromium.launch(headless=Config.HEADLESS)
+        yield browser
         browser.close()
 
 
-'''@pytest.hookimpl(hookwrapper=True)
+@pytest.fixture(scope="session")
+def aio_loop():
+    """✅ Event loop (on its own thread) that runs every async test and async fixture of the session."""
+    runner = LoopThread().start()
+    yield runner
+    runner.close()
+
+
+@pytest.fixture(scope="session")
+def async_browser(aio_loop, pytestconfig):
+    """✅ playwright.async_api browser for async tests: one event loop can drive dozens of pages at once."""
+    playwright = aio_loop.run(async_playwright().start())
+    if pytestconfig.getoption("--shared-browser"):
+        endpoint = BrowserServer().ensure(playwright.chromium.executable_path)
+        browser = aio_loop.run(playwright.chromium.connect_over_cdp(endpoint))
+    else:
+        browser = aio_loop.run(playwright.chromium.launch(headless=Config.HEADLESS))
+    yield browser
+    aio_loop.run(browser.close())
+    aio_loop.run(playwright.stop())
+
+
+@pytest.fixture(scope="session")
+def viewports(aio_loop, async_browser, auth_state):
+    """✅ Mobile, tablet and desktop contexts opened side by side from one browser; ``page`` is never resized."""
+    return viewport_matrix.bind(aio_loop, async_browser, auth_state.storage_state())
+
+
+@pytest.fixture(scope="session")
+def browser_pool(browser):
+    """✅ Warm browsers handing out a brand-new context per test (no per-test launch)."""
+    pool = BrowserPool(browser)
+    yield pool
+    pool.close()
+
+
+@pytest.fixture(scope="session")
+def auth_state(browser):
+    """✅ One real UI login per run; every context reuses the saved storage state."""
+    return AuthStateCache(browser)
+
+
+@pytest.fixture(scope="module")  # ✅ Use module scope
+def page(request, browser, auth_state):
+    archive = archive_for(request.config, request.module.__name__)
+    if archive and archive.replaying:
+        state = archive.replay_state()
+    else:
+        state = auth_state.storage_state()
+        if archive:
+            archive.keep_state(state)
+    context = browser.new_context(storage_state=state)
+    if archive:
+        archive.attach(context)
+    if trace_ring.enabled:
+        trace_ring.attach(context)
+    page = context.new_page()
+    auth_state.watch(page)
+    failure_artifacts.watch(page)
+    yield page
+    context.close()
+
+
+@pytest.fixture(scope="module")
+def task_data(page):
+    """✅ Task Board fixtures via the API when it answers (else through the UI), cleaned up when the module finishes."""
+    layer = TaskDataLayer(TaskApi(page.context.request), ui=TaskBoardPage(page))
+    yield layer
+    layer.teardown()
+
+
+@pytest.fixture(scope="session")
+def reconciliation():
+    """✅ Figures shown on several pages, each source read once per run and cross-checked locally."""
+    return reconciler
+
+
+@pytest.fixture(autouse=True)
+def _replay_guard(request):
+    """✅ With --replay-strict, a test fails if it made requests the recording could not answer."""
+    archive = archive_registry.get(request.module.__name__)
+    seen = len(archive.unmatched) if archive else 0
+    yield
+    if archive and archive.unmatched[seen:]:
+        new = archive.unmatched[seen:]
+        allure.attach("\n".join(new), name="Unmatched replay requests", attachment_type=allure.attachment_type.TEXT)
+        if request.config.getoption("--replay-strict"):
+            pytest.fail(f"{len(new)} request(s) not found in {archive.path}: {new[0]}", pytrace=False)
+
+
+@pytest.fixture(scope="session")
+def resource_sizes():
+    """✅ Response sizes seen on any test's context this session, to estimate what route profiles save."""
+    return ResourceSizes()
+
+
+@pytest.fixture(autouse=True)
+def _route_profile(request):
+    """✅ Applies the test's route profile to its browser context and reports what was blocked."""
+    marker = request.node.get_closest_marker("route_profile")
+    name = marker.args[0] if marker else request.config.getoption("--route-profile")
+    if "page" not in request.fixturenames:
+        yield
+        return
+    context = request.getfixturevalue("page").context
+    sizes = request.getfixturevalue("resource_sizes")
+    sizes.watch(context)  # also on "full" contexts: they load what the blocking profiles later skip
+    if name == "full" and not ContextRouter.exists(context):
+        yield  # nothing was ever blocked on this context: no routing overhead at all
+        return
+    router = ContextRouter.for_context(context, sizes)
+    router.use(name)
+    before = router.stats.copy()
+    yield
+    saved = router.stats.since(before)
+    if saved.blocked_requests:
+        request.node.user_properties.append(("route_profile", f"{name}: {saved.describe()}"))
+        allure.attach(saved.describe(), name=f"Route profile '{name}'", attachment_type=allure.attachment_type.TEXT)
+
+
+@pytest.fixture(autouse=True)
+def _page_timings(request):
+    """✅ With --page-timings, attaches where the test's time went, page-object method by method."""
+    if not page_timings.enabled:
+        yield
+        return
+    page_timings.begin_test(request.node.nodeid)
+    yield
+    root = page_timings.end_test()
+    if root and root.children:
+        allure.attach(page_timings.flame_table(root), name="Page-object timings",
+                      attachment_type=allure.attachment_type.HTML)
+
+
+@pytest.fixture(autouse=True)
+def _trace_ring(request):
+    """✅ With --trace-failures, records the test as its own trace chunk (closed in pytest_runtest_makereport)."""
+    if not trace_ring.enabled or "page" not in request.fixturenames:
+        yield
+        return
+    context = request.getfixturevalue("page").context
+    trace_ring.begin(context, request.node.nodeid)
+    yield
+    if trace_ring.open:  # the test never reached its call phase
+        trace_ring.end(request.node.nodeid, keep=False)
+
+
+@pytest.hookimpl(wrapper=True)
+def pytest_pyfunc_call(pyfuncitem):
+    """✅ With --web-perf, a test whose navigations broke a page budget fails once its own checks pass."""
+    if not web_perf.enabled:
+        return (yield)
+    first = web_perf.begin_test()
+    result = yield
+    captures = web_perf.captures[first:]
+    if captures:
+        allure.attach(web_perf.as_json(captures), name="Web performance", attachment_type=allure.attachment_type.JSON)
+        for metrics in captures:
+            pyfuncitem.user_properties.append(("web_perf", metrics.describe()))
+    if web_perf.violations:
+        raise PerformanceBudgetExceeded(f"{CATEGORY_NAME}: " + "; ".join(web_perf.violations))
+    return result
+
+
+def pytest_sessionfinish(session):
+    flaky_tests.save()
+    failure_artifacts.close()
+    trace_ring.close()
+    if page_timings.enabled and page_timings.tests:
+        session.config.page_timings_path = page_timings.write_summary()
+    sink = getattr(session.config, "report_sink", None)
+    # Parallel workers only append; utils.parallel builds the report once every worker is done
+    if sink and sink.written and not os.environ.get("RAK_WORKER_ID"):
+        builder = ReportBuilder(sink.root)
+        builder.compact()
+        session.config.report_stream_stats = builder.build()
+    results_dir = getattr(session.config.option, "allure_report_dir", None)
+    if web_perf.enabled and results_dir:
+        web_perf.write_allure_categories(results_dir)
+
+
+def pytest_terminal_summary(terminalreporter, config):
+    if wait_stats.records:
+        terminalreporter.write_sep("-", "waits")
+        terminalreporter.write_line(wait_stats.summary())
+    if getattr(config, "page_timings_path", None):
+        terminalreporter.write_sep("-", "slowest page-object methods")
+        for method in page_timings.slowest(5):
+            terminalreporter.write_line(f"{method.total_ms / 1000:7.2f}s  {method.name} "
+                                        f"({method.calls} calls, {method.self_ms / 1000:.2f}s self, "
+                                        f"max {method.max_ms:.0f} ms, {method.timeouts} timeouts)")
+        terminalreporter.write_line(f"full summary: {config.page_timings_path}")
+    if web_perf.captures:
+        terminalreporter.write_sep("-", "web performance")
+        for metrics in web_perf.captures:
+            terminalreporter.write_line(metrics.describe())
+    flaky = flaky_tests.describe()
+    if flaky:
+        terminalreporter.write_sep("-", "flaky tests")
+        terminalreporter.write_line(flaky)
+    if a11y.audits:
+        terminalreporter.write_sep("-", "accessibility")
+        terminalreporter.write_line(a11y.describe())
+    if viewport_matrix.rows:
+        terminalreporter.write_sep("-", "viewport matrix")
+        terminalreporter.write_line(viewport_matrix.describe())
+    visual = sys.modules.get("utils.visual")  # imported by the first check_visual, if any ran
+    if visual and visual.visual_baselines.results:
+        terminalreporter.write_sep("-", "visual checks")
+        terminalreporter.write_line(visual.visual_baselines.describe())
+    if trace_ring.kept:
+        terminalreporter.write_sep("-", "traces")
+        terminalreporter.write_line(f"{trace_ring.kept} failing test(s) have Playwright traces attached "
+                                    f"(up to {trace_ring.size} chunks each)")
+    if failure_artifacts.captured:
+        terminalreporter.write_sep("-", "failure artifacts")
+        terminalreporter.write_line(failure_artifacts.describe())
+    stats = getattr(config, "report_stream_stats", None)
+    if stats:
+        terminalreporter.write_sep("-", "report")
+        terminalreporter.write_line(f"{os.path.join(config.report_sink.root, 'report.html')} "
+                                    f"({stats['tests']} tests, {stats['fragments_rewritten']} changed)")
+    unmatched = archive_registry.unmatched_report()
+    if unmatched:
+        terminalreporter.write_sep("-", "replay: unmatched requests")
+        for line in unmatched:
+            terminalreporter.write_line(line)
+
+
+@pytest.hookimpl(hookwrapper=True)
 def pytest_runtest_makereport(item):
     outcome = yield
     rep = outcome.get_result()
-    if rep.when == "call" and rep.failed:
+    if trace_ring.open == item.nodeid and (rep.when == "call" or rep.failed):
+        # Attached here rather than in fixture teardown, so the traces land on the test itself
+        keep = rep.failed or rep.outcome == "rerun"
+        chunks = trace_ring.end(item.nodeid, keep)
+        if chunks:
+            trace_ring.attach_to_allure(chunks)
+    if rep.when in ("setup", "call") and rep.failed:
         page = item.funcargs.get("page", None)
         if page:
-            screenshot = page.screenshot()
-            allure.attach(screenshot, name="Failure Screenshot", attachment_type=allure.attachment_type.PNG)
-'''
\ No newline at end of file
+            listener = item.config.pluginmanager.getplugin("allure_listener")
+            failure_artifacts.capture(page, allure_logger=listener.allure_logger if listener else None,
+                                      sink=getattr(item.config, "report_sink", None))
@@ -2,18 +2,24 @@
 
 from pages.base_page import BasePage
 from playwright.sync_api import expect
+from utils.locators import Selector
 
 class DashboardPage(BasePage):
     LOGO_SELECTOR = "img[alt='logo']"
-    SIDEBAR_SELECTOR = "ul.ant-menu li.ant-menu-item a >> text={}"
+    SIDEBAR_SELECTOR = Selector("ul.ant-menu li.ant-menu-item a >> text={}")
     WELCOME_SELECTOR = "text=Hi! Martin Clarke"
-    CARD_TITLES_SELECTOR = "div.card-header >> text={}"
-    VIEW_DETAILS_BUTTON_SELECTOR = "div.card-header:has-text('{}') >> text=View Details"
-    SHOW_TRENDS_BUTTON_SELECTOR = "div.card:has-text('{}') >> text=Show Trends"
-    CURRENCY_CARD_SELECTOR = "div.card:has-text('{}')"
-    DATA_LABEL_SELECTOR = "div.card:has-text('{}') >> text={}"
+    CARD_TITLES_SELECTOR = Selector("div.card-header >> text={}")
+    VIEW_DETAILS_BUTTON_SELECTOR = Selector("div.card-header:has-text('{}') >> text=View Details")
+    SHOW_TRENDS_BUTTON_SELECTOR = Selector("div.card:has-text('{}') >> text=Show Trends")
+    CURRENCY_CARD_SELECTOR = Selector("div.card:has-text('{}')")
+    DATA_LABEL_SELECTOR = Selector("div.card:has-text('{}') >> text={}")
     LOGOUT_BUTTON_SELECTOR = "button:has-text('Logout')"
     LOGIN_PAGE_INDICATOR = "#login_email"
+    URL_PATH = "dashboard"
+    PERFORMANCE_BUDGET = {"ttfb_ms": 800, "fcp_ms": 1800, "lcp_ms": 2500, "transfer_bytes": 3_000_000}
+    VISUAL_REGIONS = {"cards": "div.cards", "pipeline_snapshot": "div.card:has-text('Pipeline Snapshot')"}
+    CARD_VALUES = "div.card-body .label + *"
+    VISUAL_MASKS = {"cards": (CARD_VALUES,), "pipeline_snapshot": (CARD_VALUES,)}
 
     def login(self, username: str, password: str):
         self.page.fill("#login_email", username)
@@ -25,21 +31,19 @@ class DashboardPage(BasePage):
         return self.page.is_visible(self.LOGO_SELECTOR)
 
     def verify_sidebar_items(self, expected_items: list) -> bool:
-        sidebar_text = self.page.locator("nav").all_text_contents()
+        sidebar_text = self.page_snapshot().texts("nav")
         return all(any(item in line for line in sidebar_text) for item in expected_items)
 
     def is_welcome_message_present(self) -> bool:
         return self.page.is_visible(self.WELCOME_SELECTOR)
 
     def verify_dashboard_cards(self, cards: list) -> bool:
-        for card in cards:
-            if not self.page.is_visible(f"text={card}"):
-                return False
-        return True
+        snapshot = self.page_snapshot()
+        return all(snapshot.is_visible(f"text={card}") for card in cards)
 
     def click_view_details(self, card_title: str) -> bool:
         try:
-            self.page.click(self.VIEW_DETAILS_BUTTON_SELECTOR.format(card_title))
+            self.page.click(self.VIEW_DETAILS_BUTTON_SELECTOR(card_title))
             self.page.wait_for_load_state("networkidle")
             return True
         except:
@@ -47,39 +51,56 @@ class DashboardPage(BasePage):
 
     def navigate_to_sidebar_item(self, item: str) -> bool:
         try:
-            self.page.click(self.SIDEBAR_SELECTOR.format(item))
-            self.page.wait_for_load_state("networkidle")
+            def go():
+                self.page.click(self.SIDEBAR_SELECTOR(item))
+                self.page.wait_for_load_state("networkidle")
+            self.measure_navigation(go, label=f"sidebar: {item}")
             return True
         except:
             return False
 
     def get_pipeline_totals(self):
         try:
-            funded = int(self.page.locator("text=Pipeline").locator("xpath=..").locator("text=Funded").nth(0).evaluate("e => e.nextSibling.textContent"))
-            non_funded = int(self.page.locator("text=Pipeline").locator("xpath=..").locator("text=Non-Funded").nth(0).evaluate("e => e.nextSibling.textContent"))
-            total = int(self.page.locator("text=Pipeline").locator("xpath=..").locator("text=Total").nth(0).evaluate("e => e.nextSibling.textContent"))
-            return funded, non_funded, total
+            pipeline = self.pipeline_snapshot_figures()["pipeline"]
+            return tuple(int(pipeline[field].replace(",", "")) for field in ("funded", "non_funded", "total"))
         except:
             return 0, 0, 0
 
+    def pipeline_snapshot_figures(self) -> dict:
+        """Pending and Pipeline groups of the Pipeline Snapshot card, as shown, from one page snapshot."""
+        card = self.page_snapshot().first(self.CURRENCY_CARD_SELECTOR("Pipeline Snapshot"))
+        figures = {}
+        for group in ("Pending", "Pipeline"):
+            title = card.first(f'text="{group}"') if card else None
+            if title is None or title.parent is None:
+                continue
+            figures[group.lower()] = values = {}
+            for key, label in (("funded", "Funded"), ("non_funded", "Non-Funded"), ("total", "Total")):
+                node = title.parent.first(f'text="{label}"')
+                if node is not None:
+                    values[key] = node.next_text
+        return figures
+
     def validate_currency_format(self, card_title: str) -> bool:
-        amounts = self.page.locator(self.CURRENCY_CARD_SELECTOR.format(card_title)).locator("text=AED").all_inner_texts()
-        return all(amount.strip().startswith("AED") for amount in amounts)
+        card = self.page_snapshot().first(self.CURRENCY_CARD_SELECTOR(card_title))
+        amounts = card.texts("text=AED") if card else []
+        return all(amount.startswith("AED") for amount in amounts)
 
     def validate_card_data(self, card_title: str, expected_data: dict) -> bool:
-        card = self.page.locator(self.CURRENCY_CARD_SELECTOR.format(card_title))
+        card = self.page_snapshot().first(self.CURRENCY_CARD_SELECTOR(card_title))
+        if card is None:
+            return False
         for label, value in expected_data.items():
-            if not card.locator(f"text={label}").is_visible():
-                return False
-            actual_text = card.locator(f"text={label}").evaluate("e => e.nextSibling?.textContent || ''").strip()
-            if str(value) not in actual_text:
+            node = card.first(f"text={label}")
+            if node is None or not node.visible or str(value) not in node.next_text:
                 return False
         return True
 
     def click_show_trends(self, card_title: str) -> bool:
         try:
-            self.page.click(self.SHOW_TRENDS_BUTTON_SELECTOR.format(card_title))
-            self.page.wait_for_timeout(1000)
+            self.settle(lambda: self.page.click(self.SHOW_TRENDS_BUTTON_SELECTOR(card_title)),
+                        mutation=self.CURRENCY_CARD_SELECTOR(card_title),
+                        legacy_ms=1000, label="DashboardPage.click_show_trends")
             return True
         except:
             return False
@@ -1,5 +1,6 @@
 from pages.base_page import BasePage
 from playwright.sync_api import TimeoutError
+from utils.locators import Selector
 
 class TaskBoardPage(BasePage):
     PAGE_TITLE = "text=Task Board"
@@ -14,6 +15,20 @@ class TaskBoardPage(BasePage):
     GOTO_PAST_DUES_BUTTON = "role=button[name='Goto Past Dues']"
     SUCCESS_TOAST = "text=Successfully created task"
     CLOSE_BUTTON = "role=button[name='Close']"
+    TEXT = Selector("text={}")
+    TASK_CARD = Selector(".task-card:has-text('{}')")
+    TASK_CARD_MENU = Selector(".task-card:has-text('{}') button[aria-label='more']")
+    TASK_CARD_DATE = Selector(".task-card:has-text('{}') .date-label")
+    TASK_CARD_ASSIGNEES = Selector(".task-card:has-text('{}') .user-tag")
+    COLUMN_BADGE = Selector("text={} >> xpath=../..//span[contains(@class, 'badge')]")
+    URL_PATH = "scrumboard/kanban"
+    PERFORMANCE_BUDGET = {"ttfb_ms": 800, "lcp_ms": 2500, "duration_ms": 3000}
+    VISUAL_REGIONS = {"board": "div.kanban"}
+    VISUAL_MASKS = {"board": (".task-card", ".badge")}
+
+    @staticmethod
+    def _is_write_response(response) -> bool:
+        return response.request.method in ("POST", "PUT", "PATCH", "DELETE")
 
     def get_title_text(self) -> str:
         return self.page.locator(self.PAGE_TITLE).text_content().strip()
@@ -36,39 +51,39 @@ class TaskBoardPage(BasePage):
 
     def is_task_present(self, title: str) -> bool:
         try:
-            return self.page.locator(f"text={title}").is_visible()
+            return self.locate(self.TEXT, title).is_visible()
         except TimeoutError:
             return False
 
     def move_task_card(self, task_title: str, target_column: str):
-        source = self.page.locator(f".task-card:has-text('{task_title}')")
-        target = self.page.locator(f"text={target_column}").first()
-        source.drag_to(target)
-        self.page.wait_for_timeout(1000)
+        source = self.locate(self.TASK_CARD, task_title)
+        target = self.locate(self.TEXT, target_column).first
+        # The drop persists the new status through the API; its response is the signal
+        self.settle(lambda: source.drag_to(target), response=self._is_write_response,
+                    legacy_ms=1000, label="TaskBoardPage.move_task_card")
 
     def get_column_task_count(self, column_title: str) -> int:
-        badge_locator = self.page.locator(f"text={column_title} >> xpath=../..//span[contains(@class, 'badge')]")
+        badge_locator = self.locate(self.COLUMN_BADGE, column_title)
         badge_text = badge_locator.inner_text().strip()
         return int(badge_text) if badge_text.isdigit() else 0
 
     def get_task_date(self, task_title: str) -> str:
-        return self.page.locator(f".task-card:has-text('{task_title}') .date-label").inner_text().strip()
+        return self.locate(self.TASK_CARD_DATE, task_title).inner_text().strip()
 
     def get_task_assignees(self, task_title: str) -> list:
-        tags = self.page.locator(f".task-card:has-text('{task_title}') .user-tag")
-        return [tags.nth(i).inner_text().strip() for i in range(tags.count())]
+        return self.page_snapshot().texts(self.TASK_CARD_ASSIGNEES(task_title))
 
     def edit_task_card(self, old_title: str, new_title: str):
-        self.page.locator(f".task-card:has-text('{old_title}') button[aria-label='more']").click()
+        self.locate(self.TASK_CARD_MENU, old_title).click()
         self.page.click("text=Edit")
         self.page.fill(self.CARD_TITLE_INPUT, new_title)
         self.page.click(self.SAVE_BUTTON)
-        self.page.wait_for_selector(f"text={new_title}")
+        self.page.wait_for_selector(self.TEXT(new_title))
 
     def delete_task_card(self, title: str):
-        self.page.locator(f".task-card:has-text('{title}') button[aria-label='more']").click()
-        self.page.click("text=Delete")
-        self.page.wait_for_timeout(500)
+        self.locate(self.TASK_CARD_MENU, title).click()
+        self.settle(lambda: self.page.click("text=Delete"), response=self._is_write_response,
+                    legacy_ms=500, label="TaskBoardPage.delete_task_card")
 
     def view_task_card(self, task_name: str):
         self.page.get_by_role("button", name=task_name).click()
@@ -0,0 +1,10 @@
+"""Async page objects on ``playwright.async_api``, mirroring the sync ones in ``pages/``."""
+from pages.aio.base_page import AsyncBasePage
+from pages.aio.dashboard_page import AsyncDashboardPage
+from pages.aio.login_page import AsyncLoginPage
+from pages.aio.pipeline_page import AsyncPipelinePage
+from pages.aio.portfolio_page import AsyncPortfolioPage
+from pages.aio.taskboard_page import AsyncTaskBoardPage
+
+__all__ = ["AsyncBasePage", "AsyncDashboardPage", "AsyncLoginPage", "AsyncPipelinePage",
+           "AsyncPortfolioPage", "AsyncTaskBoardPage"]
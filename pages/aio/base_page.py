@@ -0,0 +1,65 @@
+from playwright.async_api import Page
+
+from pages.base_page import BasePage
+from utils.a11y import AuditResult, a11y
+from utils.page_snapshot import PageSnapshot
+from utils.table_snapshot import TableSnapshot
+from utils.viewports import LAYOUT_SCRIPT
+from utils.waits import run_settle_async, settle_steps
+
+
+class AsyncBasePage:
+    """``playwright.async_api`` twin of ``BasePage``.
+
+    Each async page object names the sync page object it mirrors in ``SYNC_PAGE``; every
+    UPPER_CASE attribute of that class (selectors, ``URL_PATH``, budgets) is copied over, so a
+    selector fixed in ``pages/`` is fixed here too. Pure logic lives in static methods on the
+    sync classes and is called from both.
+    """
+    SYNC_PAGE = BasePage
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        shared = {}
+        for klass in reversed(cls.SYNC_PAGE.__mro__):
+            shared.update((name, value) for name, value in vars(klass).items() if name.isupper())
+        for name, value in shared.items():
+            if name not in cls.__dict__:
+                setattr(cls, name, value)
+
+    def __init__(self, page: Page):
+        self.page = page
+
+    async def visit(self, url: str):
+        await self.page.goto(url)
+
+    async def click(self, selector: str):
+        await self.page.click(selector)
+
+    async def fill(self, selector: str, value: str):
+        await self.page.fill(selector, value)
+
+    async def get_text(self, selector: str) -> str:
+        return await self.page.text_content(selector)
+
+    async def is_visible(self, selector: str) -> bool:
+        return await self.page.is_visible(selector)
+
+    async def table_snapshot(self, selector: str = "table") -> TableSnapshot:
+        return await TableSnapshot.capture_async(self.page, selector)
+
+    async def page_snapshot(self, root: str = "body") -> PageSnapshot:
+        return await PageSnapshot.capture_async(self.page, root)
+
+    async def accessibility_audit(self, root: str = "body") -> AuditResult:
+        return await a11y.audit_async(self.page, root)
+
+    async def layout_checks(self) -> dict:
+        return await self.page.evaluate(LAYOUT_SCRIPT, self.LAYOUT_CHECKS)
+
+    async def settle(self, action, *, legacy_ms: int, response=None, mutation: str = None,
+                     navigation: bool = False, spinner: bool = True, timeout: int = None, label: str = None) -> float:
+        """Async ``BasePage.settle``: ``action`` is a coroutine function, the signals are the same."""
+        return await run_settle_async(settle_steps(self.page, action, legacy_ms=legacy_ms, response=response,
+                                                   mutation=mutation, navigation=navigation, spinner=spinner,
+                                                   timeout=timeout, label=label))
@@ -0,0 +1,32 @@
+from pages.DashboardPage import DashboardPage
+from pages.aio.base_page import AsyncBasePage
+
+
+class AsyncDashboardPage(AsyncBasePage):
+    SYNC_PAGE = DashboardPage
+
+    async def is_logo_visible(self) -> bool:
+        return await self.page.is_visible(self.LOGO_SELECTOR)
+
+    async def is_welcome_message_present(self) -> bool:
+        return await self.page.is_visible(self.WELCOME_SELECTOR)
+
+    async def verify_dashboard_cards(self, cards: list) -> bool:
+        snapshot = await self.page_snapshot()
+        return all(snapshot.is_visible(f"text={card}") for card in cards)
+
+    async def navigate_to_sidebar_item(self, item: str) -> bool:
+        try:
+            await self.page.click(self.SIDEBAR_SELECTOR(item))
+            await self.page.wait_for_load_state("networkidle")
+            return True
+        except Exception:
+            return False
+
+    async def logout(self):
+        if await self.page.is_visible(self.LOGOUT_BUTTON_SELECTOR):
+            await self.page.click(self.LOGOUT_BUTTON_SELECTOR)
+            await self.page.wait_for_selector(self.LOGIN_PAGE_INDICATOR)
+
+    async def is_redirected_to_login(self) -> bool:
+        return self.page.url.endswith("/login")
@@ -0,0 +1,19 @@
+from pages.aio.base_page import AsyncBasePage
+from pages.login_page import LoginPage
+
+
+class AsyncLoginPage(AsyncBasePage):
+    SYNC_PAGE = LoginPage
+
+    async def login(self, username: str, password: str):
+        await self.page.wait_for_selector(self.USERNAME_INPUT)
+        await self.page.locator(self.USERNAME_INPUT).fill(username)
+        await self.page.locator(self.PASSWORD_INPUT).fill(password)
+        await self.page.locator(self.LOGIN_BUTTON).click()
+
+    async def is_login_successful(self) -> bool:
+        try:
+            await self.page.wait_for_selector(self.WELCOME_MESSAGE, timeout=5000)
+            return True
+        except Exception:
+            return False
@@ -0,0 +1,48 @@
+from pages.aio.base_page import AsyncBasePage
+from pages.pipeline_page import PipelinePage
+
+
+class AsyncPipelinePage(AsyncBasePage):
+    SYNC_PAGE = PipelinePage
+
+    async def get_title_text(self) -> str:
+        return (await self.page.locator(self.PAGE_TITLE).text_content()).strip()
+
+    async def search_rm(self, name: str):
+        await self.page.fill(self.SEARCH_INPUT, name)
+        await self.settle(lambda: self.page.keyboard.press("Enter"), mutation=self.TABLE_BODY,
+                          legacy_ms=1500, label="AsyncPipelinePage.search_rm")
+
+    async def is_rm_displayed(self, rm_name: str) -> bool:
+        selector = self.RM_ROW(rm_name)
+        try:
+            await self.page.wait_for_selector(selector, timeout=3000)
+            return await self.page.is_visible(selector)
+        except Exception:
+            return False
+
+    async def no_rm_results_displayed(self) -> bool:
+        try:
+            return await self.page.is_visible("table td:has-text('No data')")
+        except Exception:
+            return True
+
+    async def get_dropdown_value(self) -> str:
+        return (await self.page.locator(self.LEVEL_DROPDOWN).text_content()).strip()
+
+    async def sort_by_rm_name(self):
+        await self.settle(lambda: self.page.click("th:has-text('RM Name')"), mutation=self.TABLE_BODY,
+                          legacy_ms=1000, label="AsyncPipelinePage.sort_by_rm_name")
+
+    async def is_rm_list_sorted(self) -> bool:
+        return PipelinePage.names_sorted(await self.page.locator(self.RM_NAME_CELLS).all_inner_texts())
+
+    async def get_total_values(self) -> dict:
+        return PipelinePage.parse_total_row((await self.table_snapshot()).total_row())
+
+    async def verify_all_row_totals(self) -> bool:
+        return PipelinePage.totals_balance(await self.get_total_values())
+
+    async def click_back(self):
+        await self.settle(lambda: self.page.click(self.BACK_BUTTON), navigation=True,
+                          legacy_ms=1000, label="AsyncPipelinePage.click_back")
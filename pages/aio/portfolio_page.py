@@ -0,0 +1,50 @@
+from pages.aio.base_page import AsyncBasePage
+from pages.portfolio_page import PortfolioPage
+
+
+class AsyncPortfolioPage(AsyncBasePage):
+    SYNC_PAGE = PortfolioPage
+
+    async def get_title_text(self) -> str:
+        return (await self.page.locator(self.PAGE_TITLE).text_content()).strip()
+
+    async def get_table_headers(self) -> list:
+        return (await self.table_snapshot()).headers
+
+    async def search_facility(self, text: str):
+        await self.page.fill(self.SEARCH_INPUT, text)
+        await self.settle(lambda: self.page.keyboard.press("Enter"), mutation=self.TABLE_BODY,
+                          legacy_ms=1000, label="AsyncPortfolioPage.search_facility")
+
+    async def is_no_data_displayed(self) -> bool:
+        try:
+            return await self.page.is_visible("table tr:has(td:has-text('No data'))")
+        except Exception:
+            return await self.page.locator(self.TABLE_ROWS).count() == 0
+
+    async def is_facility_displayed(self, name: str) -> bool:
+        return await self.page.is_visible(self.FACILITY_ROW(name))
+
+    async def get_dropdown_value(self) -> str:
+        return (await self.page.locator(self.DROPDOWN_TRIGGER).text_content()).strip()
+
+    async def select_dropdown_option(self, option_text: str):
+        await self.page.locator(self.DROPDOWN_TRIGGER).click()
+        await self.settle(lambda: self.page.locator(self.DROPDOWN_OPTION(option_text)).click(),
+                          mutation=self.TABLE_BODY, legacy_ms=500, label="AsyncPortfolioPage.select_dropdown_option")
+
+    async def verify_row_totals(self) -> bool:
+        return PortfolioPage.row_totals_match(await self.table_snapshot())
+
+    async def verify_column_totals(self) -> bool:
+        return PortfolioPage.column_totals_match(await self.table_snapshot())
+
+    async def validate_number_formatting(self) -> bool:
+        return PortfolioPage.amounts_formatted((await self.table_snapshot()).rows)
+
+    async def is_number_formatting_correct(self) -> bool:
+        return PortfolioPage.cells_formatted((await self.table_snapshot()).rows)
+
+    async def click_back(self):
+        await self.settle(lambda: self.page.click(self.BACK_BUTTON), navigation=True,
+                          legacy_ms=1000, label="AsyncPortfolioPage.click_back")
@@ -0,0 +1,35 @@
+from playwright.async_api import TimeoutError
+
+from pages.TaskBoard_page import TaskBoardPage
+from pages.aio.base_page import AsyncBasePage
+
+
+class AsyncTaskBoardPage(AsyncBasePage):
+    SYNC_PAGE = TaskBoardPage
+
+    async def get_title_text(self) -> str:
+        return (await self.page.locator(self.PAGE_TITLE).text_content()).strip()
+
+    async def add_task_to_column(self, column_index: int, task_title: str):
+        await self.page.get_by_role("button", name="plus", exact=True).nth(column_index).click()
+        await self.page.wait_for_selector(self.CARD_TITLE_INPUT)
+        await self.page.fill(self.CARD_TITLE_INPUT, task_title)
+        await self.page.click(self.SAVE_BUTTON)
+        await self.page.wait_for_selector(self.SUCCESS_TOAST)
+
+    async def is_task_present(self, title: str) -> bool:
+        try:
+            return await self.page.locator(self.TEXT(title)).is_visible()
+        except TimeoutError:
+            return False
+
+    async def move_task_card(self, task_title: str, target_column: str):
+        source = self.page.locator(self.TASK_CARD(task_title))
+        target = self.page.locator(self.TEXT(target_column)).first
+        await self.settle(lambda: source.drag_to(target), response=TaskBoardPage._is_write_response,
+                          legacy_ms=1000, label="AsyncTaskBoardPage.move_task_card")
+
+    async def delete_task_card(self, title: str):
+        await self.page.locator(self.TASK_CARD_MENU(title)).click()
+        await self.settle(lambda: self.page.click("text=Delete"), response=TaskBoardPage._is_write_response,
+                          legacy_ms=500, label="AsyncTaskBoardPage.delete_task_card")
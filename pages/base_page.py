@@ -1,11 +1,45 @@
+from urllib.parse import urlsplit
+
 from playwright.sync_api import Page
 
+from utils.a11y import AuditResult, a11y
+from utils.config import Config
+from utils.locators import locator_cache
+from utils.page_snapshot import PageSnapshot
+from utils.page_timings import page_timings, untimed
+from utils.table_snapshot import TableSnapshot
+from utils.viewports import LAYOUT_SCRIPT
+from utils.web_perf import web_perf
+from utils.waits import run_settle, settle_steps
+
 class BasePage:
+    URL_PATH = None             # path this page object lives at, used to pick the budget after navigation
+    PERFORMANCE_BUDGET = {}     # PerfMetrics field -> limit, checked when running with --web-perf
+    VISUAL_REGIONS = {}         # region name -> selector, screenshotted by check_visual
+    VISUAL_MASKS = {}           # region name -> selectors of live figures, painted over before comparing
+    LAYOUT_CHECKS = {}          # check name -> css selector that must be shown at every viewport size
+
     def __init__(self, page: Page):
-        self.page = page
+        self.page = page_timings.watch(page)    # the page itself unless running with --page-timings
 
     def visit(self, url: str):
-        self.page.goto(url)
+        self.measure_navigation(lambda: self.page.goto(url), label=f"{type(self).__name__}.visit")
+
+    def measure_navigation(self, action, label: str = None):
+        """Runs a navigation; with --web-perf, captures its web-perf metrics and checks the landing page's budget."""
+        if not web_perf.enabled:
+            return action()
+        return web_perf.measure(self.page, action, label or type(self).__name__, self._budget_for)
+
+    def _budget_for(self, url: str) -> tuple:
+        path = urlsplit(url).path.strip("/")
+        pending = [BasePage]
+        while pending:
+            cls = pending.pop()
+            if cls.URL_PATH is not None and path == cls.URL_PATH.strip("/"):
+                return cls.__name__, cls.PERFORMANCE_BUDGET
+            pending.extend(cls.__subclasses__())
+        return type(self).__name__, type(self).PERFORMANCE_BUDGET
 
     def click(self, selector: str):
         self.page.click(selector)
@@ -18,3 +52,54 @@ class BasePage:
 
     def is_visible(self, selector: str) -> bool:
         return self.page.is_visible(selector)
+
+    @untimed
+    def locate(self, selector: str, *args):
+        """``page.locator`` for a (parameterised) selector, memoised per page."""
+        return locator_cache.get(self.page, selector, args)
+
+    def table_snapshot(self, selector: str = "table") -> TableSnapshot:
+        """Captures the whole table (headers, rows, total row) in a single round trip."""
+        return TableSnapshot.capture(self.page, selector)
+
+    def page_snapshot(self, root: str = "body") -> PageSnapshot:
+        """Captures rendered text, roles, attributes and boxes under ``root`` in a single round trip."""
+        return PageSnapshot.capture(self.page, root)
+
+    def accessibility_audit(self, root: str = "body") -> AuditResult:
+        """Labels, roles, contrast, heading order and tab order under ``root``, in one round trip (cached per DOM)."""
+        return a11y.audit(self.page, root)
+
+    def layout_checks(self) -> dict:
+        """``LAYOUT_CHECKS`` plus "fits width" at the page's current size, in one round trip."""
+        return self.page.evaluate(LAYOUT_SCRIPT, self.LAYOUT_CHECKS)
+
+    def check_visual(self, name: str, mask=()):
+        """Screenshots the named region (``VISUAL_REGIONS``) and compares it with its baseline."""
+        from utils.visual import visual_baselines  # numpy and Pillow are only needed for visual checks
+        region = self.locate(self.VISUAL_REGIONS[name]).first
+        selectors = (*self.VISUAL_MASKS.get(name, ()), *mask)
+        png = region.screenshot(animations="disabled", caret="hide", scale="css",
+                                mask=[self.locate(selector) for selector in selectors])
+        return visual_baselines.check(self.visual_key(name), png)
+
+    def visual_key(self, name: str) -> str:
+        """Baselines are per target host, so the live app and the stand-in server never share them."""
+        return f"{urlsplit(Config.BASE_URL or '').netloc}/{type(self).__name__}.{name}"
+
+    def settle(self, action, *, legacy_ms: int, response=None, mutation: str = None,
+               navigation: bool = False, spinner: bool = True, timeout: int = None, label: str = None) -> float:
+        """Runs ``action`` and returns as soon as the page reacts, instead of sleeping ``legacy_ms``.
+
+        Signals (any combination):
+          response   -- URL substring, regex or predicate for a network response triggered by the action
+          mutation   -- selector of an element whose subtree must change (e.g. a table body)
+          navigation -- wait for the URL to change
+          spinner    -- afterwards, wait for any Ant Design spinner to disappear
+        ``timeout`` defaults to ``legacy_ms``: if no signal fires the wait is never longer than the
+        old fixed sleep and, like the sleep, it does not raise. An error in ``action`` itself (a
+        click that times out included) is raised as before. Returns the elapsed milliseconds.
+        """
+        return run_settle(settle_steps(self.page, action, legacy_ms=legacy_ms, response=response,
+                                       mutation=mutation, navigation=navigation, spinner=spinner,
+                                       timeout=timeout, label=label))
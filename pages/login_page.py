@@ -4,6 +4,7 @@ class LoginPage(BasePage):
     USERNAME_INPUT = '#login_email'
     PASSWORD_INPUT = '#login_password'
     LOGIN_BUTTON = 'button[type="submit"]'
+    WELCOME_MESSAGE = "text=Hi! Martin Clarke"
 
     def login(self, username: str, password: str):
         self.page.wait_for_selector(self.USERNAME_INPUT)
@@ -14,7 +15,7 @@ class LoginPage(BasePage):
     def is_login_successful(self) -> bool:
         try:
             # Adjust this selector to something visible on dashboard after login
-            self.page.wait_for_selector("text=Hi! Martin Clarke", timeout=5000)
+            self.page.wait_for_selector(self.WELCOME_MESSAGE, timeout=5000)
             return True
         except Exception:
             return False
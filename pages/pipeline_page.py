@@ -1,5 +1,7 @@
 from pages.base_page import BasePage
 from playwright.sync_api import expect
+from utils.a11y import KEYBOARD_RULES, LABEL_RULES
+from utils.locators import Selector
 
 class PipelinePage(BasePage):
     PIPELINE_TAB = "text=Pipeline"
@@ -9,16 +11,14 @@ class PipelinePage(BasePage):
     LEVEL_DROPDOWN = "div.ant-select-selector"
     SIDEBAR_ITEMS = "ul.ant-menu li.ant-menu-item"
     BACK_BUTTON = "text=Back"
-
-    COLUMN_FUNDED_PENDING = "//table//tr[td[contains(text(), 'Total')]]/td[2]"
-    COLUMN_NON_FUNDED_PENDING = "//table//tr[td[contains(text(), 'Total')]]/td[3]"
-    COLUMN_TOTAL_PENDING = "//table//tr[td[contains(text(), 'Total')]]/td[4]"
-    COLUMN_FUNDED_PIPELINE = "//table//tr[td[contains(text(), 'Total')]]/td[5]"
-    COLUMN_NON_FUNDED_PIPELINE = "//table//tr[td[contains(text(), 'Total')]]/td[6]"
-    COLUMN_TOTAL_PIPELINE = "//table//tr[td[contains(text(), 'Total')]]/td[7]"
-
-    def visit(self, url):
-        self.page.goto(url)
+    TABLE_BODY = "table tbody"
+    RM_ROW = Selector("table tr:has(td:has-text('{}'))")
+    RM_NAME_CELLS = "tbody tr td:nth-child(1)"
+    URL_PATH = "pipeline"
+    PERFORMANCE_BUDGET = {"ttfb_ms": 800, "lcp_ms": 2500, "load_ms": 4000}
+    VISUAL_REGIONS = {"table": "table"}
+    VISUAL_MASKS = {"table": ("table tbody td", "table tfoot td")}
+    LAYOUT_CHECKS = {"navigation": "nav"}
 
     def is_logo_visible(self) -> bool:
         return self.page.is_visible(self.LOGO)
@@ -28,15 +28,15 @@ class PipelinePage(BasePage):
 
     def get_sidebar_items(self) -> list:
         self.page.wait_for_selector(self.SIDEBAR_ITEMS)
-        return [el.text_content().strip() for el in self.page.locator(self.SIDEBAR_ITEMS).all()]
+        return self.page_snapshot().texts(self.SIDEBAR_ITEMS)
 
     def search_rm(self, name: str):
         self.page.fill(self.SEARCH_INPUT, name)
-        self.page.keyboard.press("Enter")
-        self.page.wait_for_timeout(1500)
+        self.settle(lambda: self.page.keyboard.press("Enter"), mutation=self.TABLE_BODY,
+                    legacy_ms=1500, label="PipelinePage.search_rm")
 
     def is_rm_displayed(self, rm_name: str) -> bool:
-        selector = f"table tr:has(td:has-text('{rm_name}'))"
+        selector = self.RM_ROW(rm_name)
         try:
             self.page.wait_for_selector(selector, timeout=3000)
             return self.page.is_visible(selector)
@@ -55,35 +55,51 @@ class PipelinePage(BasePage):
 
     def sort_by_rm_name(self):
         header_selector = "th:has-text('RM Name')"
-        self.page.click(header_selector)
-        self.page.wait_for_timeout(1000)
+        self.settle(lambda: self.page.click(header_selector), mutation=self.TABLE_BODY,
+                    legacy_ms=1000, label="PipelinePage.sort_by_rm_name")
 
     def is_rm_list_sorted(self) -> bool:
-        names = self.page.locator("tbody tr td:nth-child(1)").all_inner_texts()
+        return self.names_sorted(self.page.locator(self.RM_NAME_CELLS).all_inner_texts())
+
+    @staticmethod
+    def names_sorted(names: list) -> bool:
         cleaned = [name.strip() for name in names if name.strip()]
         return cleaned == sorted(cleaned)
 
     def get_total_values(self):
+        # One snapshot of the table instead of six separate cell reads (td[2]..td[7] of the Total row)
+        return self.parse_total_row(self.table_snapshot().total_row())
+
+    def total_figures(self) -> dict:
+        """The Total row's cells as shown (for utils.reconciliation), grouped like get_total_values."""
+        row = self.table_snapshot().total_row()
+        if len(row) < 7:
+            raise ValueError("Pipeline table has no complete 'Total' row.")
         return {
-            "pending": {
-                "funded": int(self.page.locator(self.COLUMN_FUNDED_PENDING).text_content().replace(",", "")),
-                "non_funded": int(self.page.locator(self.COLUMN_NON_FUNDED_PENDING).text_content().replace(",", "")),
-                "total": int(self.page.locator(self.COLUMN_TOTAL_PENDING).text_content().replace(",", ""))
-            },
-            "pipeline": {
-                "funded": int(self.page.locator(self.COLUMN_FUNDED_PIPELINE).text_content().replace(",", "")),
-                "non_funded": int(self.page.locator(self.COLUMN_NON_FUNDED_PIPELINE).text_content().replace(",", "")),
-                "total": int(self.page.locator(self.COLUMN_TOTAL_PIPELINE).text_content().replace(",", ""))
-            }
+            "pending": {"funded": row[1], "non_funded": row[2], "total": row[3]},
+            "pipeline": {"funded": row[4], "non_funded": row[5], "total": row[6]}
         }
 
-    def verify_all_row_totals(self) -> bool:
-        totals = self.get_total_values()
+    @staticmethod
+    def parse_total_row(total_row: list) -> dict:
+        if len(total_row) < 7:
+            raise ValueError("Pipeline table has no complete 'Total' row.")
+        values = [int(cell.replace(",", "")) for cell in total_row[1:7]]
+        return {
+            "pending": {"funded": values[0], "non_funded": values[1], "total": values[2]},
+            "pipeline": {"funded": values[3], "non_funded": values[4], "total": values[5]}
+        }
+
+    @staticmethod
+    def totals_balance(totals: dict) -> bool:
         return (
             totals["pending"]["funded"] + totals["pending"]["non_funded"] == totals["pending"]["total"] and
             totals["pipeline"]["funded"] + totals["pipeline"]["non_funded"] == totals["pipeline"]["total"]
         )
 
+    def verify_all_row_totals(self) -> bool:
+        return self.totals_balance(self.get_total_values())
+
     def verify_column_totals(self) -> bool:
         # For now, reusing row totals as the only "Total" row. Extend as needed.
         return self.verify_all_row_totals()
@@ -93,40 +109,28 @@ class PipelinePage(BasePage):
         return all(a.replace(",", "").replace(".", "").isdigit() for a in amounts if a.strip())
 
     def click_back(self):
-        self.page.click(self.BACK_BUTTON)
-        self.page.wait_for_timeout(1000)
+        self.settle(lambda: self.page.click(self.BACK_BUTTON), navigation=True,
+                    legacy_ms=1000, label="PipelinePage.click_back")
 
     def is_navigated_back(self) -> bool:
         return "dashboard" in self.page.url or "home" in self.page.url
 
     def logout(self):
-        self.page.click("button:has-text('Logout')")
-        self.page.wait_for_timeout(1000)
+        self.settle(lambda: self.page.click("button:has-text('Logout')"), navigation=True,
+                    legacy_ms=1000, label="PipelinePage.logout")
 
     def is_redirected_to_login(self) -> bool:
         return "login" in self.page.url.lower()
 
-    def set_viewport(self, mode: str):
-        sizes = {
-            "mobile": {"width": 375, "height": 812},
-            "tablet": {"width": 768, "height": 1024},
-            "desktop": {"width": 1440, "height": 900}
-        }
-        self.page.context.set_viewport_size(sizes.get(mode, sizes["desktop"]))
-
     def is_layout_responsive(self) -> bool:
-        return self.page.is_visible("nav")  # update with mobile-specific check if needed
+        return all(self.layout_checks().values())
 
     def test_keyboard_navigation(self) -> bool:
-        try:
-            self.page.keyboard.press("Tab")
-            focused = self.page.evaluate("document.activeElement !== null")
-            return focused
-        except:
-            return False
+        audit = self.accessibility_audit()
+        return bool(audit.tab_order) and audit.passed(*KEYBOARD_RULES)
 
     def verify_aria_labels(self) -> bool:
-        return self.page.locator("[aria-label]").count() > 0
+        return self.accessibility_audit().passed(*LABEL_RULES)
 
     def no_sql_injection_result(self) -> bool:
         return self.no_rm_results_displayed()
@@ -135,8 +139,8 @@ class PipelinePage(BasePage):
         try:
             self.page.click(self.LEVEL_DROPDOWN)
             self.page.keyboard.type("Invalid Option")
-            self.page.keyboard.press("Enter")
-            self.page.wait_for_timeout(500)
+            self.settle(lambda: self.page.keyboard.press("Enter"), mutation=self.LEVEL_DROPDOWN,
+                        legacy_ms=500, label="PipelinePage.handle_invalid_dropdown_input")
             return True  # If no crash or error
         except:
             return False
@@ -1,6 +1,9 @@
-from typing import re
+import re
 
 from pages.base_page import BasePage
+from utils.a11y import KEYBOARD_RULES, LABEL_RULES
+from utils.locators import Selector
+from utils.table_snapshot import decimal_sum
 
 class PortfolioPage(BasePage):
     PAGE_TITLE = "text=Portfolio Summary"
@@ -8,10 +11,17 @@ class PortfolioPage(BasePage):
     DROPDOWN_DEFAULT = "text=WBG Level"
     DROPDOWN_TRIGGER = "div[role='combobox']"
     DROPDOWN_OPTIONS = "div[role='option']"
+    DROPDOWN_OPTION = Selector("div[role='option'] >> text={}")
     TABLE_ROWS = "table tbody tr"
+    TABLE_BODY = "table tbody"
     TOTAL_ROW = "table tbody tr:last-child"
     BACK_BUTTON = "text=Back"
-    TABLE_CELL = lambda self, row, col: f"table tbody tr:nth-child({row}) td:nth-child({col})"
+    URL_PATH = "portfolio"
+    PERFORMANCE_BUDGET = {"ttfb_ms": 800, "lcp_ms": 2500, "load_ms": 4000}
+    TABLE_CELL = Selector("table tbody tr:nth-child({}) td:nth-child({})")
+    FACILITY_ROW = Selector("table tr:has(td:has-text('{}'))")
+    LAYOUT_CHECKS = {"table": "table"}
+    FIGURE_GROUPS = ("g1", "g2", "g3")   # the Funded / Non Funded / Total column groups, in table order
 
     def is_title_displayed(self) -> bool:
         return self.page.is_visible(self.PAGE_TITLE)
@@ -21,13 +31,12 @@ class PortfolioPage(BasePage):
         return self.page.locator(self.PAGE_TITLE).text_content().strip()
 
     def get_table_headers(self) -> list:
-        headers = self.page.locator("table thead tr th")
-        return [headers.nth(i).text_content().strip() for i in range(headers.count())]
+        return self.table_snapshot().headers
 
     def search_facility(self, text: str):
         self.page.fill(self.SEARCH_INPUT, text)
-        self.page.keyboard.press("Enter")
-        self.page.wait_for_timeout(1000)
+        self.settle(lambda: self.page.keyboard.press("Enter"), mutation=self.TABLE_BODY,
+                    legacy_ms=1000, label="PortfolioPage.search_facility")
 
     def is_no_data_displayed(self) -> bool:
         """Checks if 'No data' message or empty table is shown when no search results found."""
@@ -41,8 +50,7 @@ class PortfolioPage(BasePage):
             return rows.count() == 0
 
     def is_facility_displayed(self, name: str) -> bool:
-        selector = f"table tr:has(td:has-text('{name}'))"
-        return self.page.is_visible(selector)
+        return self.page.is_visible(self.FACILITY_ROW(name))
 
     def no_facility_result_displayed(self) -> bool:
         return self.page.locator("table tr:has(td:has-text('No data'))").is_visible()
@@ -52,11 +60,11 @@ class PortfolioPage(BasePage):
 
     def select_dropdown_option(self, option_text: str):
         self.page.locator(self.DROPDOWN_TRIGGER).click()
-        self.page.locator(f"{self.DROPDOWN_OPTIONS} >> text={option_text}").click()
-        self.page.wait_for_timeout(500)
+        self.settle(lambda: self.locate(self.DROPDOWN_OPTION, option_text).click(),
+                    mutation=self.TABLE_BODY, legacy_ms=500, label="PortfolioPage.select_dropdown_option")
 
     def get_cell_value(self, row: int, col: int) -> int:
-        text = self.page.locator(self.TABLE_CELL(row, col)).text_content().replace(",", "").strip()
+        text = self.locate(self.TABLE_CELL, row, col).text_content().replace(",", "").strip()
         return int(text) if text and text != "-" else 0
 
     def verify_row_total(self, row_index: int, funded_col: int, non_funded_col: int, total_col: int) -> bool:
@@ -66,59 +74,50 @@ class PortfolioPage(BasePage):
         return funded + non_funded == total
 
     def verify_table_row_totals(self) -> bool:
-        rows = self.page.locator(self.TABLE_ROWS)
-        for i in range(rows.count() - 1):  # skip total row
-            if not self.verify_row_total(i + 1, 2, 3, 4):  # Adjust column index if layout changes
-                return False
-        return True
+        return self.verify_row_totals()
 
     def verify_row_totals(self) -> bool:
         """Checks that each table row's total = funded + non-funded amounts."""
-        rows = self.page.locator(self.TABLE_ROWS)
-        row_count = rows.count()
-
-        for i in range(row_count - 1):  # Exclude total row
-            try:
-                funded_text = self.page.locator(self.TABLE_CELL(i + 1, 2)).text_content().replace(",", "").strip()
-                non_funded_text = self.page.locator(self.TABLE_CELL(i + 1, 3)).text_content().replace(",", "").strip()
-                total_text = self.page.locator(self.TABLE_CELL(i + 1, 4)).text_content().replace(",", "").strip()
+        return self.row_totals_match(self.table_snapshot())
 
-                funded = float(funded_text or "0")
-                non_funded = float(non_funded_text or "0")
-                total = float(total_text or "0")
-
-                if not (funded + non_funded == total):
-                    return False
-            except Exception:
-                return False
-        return True
+    @staticmethod
+    def row_totals_match(snapshot) -> bool:
+        # Funded, Non-Funded, Total columns; the last row is the total row
+        return snapshot.row_sums_match([1, 2], 3, slice(0, -1))
 
     def verify_column_totals(self) -> bool:
         """Verify that the sum of column values matches the total row values."""
-        column_indexes = [2, 3, 4]  # Funded, Non-Funded, Total columns
-        rows = self.page.locator(self.TABLE_ROWS)
-        row_count = rows.count()
-
-        for col_index in column_indexes:
-            try:
-                total_cell_selector = self.TABLE_CELL(row_count, col_index)
-                total_text = self.page.locator(total_cell_selector).text_content().replace(",", "").strip()
-                expected_total = float(total_text or "0")
-
-                actual_sum = 0.0
-                for row in range(1, row_count):  # Exclude total row
-                    cell_selector = self.TABLE_CELL(row, col_index)
-                    cell_text = self.page.locator(cell_selector).text_content().replace(",", "").strip()
-                    actual_sum += float(cell_text or "0")
-
-                if round(actual_sum, 2) != round(expected_total, 2):
-                    return False
-            except Exception:
-                return False
+        return self.column_totals_match(self.table_snapshot())
 
-        return True
+    @staticmethod
+    def column_totals_match(snapshot) -> bool:
+        if not snapshot.row_count:
+            return False
+        return snapshot.column_sums_match([1, 2, 3], total_row=-1, body=slice(0, -1))
 
-    import re
+    def total_figures(self) -> dict:
+        """Total row as shown plus the Decimal sums of the rows above it (for utils.reconciliation).
+
+        A body row too short to have a column counts as not a number there, so the sum is None.
+        """
+        rows = self.table_snapshot().rows
+        if len(rows) < 2:
+            raise ValueError("Portfolio table has no rows above its Total row.")
+        body, total = rows[:-1], rows[-1]
+        if len(total) < 12:
+            raise ValueError("Portfolio table has no complete Total row.")
+
+        def column_sum(col):
+            return decimal_sum(row[col] if col < len(row) else None for row in body)
+
+        figures = {"total": {}, "rows": {}}
+        for g, first in zip(self.FIGURE_GROUPS, (1, 4, 7)):
+            fields = dict(zip(("funded", "non_funded", "total"), range(first, first + 3)))
+            figures["total"][g] = {name: total[col] for name, col in fields.items()}
+            figures["rows"][g] = {name: column_sum(col) for name, col in fields.items()}
+        figures["total"]["new_funded"] = total[11]
+        figures["rows"]["new_funded"] = column_sum(11)
+        return figures
 
     def validate_number_formatting(self) -> bool:
         """
@@ -126,16 +125,14 @@ class PortfolioPage(BasePage):
         - Commas for thousands (e.g., 1,000 or 100,000)
         - Optional decimal places
         """
-        number_format_pattern = re.compile(r"^\d{1,3}(,\d{3})*(\.\d{1,2})?$")
-
-        rows = self.page.locator(self.TABLE_ROWS)
-        row_count = rows.count()
+        return self.amounts_formatted(self.table_snapshot().rows)
 
-        for row_index in range(1, row_count + 1):  # Including total row
-            for col_index in range(2, 5):  # Columns: Funded, Non-Funded, Total
-                cell_selector = self.TABLE_CELL(row_index, col_index)
-                cell_text = self.page.locator(cell_selector).text_content().strip()
+    @staticmethod
+    def amounts_formatted(rows: list) -> bool:
+        number_format_pattern = re.compile(r"^\d{1,3}(,\d{3})*(\.\d{1,2})?$")
 
+        for row in rows:  # Including total row
+            for cell_text in row[1:4]:  # Columns: Funded, Non-Funded, Total
                 # Skip empty or non-numeric cells if needed
                 if not cell_text or not cell_text[0].isdigit():
                     continue
@@ -149,43 +146,32 @@ class PortfolioPage(BasePage):
         return True
 
     def is_number_formatting_correct(self) -> bool:
-        import re
-        rows = self.page.locator(self.TABLE_ROWS)
-        for i in range(rows.count()):
-            cols = rows.nth(i).locator("td")
-            for j in range(cols.count()):
-                text = cols.nth(j).text_content().strip()
+        return self.cells_formatted(self.table_snapshot().rows)
+
+    @staticmethod
+    def cells_formatted(rows: list) -> bool:
+        for row in rows:
+            for text in row:
                 if text and text != "-" and not re.match(r'^(\d{1,3}(,\d{3})*|\d+)$', text):
                     return False
         return True
 
     def click_back(self):
-        self.page.click(self.BACK_BUTTON)
-        self.page.wait_for_timeout(1000)
+        self.settle(lambda: self.page.click(self.BACK_BUTTON), navigation=True,
+                    legacy_ms=1000, label="PortfolioPage.click_back")
 
     def is_navigated_back(self) -> bool:
         return "dashboard" in self.page.url or "home" in self.page.url
 
-    def set_viewport(self, mode: str = "mobile"):
-        sizes = {
-            "mobile": (375, 667),
-            "tablet": (768, 1024),
-            "desktop": (1440, 900)
-        }
-        width, height = sizes.get(mode, sizes["mobile"])
-        self.page.context.set_viewport_size({"width": width, "height": height})
-
     def is_layout_responsive(self) -> bool:
-        self.set_viewport("mobile")
-        return self.page.is_visible("table")  # fallback check for visible table
+        return all(self.layout_checks().values())
 
     def test_keyboard_navigation(self) -> bool:
-        self.page.keyboard.press("Tab")
-        return self.page.evaluate("document.activeElement !== document.body")
+        audit = self.accessibility_audit()
+        return bool(audit.tab_order) and audit.passed(*KEYBOARD_RULES)
 
     def verify_aria_labels(self) -> bool:
-        elements = self.page.locator("[aria-label]")
-        return elements.count() > 0
+        return self.accessibility_audit().passed(*LABEL_RULES)
 
     def check_sql_injection_result(self, query: str) -> bool:
         self.search_facility(query)
@@ -0,0 +1,53 @@
+from utils.browser_pool import BrowserPool
+
+
+class FakeContext:
+    def __init__(self, browser):
+        self.browser = browser
+
+    def close(self):
+        self.browser.contexts.remove(self)
+
+
+class FakeBrowser:
+    def __init__(self, browser_type):
+        self.browser_type = browser_type
+        self.contexts = []
+        self.closed = False
+
+    def is_connected(self):
+        return not self.closed
+
+    def new_context(self, **options):
+        context = FakeContext(self)
+        self.contexts.append(context)
+        return context
+
+    def close(self):
+        self.closed = True
+
+
+class FakeBrowserType:
+    def __init__(self):
+        self.launched = []
+
+    def launch(self, **options):
+        browser = FakeBrowser(self)
+        self.launched.append(browser)
+        return browser
+
+
+def test_worn_browser_is_recycled_despite_its_spares():
+    """✅ A pooled browser is relaunched after max_uses contexts, even though a spare is always open on it."""
+    browser_type = FakeBrowserType()
+    pool = BrowserPool(FakeBrowser(browser_type), size=2, spares=4, max_uses=3)
+    worn = browser_type.launched[0]
+    for _ in range(10):
+        with pool.context():
+            pass
+
+    assert worn.closed, "❌ The launched browser was never recycled after max_uses."
+    assert not worn.contexts, "⚠️ Spares were left open on the recycled browser."
+    assert len(browser_type.launched) > 1
+    pool.close()
+    assert all(browser.closed for browser in browser_type.launched)
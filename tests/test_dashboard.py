@@ -4,10 +4,10 @@ from utils.config import Config
 
 @pytest.mark.smoke
 @pytest.mark.usefixtures("page")
+@pytest.mark.route_profile("full")
 def test_dashboard_logo_visible(page):
     dashboard = DashboardPage(page)
     dashboard.visit(Config.BASE_URL)
-    dashboard.login(Config.TEST_EMAIL, Config.PASSWORD)
     assert dashboard.is_logo_visible(), "RAKtrack logo not visible."
 
 
@@ -27,6 +27,13 @@ def test_dashboard_cards_present(page):
     assert dashboard.verify_dashboard_cards(cards), "One or more dashboard cards are missing."
 
 
+@pytest.mark.visual
+def test_dashboard_cards_visual(page):
+    dashboard = DashboardPage(page)
+    result = dashboard.check_visual("cards")
+    assert result.passed, f"Dashboard cards look different: {result.describe()}"
+
+
 def test_view_details_navigation(page):
     dashboard = DashboardPage(page)
     assert dashboard.click_view_details("Past Dues"), "Failed to navigate from 'View Details' of Past Dues."
@@ -0,0 +1,126 @@
+import pytest
+
+pytest_plugins = ["pytester"]
+
+from utils.config import Config
+from utils.flaky import FlakyHistory, flip_rate
+
+
+@pytest.mark.parametrize("results, expected", [
+    ("", 0.0),
+    ("P", 0.0),
+    ("PPPP", 0.0),
+    ("FFFF", 0.0),
+    ("PPF", 0.5),
+    ("PFPF", 1.0),
+    ("R", 1.0),        # a fail then a pass
+    ("PRP", 2 / 3),    # P F P P
+])
+def test_flip_rate(results, expected):
+    """✅ Flip rate is the share of consecutive outcomes that change, counting inside an R."""
+    assert flip_rate(results) == pytest.approx(expected), f"❌ Wrong flip rate for {results!r}"
+
+
+def test_history_quarantines_and_releases(tmp_path, monkeypatch):
+    """✅ A test is quarantined once it has enough runs that flip often, and released once it settles."""
+    monkeypatch.setattr(Config, "FLAKY_MIN_RUNS", 4)
+    monkeypatch.setattr(Config, "FLAKY_THRESHOLD", 0.5)
+    monkeypatch.setattr(Config, "FLAKY_WINDOW", 6)
+    history = FlakyHistory(str(tmp_path / "flaky_history.json"))
+    history.save({"t::flaky": "P", "t::steady": "P"})
+    history.save({"t::flaky": "F", "t::steady": "P"})
+    history.save({"t::flaky": "P", "t::steady": "P"})
+    assert not history.quarantined("t::flaky"), "⚠️ Quarantined before FLAKY_MIN_RUNS runs."
+    history.save({"t::flaky": "R", "t::steady": "P"})
+    assert history.quarantined("t::flaky") and not history.quarantined("t::steady")
+
+    for _ in range(5):
+        history.save({"t::flaky": "P"})
+    assert FlakyHistory.load(history.path).results["t::flaky"] == "RPPPPP", "⚠️ Window not applied."
+    assert not history.quarantined("t::flaky"), "❌ Still quarantined after it settled."
+
+
+RETRY_CONFTEST = """
+import pytest
+
+pytest_plugins = ["pytester"]
+from utils.flaky import FlakyTests
+
+attempts = {}
+
+
+class FakePage:
+    def __init__(self):
+        self.url, self.closed = "about:blank", False
+
+    def goto(self, url):
+        self.url = url
+
+    def is_closed(self):
+        return self.closed
+
+    def close(self):
+        self.closed = True
+
+
+plugin = FlakyTests()
+
+
+def pytest_configure(config):
+    plugin.configure(2, "run")
+    config.pluginmanager.register(plugin, "flaky-under-test")
+
+
+@pytest.fixture(scope="module")
+def page():
+    page = FakePage()
+    yield page
+    page.close()
+
+
+def fail_once(name, pages, page):
+    pages.append(page)
+    attempts[name] = attempts.get(name, 0) + 1
+    assert attempts[name] > 1, "first attempt fails"
+"""
+
+
+def test_retries_keep_the_module_page_and_renew_function_pages(pytester, monkeypatch, tmp_path):
+    """✅ The last test of a module and a test with a function-scoped page are both retried."""
+    monkeypatch.setattr(Config, "FLAKY_HISTORY_FILE", str(tmp_path / "flaky_history.json"))
+    pytester.makeconftest(RETRY_CONFTEST)
+    pytester.makepyfile(test_module_page="""
+        from conftest import fail_once
+        pages = []
+
+        def test_first(page):
+            page.goto("http://app/pipeline")
+
+        def test_always_fails(page):
+            page.goto("http://app/elsewhere")
+            assert False
+
+        def test_last(page):
+            fail_once("last", pages, page)
+            assert pages[0] is pages[-1] and not page.closed
+
+        def teardown_module():
+            assert pages[0].closed, "module page left open after its last test"
+    """, test_function_page="""
+        import pytest
+        from conftest import FakePage, fail_once
+        pages = []
+
+        @pytest.fixture
+        def page():
+            page = FakePage()
+            yield page
+            page.close()
+
+        def test_function_scoped(page):
+            fail_once("function", pages, page)
+            assert pages[0] is not page and pages[0].closed and not page.closed
+    """)
+    result = pytester.runpytest("-p", "no:cacheprovider")
+    assert result.parseoutcomes() == {"passed": 3, "failed": 1, "rerun": 4}
+    assert "module page left open" not in result.stdout.str()
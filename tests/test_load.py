@@ -0,0 +1,20 @@
+import pytest
+from utils.load_runner import JOURNEYS, LoadProfile, run_load
+from utils.stub_server import StubData, StubServer
+
+
+@pytest.mark.load
+def test_pipeline_and_portfolio_under_concurrent_users():
+    """📈 8 virtual users on 2 shared browsers drive the Pipeline/Portfolio journeys against a local stand-in."""
+    data = StubData.generate(seed=3)
+    profile = LoadProfile(users=8, browsers=2, ramp_up_s=2, think_time_s=(0.1, 0.3))
+    with StubServer(data=data, latency_ms=20, jitter_ms=10) as server:
+        report = run_load([JOURNEYS["pipeline"], JOURNEYS["portfolio"]], profile, base_url=server.url,
+                          username=data.username, password=data.password)
+
+    assert report.error_rate == 0, f"❌ Errors under load:\n{report.table()}"
+    steps = {(row["journey"], row["step"]): row for row in report.stats()}
+    assert ("pipeline", "search_rm") in steps and ("portfolio", "select_dropdown_option") in steps, \
+        "⚠️ Not every journey step was recorded."
+    for row in steps.values():
+        assert row["p50_ms"] <= row["p95_ms"] <= row["p99_ms"], f"⚠️ Percentiles out of order for {row['step']}."
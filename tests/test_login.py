@@ -1,23 +1,19 @@
+import asyncio
+
 import pytest
-from playwright.sync_api import sync_playwright
+from pages.aio import AsyncLoginPage
 from pages.login_page import LoginPage
 from utils.config import Config
 
 
-def run_test_with_browser(test_func):
-    """Helper to isolate browser session per test."""
-    def wrapper():
-        with sync_playwright() as p:
-            browser = p.chromium.launch(headless=False)
-            context = browser.new_context()
-            page = context.new_page()
-            test_func(page)
-            browser.close()
-    return wrapper
+@pytest.fixture
+def page(browser_pool):
+    """Isolated, unauthenticated session per test from the warm browser pool."""
+    with browser_pool.context() as context:
+        yield context.new_page()
 
 
 @pytest.mark.smoke
-@run_test_with_browser
 def test_login_success(page):
     """✅ Verify login with valid credentials."""
     login_page = LoginPage(page)
@@ -26,7 +22,6 @@ def test_login_success(page):
     assert login_page.is_login_successful(), "❌ Login failed — dashboard not visible after login."
 
 
-@run_test_with_browser
 def test_login_invalid_password(page):
     """❌ Login attempt with valid username and wrong password should fail."""
     login_page = LoginPage(page)
@@ -35,7 +30,6 @@ def test_login_invalid_password(page):
     assert not login_page.is_login_successful(), "⚠️ Login succeeded with invalid password."
 
 
-@run_test_with_browser
 def test_login_invalid_username(page):
     """❌ Login attempt with invalid username and valid password should fail."""
     login_page = LoginPage(page)
@@ -44,7 +38,6 @@ def test_login_invalid_username(page):
     assert not login_page.is_login_successful(), "⚠️ Login succeeded with invalid username."
 
 
-@run_test_with_browser
 def test_login_empty_username(page):
     """❌ Login with empty username should fail."""
     login_page = LoginPage(page)
@@ -53,7 +46,6 @@ def test_login_empty_username(page):
     assert not login_page.is_login_successful(), "⚠️ Login succeeded with empty username."
 
 
-@run_test_with_browser
 def test_login_empty_password(page):
     """❌ Login with empty password should fail."""
     login_page = LoginPage(page)
@@ -62,7 +54,6 @@ def test_login_empty_password(page):
     assert not login_page.is_login_successful(), "⚠️ Login succeeded with empty password."
 
 
-@run_test_with_browser
 def test_login_empty_credentials(page):
     """❌ Login with empty credentials should fail."""
     login_page = LoginPage(page)
@@ -71,7 +62,6 @@ def test_login_empty_credentials(page):
     assert not login_page.is_login_successful(), "⚠️ Login succeeded with empty credentials."
 
 
-@run_test_with_browser
 def test_login_case_sensitivity(page):
     """❌ Verify if username/password is case sensitive."""
     login_page = LoginPage(page)
@@ -80,7 +70,6 @@ def test_login_case_sensitivity(page):
     assert not login_page.is_login_successful(), "⚠️ Login succeeded with uppercase credentials."
 
 
-@run_test_with_browser
 def test_login_sql_injection_attempt(page):
     """❌ Attempt SQL injection via login fields."""
     login_page = LoginPage(page)
@@ -88,8 +77,34 @@ def test_login_sql_injection_attempt(page):
     login_page.login("' OR '1'='1", "' OR '1'='1")
     assert not login_page.is_login_successful(), "⚠️ SQL injection attempt succeeded."
 
+
+async def test_negative_logins_concurrently(async_browser):
+    """❌ Every negative login case above at once: one event loop, one context per case."""
+    cases = {
+        "invalid password": (Config.TEST_EMAIL, "wrongpassword123"),
+        "invalid username": ("invalid_user", Config.PASSWORD),
+        "empty username": ("", Config.PASSWORD),
+        "empty password": (Config.TEST_EMAIL, ""),
+        "empty credentials": ("", ""),
+        "uppercase credentials": (Config.TEST_EMAIL.upper(), Config.PASSWORD.upper()),
+        "SQL injection": ("' OR '1'='1", "' OR '1'='1"),
+    }
+
+    async def attempt(username, password):
+        context = await async_browser.new_context()
+        try:
+            login_page = AsyncLoginPage(await context.new_page())
+            await login_page.visit(Config.BASE_URL)
+            await login_page.login(username, password)
+            return await login_page.is_login_successful()
+        finally:
+            await context.close()
+
+    results = await asyncio.gather(*(attempt(*credentials) for credentials in cases.values()))
+    succeeded = [name for name, ok in zip(cases, results) if ok]
+    assert not succeeded, f"⚠️ Login succeeded for: {', '.join(succeeded)}"
+
 # Optional:
-# @run_test_with_browser
 # def test_login_locked_account(page):
 #     login_page = LoginPage(page)
 #     login_page.visit(Config.BASE_URL)
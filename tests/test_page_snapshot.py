@@ -0,0 +1,72 @@
+import pytest
+
+from utils.page_snapshot import PageSnapshot
+
+
+def _node(tag, parent, content, role=None, visible=True, **attrs):
+    return {"tag": tag, "parent": parent, "role": role, "attrs": attrs, "content": content,
+            "box": [0, 0, 10, 10] if visible else [0, 0, 0, 0], "visible": visible, "next": ""}
+
+
+@pytest.fixture
+def snapshot():
+    """✅ A hand-built capture: a nav with two links (one hidden) and a one-row table."""
+    return PageSnapshot("http://app/pipeline", [
+        _node("body", None, [1, 4]),
+        _node("nav", 0, [2, 3], role="navigation", **{"class": "menu main"}),
+        _node("a", 1, ["Pipeline"], role="link", href="/pipeline", id="pipe"),
+        _node("a", 1, ["Portfolio"], role="link", visible=False, href="/portfolio"),
+        _node("table", 0, [5], role="table"),
+        _node("tr", 4, [6, 7], role="row"),
+        _node("td", 5, ["RM  One\n"], role="cell"),
+        _node("td", 5, ["1,200"], role="cell", **{"class": "amount"}),
+    ])
+
+
+def _indexes(nodes):
+    return [node.index for node in nodes]
+
+
+@pytest.mark.parametrize("query, expected", [
+    ("a", [2, 3]),
+    ("nav a", [2, 3]),
+    ("nav > a", [2, 3]),
+    ("body > a", []),
+    ("body a", [2, 3]),
+    (".menu.main", [1]),
+    ("#pipe", [2]),
+    ("a[href]", [2, 3]),
+    ("a[href^='/port']", [3]),
+    ("a[href$=line]", [2]),
+    ("[class~=main]", [1]),
+    ("[role=link]", [2, 3]),
+    ("[role=navigation] > [role=link]:visible", [2]),
+    ("td:has-text('rm one')", [6]),
+    ("td:text-is('RM One')", [6]),
+    ("tr > td:has-text('1,200')", [7]),
+    ("text=rm one", [6]),
+    ('text="RM One"', [6]),
+    ("text=Pipe", [2]),
+    ("table >> .amount", [7]),
+    ("nav >> text=Portfolio", [3]),
+])
+def test_find_matches_in_document_order(snapshot, query, expected):
+    """✅ Each supported selector form picks exactly the expected elements."""
+    assert _indexes(snapshot.find(query)) == expected, f"❌ Wrong matches for {query!r}"
+
+
+def test_texts_and_visibility(snapshot):
+    """✅ Texts are whitespace-normalised and include children; hidden elements are not visible."""
+    assert snapshot.texts("tr") == ["RM One 1,200"]
+    assert snapshot.root.text == "Pipeline Portfolio RM One 1,200"
+    assert snapshot.is_visible("text=Pipeline")
+    assert not snapshot.is_visible("text=Portfolio")
+    assert snapshot.first("td").parent.tag == "tr"
+    assert _indexes(snapshot.first("table").find("td")) == [6, 7]
+
+
+@pytest.mark.parametrize("query", ["td:nth-child(1)", "a >", "table >> ", "td!"])
+def test_unsupported_queries_raise(snapshot, query):
+    """✅ Anything outside the selector subset fails loudly instead of matching nothing."""
+    with pytest.raises(ValueError):
+        snapshot.find(query)
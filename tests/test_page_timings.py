@@ -0,0 +1,91 @@
+import pytest
+from playwright._impl._impl_to_api_mapping import ImplToApiMapping
+from playwright.sync_api import Locator, Page, TimeoutError
+
+from utils.page_timings import PageTimings
+
+
+class FakeLocator(Locator):
+    def __init__(self):
+        self._impl_obj = "locator impl"
+
+    def click(self):
+        pass
+
+    def wait_for(self, timeout=None):
+        raise TimeoutError("never shown")
+
+
+class FakeResponseWait:
+    def __enter__(self):
+        return "response info"
+
+    def __exit__(self, *exc_info):
+        return None
+
+
+class FakePage(Page):
+    def __init__(self):
+        self._impl_obj = "page impl"
+
+    def locator(self, selector):
+        return FakeLocator()
+
+    def expect_response(self, matcher):
+        return FakeResponseWait()
+
+    def evaluate(self, script):
+        return 1
+
+
+@pytest.fixture
+def timings():
+    timings = PageTimings()
+    timings.enable()
+
+    class FakePageObject:
+        def __init__(self, page):
+            self.page = timings.watch(page)
+
+        def search(self):
+            locator = self.page.locator("table")
+            locator.click()
+            try:
+                locator.wait_for(timeout=1)
+            except TimeoutError:
+                pass    # caught here, still counted
+            with self.page.expect_response("api") as info:
+                self.page.evaluate("1")
+            return info
+
+    timings.instrument(FakePageObject)
+    timings.page_object = FakePageObject
+    return timings
+
+
+def test_calls_are_counted_through_the_page_proxy(timings):
+    """✅ Round trips made through ``self.page`` and its locators are counted, split and charged to the method."""
+    page_object = timings.page_object(FakePage())
+    timings.begin_test("tests/test_x.py::test_search")
+    assert page_object.search() == "response info"
+    root = timings.end_test()
+
+    search = root.children[0]
+    assert search.name == "FakePageObject.search"
+    # click + evaluate act; wait_for + the response wait wait; the caught wait_for timeout counts
+    assert (search.calls, search.timeouts) == (4, 1), f"❌ {search}"
+    stats = timings.slowest()[0].as_dict()
+    assert stats["playwright_calls"] == 4 and stats["timeouts"] == 1
+
+
+def test_proxy_is_shared_per_page_and_accepted_by_playwright(timings):
+    page = FakePage()
+    first, second = timings.page_object(page), timings.page_object(page)
+    assert first.page is second.page, "⚠️ One proxy per page keeps per-page locator caches working."
+    assert isinstance(first.page, Page)
+    assert ImplToApiMapping().to_impl([first.page.locator("a")]) == ["locator impl"]
+
+
+def test_watch_is_a_no_op_when_disabled():
+    page = FakePage()
+    assert PageTimings().watch(page) is page
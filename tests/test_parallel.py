@@ -0,0 +1,54 @@
+import queue
+
+import pytest
+
+pytest_plugins = ["pytester"]
+
+from utils.parallel import WorkerPlugin
+
+WORKER_CONFTEST = """
+import pytest
+
+def log(event):
+    with open("events.txt", "a") as f:
+        f.write(event + "\\n")
+
+@pytest.fixture(scope="session")
+def browser():
+    log("browser up")
+    yield "browser"
+    log("browser down")
+
+@pytest.fixture(scope="module")
+def page(browser, request):
+    log("page up " + request.module.__name__)
+    yield "page"
+    log("page down " + request.module.__name__)
+"""
+
+
+def test_worker_runs_pulled_modules_in_one_session(pytester):
+    """✅ One session per worker: session fixtures outlive each module, module fixtures do not."""
+    pytester.makeconftest(WORKER_CONFTEST)
+    pytester.makepyfile(
+        test_a="def test_one(page): pass\ndef test_two(page): pass",
+        test_b="def test_three(page): assert False",
+        test_c="import missing_module",
+        test_d="def test_not_pulled(page): pass",
+    )
+    modules = [str(pytester.path / name) for name in ("test_a.py", "test_b.py", "test_c.py", "test_d.py")]
+    work, results = queue.Queue(), queue.Queue()
+    for module in modules[:3] + [None]:
+        work.put(module)
+
+    pytester.inline_run(*modules, "--continue-on-collection-errors", plugins=[WorkerPlugin(0, work, results)])
+
+    reported = {}
+    while not results.empty():
+        _, module, code, _ = results.get()
+        reported[module] = code
+    assert reported == {modules[0]: pytest.ExitCode.OK, modules[1]: pytest.ExitCode.TESTS_FAILED,
+                        modules[2]: pytest.ExitCode.TESTS_FAILED}, f"❌ {reported}"
+    events = (pytester.path / "events.txt").read_text().splitlines()
+    assert events == ["browser up", "page up test_a", "page down test_a", "page up test_b", "page down test_b",
+                      "browser down"], f"❌ {events}"
@@ -1,17 +1,18 @@
 import pytest
 
+from pages.aio import AsyncPortfolioPage
 from pages.login_page import LoginPage
 from pages.portfolio_page import PortfolioPage
+from utils.a11y import KEYBOARD_RULES, LABEL_RULES
 from utils.config import Config
 
 
 @pytest.mark.smoke
-def test_login_success(page):
-    """✅ Verify login with valid credentials."""
+def test_session_authenticated(page):
+    """✅ Verify the shared session state opens the dashboard without a UI login."""
     login_page = LoginPage(page)
     login_page.visit(Config.BASE_URL)
-    login_page.login(Config.TEST_EMAIL, Config.PASSWORD)
-    assert login_page.is_login_successful(), "❌ Login failed — dashboard not visible after login."
+    assert login_page.is_login_successful(), "❌ Stored session rejected — dashboard not visible."
 
 
 def test_portfolio_title_visible(page):
@@ -59,18 +60,21 @@ def test_portfolio_dropdown_change(page):
     assert portfolio.get_dropdown_value() == "Region Level"
 
 
+@pytest.mark.route_profile("minimal")
 def test_portfolio_row_totals(page):
     portfolio = PortfolioPage(page)
     portfolio.visit(Config.PORTFOLIO_URL)
     assert portfolio.verify_row_totals()
 
 
+@pytest.mark.route_profile("minimal")
 def test_portfolio_column_totals(page):
     portfolio = PortfolioPage(page)
     portfolio.visit(Config.PORTFOLIO_URL)
     assert portfolio.verify_column_totals()
 
 
+@pytest.mark.route_profile("minimal")
 def test_portfolio_number_formatting(page):
     portfolio = PortfolioPage(page)
     portfolio.visit(Config.PORTFOLIO_URL)
@@ -84,23 +88,29 @@ def test_portfolio_back_navigation(page):
     assert portfolio.is_navigated_back()
 
 
-def test_portfolio_responsive_mobile(page):
-    portfolio = PortfolioPage(page)
-    portfolio.set_viewport("mobile")
-    portfolio.visit(Config.PORTFOLIO_URL)
-    assert portfolio.is_layout_responsive()
+def test_portfolio_responsive_layout(viewports):
+    rows = viewports.run(AsyncPortfolioPage, Config.PORTFOLIO_URL)
+    failed = [row.describe() for row in rows if not row.passed]
+    assert not failed, "Portfolio page is not responsive: " + "; ".join(failed)
 
 
 def test_portfolio_keyboard_accessibility(page):
     portfolio = PortfolioPage(page)
     portfolio.visit(Config.PORTFOLIO_URL)
-    assert portfolio.test_keyboard_navigation()
+    assert portfolio.test_keyboard_navigation(), portfolio.accessibility_audit().summary(*KEYBOARD_RULES)
 
 
 def test_portfolio_aria_labels(page):
     portfolio = PortfolioPage(page)
     portfolio.visit(Config.PORTFOLIO_URL)
-    assert portfolio.verify_aria_labels()
+    assert portfolio.verify_aria_labels(), portfolio.accessibility_audit().summary(*LABEL_RULES)
+
+
+def test_portfolio_accessibility_audit(page):
+    portfolio = PortfolioPage(page)
+    portfolio.visit(Config.PORTFOLIO_URL)
+    audit = portfolio.accessibility_audit()
+    assert audit.passed(), audit.summary()
 
 
 def test_portfolio_sql_injection_protection(page):
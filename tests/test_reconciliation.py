@@ -0,0 +1,56 @@
+from decimal import Decimal
+
+import allure
+import pytest
+
+from pages.DashboardPage import DashboardPage
+from pages.pipeline_page import PipelinePage
+from pages.portfolio_page import PortfolioPage
+from utils.config import Config
+from utils.table_snapshot import decimal_sum, to_decimal
+
+# source -> (page object, URL, element to wait for, reader); each is read at most once per run
+SOURCES = {
+    "dashboard": (DashboardPage, lambda: Config.BASE_URL + "dashboard",
+                  DashboardPage.CURRENCY_CARD_SELECTOR("Pipeline Snapshot"), DashboardPage.pipeline_snapshot_figures),
+    "pipeline": (PipelinePage, lambda: Config.PIPELINE_URL, "table tbody tr", PipelinePage.total_figures),
+    "portfolio": (PortfolioPage, lambda: Config.PORTFOLIO_URL, "table tbody tr", PortfolioPage.total_figures),
+}
+
+
+@pytest.mark.route_profile("data")
+def test_figures_reconcile_across_pages(page, reconciliation):
+    for source, (page_cls, url, ready, read) in SOURCES.items():
+        def read_source():
+            page_object = page_cls(page)
+            page_object.visit(url())
+            page.wait_for_selector(ready)
+            return read(page_object)
+        reconciliation.collect(source, read_source, url())
+    allure.attach(reconciliation.table(), name="Reconciliation dataset", attachment_type=allure.attachment_type.TEXT)
+    reconciliation.assert_reconciled()
+
+
+@pytest.mark.parametrize("text, expected", [
+    ("AED 1,234.50", Decimal("1234.50")),
+    ("(1,000)", Decimal("-1000")),
+    ("-42", Decimal("-42")),
+    (" 12 345 ", Decimal("12345")),
+    ("0.5", Decimal("0.5")),
+    (7, Decimal(7)),
+    ("", Decimal(0)),
+    ("-", Decimal(0)),
+    ("N/A", None),
+    ("1.2M", None),
+    ("12.34.56", None),
+    ("(1,000", None),
+    (None, None),
+])
+def test_to_decimal(text, expected):
+    """✅ Shown amounts parse exactly: currency, thousands separators and accounting negatives."""
+    assert to_decimal(text) == expected, f"❌ {text!r} parsed as {to_decimal(text)!r}"
+
+
+def test_decimal_sum_is_exact_and_rejects_non_numbers():
+    assert decimal_sum(["0.10", "0.20", "(0.30)"]) == Decimal(0)
+    assert decimal_sum(["1", "N/A"]) is None
@@ -0,0 +1,50 @@
+import os
+
+from utils.config import ROOT_DIR
+from utils import scheduler
+
+
+def _path(name: str) -> str:
+    return os.path.join(ROOT_DIR, "tests", name)
+
+
+def test_allure_nodeid():
+    assert scheduler.allure_nodeid("tests.test_login#test_login_success") == "tests/test_login.py::test_login_success"
+
+
+def test_order_puts_recent_failures_first_then_longest_first():
+    """✅ Newest failure first, then longest first; a module without history counts as average."""
+    history = scheduler.TestHistory()
+    history.add("tests/test_slow.py::test_a", 10, "passed", 6.0)
+    history.add("tests/test_slow.py::test_b", 10, "passed", 4.0)
+    history.add("tests/test_old_failure.py::test_a", 100, "failed", 3.0)
+    history.add("tests/test_new_failure.py::test_a", 200, "broken", 2.0)
+    history.add("tests/test_recovered.py::test_a", 50, "failed", 1.0)
+    history.add("tests/test_recovered.py::test_a", 60, "passed", 1.0)   # latest run passed
+    # Known modules average (10 + 3 + 2 + 1) / 4 = 4 s, so the new module goes after the 10 s one
+    modules = [_path(name) for name in ("test_recovered.py", "test_new.py", "test_slow.py",
+                                        "test_old_failure.py", "test_new_failure.py")]
+
+    ordered = [os.path.basename(path) for path in history.order(modules)]
+
+    assert ordered == ["test_new_failure.py", "test_old_failure.py", "test_slow.py", "test_new.py",
+                       "test_recovered.py"], f"❌ Unexpected order: {ordered}"
+
+
+def test_module_duration_is_the_median_of_recent_runs():
+    history = scheduler.TestHistory()
+    for duration in (100.0, 1.0, 2.0, 3.0, 2.0, 2.0):   # the oldest run falls outside the last five
+        history.add("tests/test_x.py::test_a", 0, "passed", duration)
+    module = history.modules()["tests/test_x.py"]
+    assert module.duration == 2.0 and module.tests == 1 and not module.last_failure
+
+
+def test_changed_pages_keeps_every_module_when_git_fails(monkeypatch, caplog):
+    """✅ An unknown ref (or no git at all) warns and falls back to running every module."""
+    def fail(*args, **kwargs):
+        raise scheduler.subprocess.CalledProcessError(128, args[0], stderr="fatal: bad revision 'nope'\n")
+
+    monkeypatch.setattr(scheduler.subprocess, "run", fail)
+    modules = [_path("test_login.py"), _path("test_pipeline.py")]
+    assert scheduler.select_for_changed_pages(modules, "nope") == modules
+    assert "bad revision" in caplog.text, "⚠️ The fallback should say why."
@@ -4,12 +4,11 @@ from pages.login_page import LoginPage
 from utils.config import Config
 
 @pytest.mark.smoke
-def test_login_success(page):
-    """✅ Verify login with valid credentials."""
+def test_session_authenticated(page):
+    """✅ Verify the shared session state opens the dashboard without a UI login."""
     login_page = LoginPage(page)
     login_page.visit(Config.BASE_URL)
-    login_page.login(Config.TEST_EMAIL, Config.PASSWORD)
-    assert login_page.is_login_successful(), "❌ Login failed — dashboard not visible after login."
+    assert login_page.is_login_successful(), "❌ Stored session rejected — dashboard not visible."
 
 
 def test_taskboard_title_visible(page):
@@ -18,18 +17,27 @@ def test_taskboard_title_visible(page):
     assert taskboard.get_title_text() == "Task Board", "❌ Task Board title is not visible."
 
 
-def test_add_new_task(page):
+@pytest.mark.visual(stub_only=True)
+def test_kanban_board_visual(page):
+    taskboard = TaskBoardPage(page)
+    result = taskboard.check_visual("board")
+    assert result.passed, f"❌ Kanban board looks different: {result.describe()}"
+
+
+def test_add_new_task(page, task_data):
     taskboard = TaskBoardPage(page)
     taskboard.visit(Config.TASKBOARD_URL)
     task_title = "Test Task"
+    task_data.track_title(task_title)  # created through the UI, removed at teardown
     taskboard.add_task_to_column(0, task_title)  # Index 0 = TO-DO
     assert taskboard.is_task_present(task_title), "❌ Task not added to To-Do column."
 
 
-def test_move_task_between_columns(page):
+def test_move_task_between_columns(page, task_data):
+    task_title = "Move Task"
+    task_data.create(task_title, column=0)  # setup via API when available; only the drag is UI
     taskboard = TaskBoardPage(page)
     taskboard.visit(Config.TASKBOARD_URL)
-    task_title = "Test Task"
     taskboard.move_task_card(task_title, "In Progress")
     assert taskboard.is_task_present(task_title), "❌ Task not moved to In Progress column."
 
@@ -55,21 +63,22 @@ def test_task_assignees_displayed(page):
     assert "RA" in assignees and "MC" in assignees, "❌ Missing assignees on task card."
 
 
-def test_task_card_edit_functionality(page):
-    taskboard = TaskBoardPage(page)
-    taskboard.visit(Config.TASKBOARD_URL)
+def test_task_card_edit_functionality(page, task_data):
     original_title = "EditMe"
     updated_title = "EditedTask"
-    taskboard.add_task_to_column(0, original_title)
+    task_data.create(original_title, column=0)
+    taskboard = TaskBoardPage(page)
+    taskboard.visit(Config.TASKBOARD_URL)
+    task_data.track_title(updated_title)  # teardown deletes by title when there is no API to delete by id
     taskboard.edit_task_card(original_title, updated_title)
     assert taskboard.is_task_present(updated_title), "❌ Task not updated after edit."
 
 
-def test_task_card_delete(page):
+def test_task_card_delete(page, task_data):
+    task_title = "DeleteMe"
+    task_data.create(task_title, column=0)
     taskboard = TaskBoardPage(page)
     taskboard.visit(Config.TASKBOARD_URL)
-    task_title = "DeleteMe"
-    taskboard.add_task_to_column(0, task_title)
     taskboard.delete_task_card(task_title)
     assert not taskboard.is_task_present(task_title), "❌ Task not deleted successfully."
 
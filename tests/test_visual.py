@@ -0,0 +1,55 @@
+import pytest
+
+np = pytest.importorskip("numpy")
+Image = pytest.importorskip("PIL.Image")
+
+from utils.config import Config
+from utils.visual import VisualBaselines, _png, changed_tiles, perceptual_hash, ssim
+
+
+def _screen(band_top: int = 40, box_colour=(200, 30, 30), noise: int = 0) -> Image.Image:
+    """A 256x192 'screenshot': white, a dark text band and a coloured box in the bottom right tile."""
+    pixels = np.full((192, 256, 3), 255, dtype=np.int16)
+    pixels[band_top:band_top + 12, 16:200] = 40
+    pixels[140:180, 200:240] = box_colour
+    if noise:
+        pixels += np.random.default_rng(0).integers(-noise, noise + 1, pixels.shape)
+    return Image.fromarray(pixels.clip(0, 255).astype(np.uint8))
+
+
+def test_hash_ignores_noise_but_not_moves_or_recolours():
+    """✅ Anti-aliasing-sized noise keeps the hash; a moved band or recoloured box changes the right tiles."""
+    baseline = perceptual_hash(_screen())
+    assert changed_tiles(baseline, perceptual_hash(_screen(noise=2))) == (0, [])
+
+    distance, tiles = changed_tiles(baseline, perceptual_hash(_screen(band_top=48)))
+    assert distance and tiles and all(row == 0 for row, _ in tiles), f"❌ Move missed or misplaced: {tiles}"
+
+    distance, tiles = changed_tiles(baseline, perceptual_hash(_screen(box_colour=(30, 200, 30))))
+    assert distance and (2, 3) in tiles, f"❌ Recolour missed: {tiles}"
+    assert all(row == 2 for row, _ in tiles)
+
+
+def test_ssim():
+    a = np.asarray(_screen().convert("L"), dtype=np.float64)
+    assert ssim(a, a) == pytest.approx(1.0)
+    assert ssim(a, 255 - a) < 0.5
+
+
+def test_baselines_compare_cheapest_first(tmp_path, monkeypatch):
+    """✅ new -> exact -> hash -> mismatch, and an updated baseline is what later checks compare with."""
+    monkeypatch.setattr(Config, "VISUAL_HASH_DISTANCE", 0)
+    monkeypatch.setattr("utils.visual.allure.attach", lambda *args, **kwargs: None)
+    baselines = VisualBaselines(str(tmp_path))
+    original, noisy, moved = _png(_screen()), _png(_screen(noise=2)), _png(_screen(band_top=48))
+
+    assert baselines.check("page/region", original).status == "new"
+    assert baselines.check("page/region", original).status == "exact"
+    assert baselines.check("page/region", noisy).status == "hash"
+    result = baselines.check("page/region", moved)
+    assert result.status == "mismatch" and result.tiles and result.changed > Config.VISUAL_MAX_CHANGED_PIXELS
+
+    baselines.update = True
+    assert baselines.check("page/region", moved).status == "updated"
+    assert VisualBaselines(str(tmp_path)).check("page/region", moved).status == "exact"
+    assert baselines.prune() == 2, "⚠️ The replaced baseline's image and hash should be pruned."
@@ -0,0 +1,267 @@
+"""Accessibility audit of a page in one round trip.
+
+``_AUDIT_SCRIPT`` walks the DOM under ``root`` once. On the way down it tracks each element's
+effective background and whether it sits inside ``aria-hidden`` content. It checks:
+
+* ``label`` -- a form control, button, link or other interactive role without an accessible name
+* ``image-alt`` -- an ``<img>`` with neither ``alt`` nor an ARIA label
+* ``role`` -- a ``role`` attribute that is not an ARIA role
+* ``keyboard`` -- an interactive role (e.g. ``div role=button``) that Tab never reaches
+* ``tabindex`` -- a positive ``tabindex``, which reorders the tab sequence
+* ``focus-hidden`` -- a Tab stop that is invisible or inside ``aria-hidden`` content
+* ``contrast`` -- text below WCAG AA contrast (4.5:1, 3:1 for large text) against its background;
+  text over a background image is not judged
+* ``heading-order`` / ``empty-heading`` -- a heading level that skips one (h2 -> h4), or a blank heading
+
+It also returns the full tab order (the sequence Tab visits) and the heading outline.
+
+The script hashes the root's markup first. If this URL was already audited with the same hash
+in this run, it returns the hash alone and the cached result is reused, so repeat visits cost
+one cheap round trip.
+"""
+from dataclasses import dataclass, field
+
+from playwright.sync_api import Page
+
+_AUDIT_SCRIPT = """([rootSelector, known]) => {
+    const root = document.querySelector(rootSelector) || document.body;
+    const html = root.outerHTML;
+    let h = 0x811c9dc5;
+    for (let i = 0; i < html.length; i++) {
+        h ^= html.charCodeAt(i);
+        h = Math.imul(h, 0x01000193);
+    }
+    const hash = (h >>> 0).toString(16) + ':' + html.length;
+    if (known.includes(hash)) return {hash, cached: true};
+
+    const ROLES = new Set(('alert alertdialog application article banner blockquote button caption cell checkbox code ' +
+        'columnheader combobox complementary contentinfo definition deletion dialog directory document emphasis feed ' +
+        'figure form generic grid gridcell group heading img insertion link list listbox listitem log main marquee ' +
+        'math menu menubar menuitem menuitemcheckbox menuitemradio meter navigation none note option paragraph ' +
+        'presentation progressbar radio radiogroup region row rowgroup rowheader scrollbar search searchbox ' +
+        'separator slider spinbutton status strong subscript superscript switch tab table tablist tabpanel term ' +
+        'textbox time timer toolbar tooltip tree treegrid treeitem').split(' '));
+    const INTERACTIVE = new Set(['button', 'link', 'checkbox', 'radio', 'switch', 'tab', 'menuitem', 'menuitemcheckbox',
+        'menuitemradio', 'option', 'combobox', 'textbox', 'searchbox', 'slider', 'spinbutton', 'treeitem']);
+    const NAME_FROM_CONTENT = new Set(['button', 'link', 'tab', 'menuitem', 'menuitemcheckbox', 'menuitemradio',
+        'option', 'treeitem', 'checkbox', 'radio', 'switch', 'heading']);
+    const TAG_ROLES = {BUTTON: 'button', SELECT: 'combobox', TEXTAREA: 'textbox', IMG: 'img', H1: 'heading',
+        H2: 'heading', H3: 'heading', H4: 'heading', H5: 'heading', H6: 'heading'};
+    const INPUT_ROLES = {checkbox: 'checkbox', radio: 'radio', button: 'button', submit: 'button', reset: 'button',
+        image: 'button', range: 'slider', search: 'searchbox', number: 'spinbutton'};
+    const SKIP = new Set(['SCRIPT', 'STYLE', 'NOSCRIPT', 'TEMPLATE', 'HEAD', 'META', 'LINK']);
+
+    const target = (el) => {
+        const parts = [];
+        for (let e = el; e && e.nodeType === 1 && parts.length < 4; e = e.parentElement) {
+            const tag = e.tagName.toLowerCase();
+            if (e.id) { parts.unshift(tag + '#' + CSS.escape(e.id)); break; }
+            const classes = [...e.classList].slice(0, 2).map(c => '.' + CSS.escape(c)).join('');
+            const same = e.parentElement ? [...e.parentElement.children].filter(c => c.tagName === e.tagName) : [];
+            parts.unshift(tag + classes + (same.length > 1 ? `:nth-of-type(${same.indexOf(e) + 1})` : ''));
+        }
+        return parts.join(' > ');
+    };
+    const violations = [];
+    const report = (rule, impact, el, detail) => violations.push({rule, impact, target: target(el), detail});
+    const textOf = (el) => (el.textContent || '').replace(/\\s+/g, ' ').trim();
+    const roleOf = (el) => {
+        const explicit = (el.getAttribute('role') || '').trim().split(/\\s+/)[0];
+        if (explicit) return explicit;
+        if (el.tagName === 'A') return el.hasAttribute('href') ? 'link' : null;
+        if (el.tagName === 'INPUT') return el.type === 'hidden' ? null : INPUT_ROLES[el.type] || 'textbox';
+        return TAG_ROLES[el.tagName] || null;
+    };
+    const nameOf = (el, role) => {
+        const ids = (el.getAttribute('aria-labelledby') || '').split(/\\s+/).filter(Boolean);
+        const labelled = ids.map(id => document.getElementById(id)).filter(Boolean).map(textOf).join(' ').trim();
+        if (labelled) return labelled;
+        const aria = (el.getAttribute('aria-label') || '').trim();
+        if (aria) return aria;
+        if (el.labels && el.labels.length) {
+            const label = [...el.labels].map(textOf).join(' ').trim();
+            if (label) return label;
+        }
+        if (el.tagName === 'IMG' || (el.tagName === 'INPUT' && el.type === 'image')) {
+            if ((el.getAttribute('alt') || '').trim()) return el.getAttribute('alt').trim();
+        }
+        if (el.tagName === 'INPUT' && ['submit', 'button', 'reset'].includes(el.type) && el.value) return el.value;
+        if (NAME_FROM_CONTENT.has(role)) {
+            const text = textOf(el);
+            if (text) return text;
+            const img = el.querySelector('img[alt]:not([alt=""]), [aria-label], svg title');
+            if (img) return img.getAttribute('alt') || img.getAttribute('aria-label') || textOf(img);
+        }
+        return (el.getAttribute('title') || el.getAttribute('placeholder') || '').trim();
+    };
+
+    const parse = (css) => {
+        const v = (css.match(/[\\d.]+/g) || []).map(Number);
+        return v.length >= 3 ? {r: v[0], g: v[1], b: v[2], a: v.length > 3 ? v[3] : 1} : {r: 0, g: 0, b: 0, a: 0};
+    };
+    const over = (top, bottom) => top.a >= 1 ? top : {
+        r: top.r * top.a + bottom.r * (1 - top.a), g: top.g * top.a + bottom.g * (1 - top.a),
+        b: top.b * top.a + bottom.b * (1 - top.a), a: 1};
+    const luminance = (c) => {
+        const ch = [c.r, c.g, c.b].map(v => { v /= 255; return v <= 0.03928 ? v / 12.92 : Math.pow((v + 0.055) / 1.055, 2.4); });
+        return 0.2126 * ch[0] + 0.7152 * ch[1] + 0.0722 * ch[2];
+    };
+    const contrast = (a, b) => {
+        const [l1, l2] = [luminance(a), luminance(b)].sort((x, y) => y - x);
+        return (l1 + 0.05) / (l2 + 0.05);
+    };
+
+    let background = {r: 255, g: 255, b: 255, a: 1};
+    let imageBehind = false;
+    const chain = [];
+    for (let e = root.parentElement; e; e = e.parentElement) chain.unshift(e);
+    for (const e of chain) {
+        const style = getComputedStyle(e);
+        background = over(parse(style.backgroundColor), background);
+        imageBehind = imageBehind || style.backgroundImage !== 'none';
+    }
+
+    const tabbable = [];
+    const headings = [];
+    const walk = (el, bg, hidden, image) => {
+        if (SKIP.has(el.tagName)) return;
+        const style = getComputedStyle(el);
+        if (style.display === 'none') return;
+        const rect = el.getBoundingClientRect();
+        const visible = style.visibility !== 'hidden' && rect.width > 0 && rect.height > 0;
+        hidden = hidden || el.getAttribute('aria-hidden') === 'true';
+        bg = over(parse(style.backgroundColor), bg);
+        image = image || style.backgroundImage !== 'none';
+        const role = roleOf(el);
+        const explicit = el.getAttribute('role');
+        if (explicit !== null && !explicit.trim().split(/\\s+/).some(r => ROLES.has(r))) {
+            report('role', 'serious', el, `"${explicit}" is not an ARIA role`);
+        }
+        const disabled = el.disabled === true || el.getAttribute('aria-disabled') === 'true';
+        const focusable = el.tabIndex >= 0 && !el.disabled && !(el.tagName === 'INPUT' && el.type === 'hidden');
+        if (focusable) {
+            if (!visible) report('focus-hidden', 'serious', el, 'reachable with Tab but not visible');
+            else if (hidden) report('focus-hidden', 'serious', el, 'reachable with Tab inside aria-hidden content');
+            else tabbable.push({el, role, index: el.tabIndex, position: tabbable.length});
+            if (el.tabIndex > 0) report('tabindex', 'moderate', el, `tabindex=${el.tabIndex} reorders the tab sequence`);
+        }
+        if (visible && !hidden) {
+            if (INTERACTIVE.has(role)) {
+                if (!nameOf(el, role)) report('label', 'serious', el, `${role} has no accessible name`);
+                if (!focusable && !disabled) report('keyboard', 'serious', el, `${role} is not reachable with Tab`);
+            }
+            if (el.tagName === 'IMG' && !el.hasAttribute('alt') && !nameOf(el, 'img')) {
+                report('image-alt', 'serious', el, 'image has no alt text');
+            }
+            if (role === 'heading') {
+                const level = Number(el.getAttribute('aria-level')) || Number(el.tagName[1]) || 2;
+                const text = textOf(el);
+                headings.push({el, level, text});
+                if (!text) report('empty-heading', 'moderate', el, `h${level} has no text`);
+            }
+            const ownText = [...el.childNodes].some(n => n.nodeType === Node.TEXT_NODE && n.textContent.trim());
+            if (ownText && !image && !disabled) {
+                const ratio = contrast(over(parse(style.color), bg), bg);
+                const size = parseFloat(style.fontSize);
+                const large = size >= 24 || (size >= 18.66 && Number(style.fontWeight) >= 700);
+                const needed = large ? 3 : 4.5;
+                if (ratio < needed) report('contrast', 'serious', el, `${ratio.toFixed(2)}:1, needs ${needed}:1`);
+            }
+        }
+        for (const child of el.children) walk(child, bg, hidden, image);
+    };
+    walk(root, background, false, imageBehind);
+
+    let previous = 0;
+    for (const heading of headings) {
+        if (previous && heading.level > previous + 1) {
+            report('heading-order', 'moderate', heading.el, `h${heading.level} follows h${previous}`);
+        }
+        previous = heading.level;
+    }
+    // Positive tabindex values come first (ascending), then everything else in document order
+    tabbable.sort((a, b) => ((a.index > 0 ? a.index : Infinity) - (b.index > 0 ? b.index : Infinity)) || a.position - b.position);
+    return {
+        hash, cached: false, violations,
+        tab_order: tabbable.map(t => ({target: target(t.el), role: t.role, name: nameOf(t.el, t.role).slice(0, 80)})),
+        headings: headings.map(x => ({level: x.level, text: x.text.slice(0, 80)})),
+    };
+}"""
+
+KEYBOARD_RULES = ("keyboard", "tabindex", "focus-hidden")
+LABEL_RULES = ("label", "image-alt", "role")
+
+
+@dataclass(frozen=True)
+class Violation:
+    rule: str
+    impact: str
+    target: str     # short CSS path of the element
+    detail: str
+
+    def describe(self) -> str:
+        return f"[{self.rule}] {self.target}: {self.detail}"
+
+
+@dataclass
+class AuditResult:
+    url: str
+    dom_hash: str
+    violations: list
+    tab_order: list = field(default_factory=list)   # {"target", "role", "name"} in the order Tab visits them
+    headings: list = field(default_factory=list)    # {"level", "text"} in document order
+    cached: bool = False
+
+    def by_rule(self, *rules) -> list:
+        return [v for v in self.violations if not rules or v.rule in rules]
+
+    def passed(self, *rules) -> bool:
+        return not self.by_rule(*rules)
+
+    def summary(self, *rules, limit: int = 20) -> str:
+        found = self.by_rule(*rules)
+        if not found:
+            return f"{self.url}: no accessibility violations"
+        lines = [v.describe() for v in found[:limit]]
+        if len(found) > limit:
+            lines.append(f"... and {len(found) - limit} more")
+        return f"{self.url}: {len(found)} accessibility violation(s)\n  " + "\n  ".join(lines)
+
+
+class A11yAuditor:
+    def __init__(self):
+        self.results = {}   # (url, dom hash) -> AuditResult
+        self.audits = 0
+        self.cache_hits = 0
+
+    def _known(self, url: str) -> list:
+        return [dom_hash for (audited, dom_hash) in self.results if audited == url]
+
+    def _result(self, url: str, data: dict) -> AuditResult:
+        key = (url, data["hash"])
+        if data["cached"]:
+            self.cache_hits += 1
+            cached = self.results[key]
+            return AuditResult(cached.url, cached.dom_hash, cached.violations, cached.tab_order, cached.headings,
+                               cached=True)
+        self.audits += 1
+        result = AuditResult(url, data["hash"], [Violation(**v) for v in data["violations"]],
+                             data["tab_order"], data["headings"])
+        self.results[key] = result
+        return result
+
+    def audit(self, page: Page, root: str = "body") -> AuditResult:
+        url = page.url
+        return self._result(url, page.evaluate(_AUDIT_SCRIPT, [root, self._known(url)]))
+
+    async def audit_async(self, page, root: str = "body") -> AuditResult:
+        """Same single round trip for a ``playwright.async_api`` page."""
+        url = page.url
+        return self._result(url, await page.evaluate(_AUDIT_SCRIPT, [root, self._known(url)]))
+
+    def describe(self) -> str:
+        pages = len({url for url, _ in self.results})
+        return f"{self.audits} audit(s) of {pages} page(s), {self.cache_hits} repeat visit(s) served from cache"
+
+
+a11y = A11yAuditor()
@@ -0,0 +1,51 @@
+import asyncio
+import inspect
+import threading
+
+import pytest
+
+
+class LoopThread:
+    """An asyncio event loop running on its own thread, for async tests and fixtures.
+
+    Keeping the loop off the main thread means it never meets the sync Playwright API's
+    own loop, so sync and async tests can share a session.
+    """
+
+    def __init__(self):
+        self.loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self.loop.run_forever, name="aio-loop", daemon=True)
+
+    def start(self) -> "LoopThread":
+        self._thread.start()
+        return self
+
+    def run(self, coro, timeout: float = None):
+        """Runs ``coro`` on the loop and blocks until it finishes, re-raising its exception."""
+        return asyncio.run_coroutine_threadsafe(coro, self.loop).result(timeout)
+
+    def close(self):
+        self.loop.call_soon_threadsafe(self.loop.stop)
+        self._thread.join()
+        self.loop.close()
+
+
+class AsyncTestPlugin:
+    """Lets ``async def`` tests run without an extra pytest plugin.
+
+    Each coroutine test gets the session ``aio_loop`` fixture and is run to completion on it;
+    its other fixtures are ordinary (sync) fixtures such as ``async_browser``.
+    """
+
+    def pytest_collection_modifyitems(self, items):
+        for item in items:
+            if inspect.iscoroutinefunction(getattr(item, "obj", None)) and "aio_loop" not in item.fixturenames:
+                item.fixturenames.append("aio_loop")
+
+    @pytest.hookimpl(tryfirst=True)
+    def pytest_pyfunc_call(self, pyfuncitem):
+        if not inspect.iscoroutinefunction(pyfuncitem.obj):
+            return None
+        kwargs = {name: pyfuncitem.funcargs[name] for name in pyfuncitem._fixtureinfo.argnames}
+        pyfuncitem.funcargs["aio_loop"].run(pyfuncitem.obj(**kwargs))
+        return True
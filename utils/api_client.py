@@ -0,0 +1,151 @@
+import logging
+
+from playwright.sync_api import APIRequestContext, APIResponse
+
+from utils.config import Config
+
+logger = logging.getLogger("rak.api")
+
+
+class ApiError(Exception):
+    pass
+
+
+class TaskApi:
+    """Task Board data over HTTP instead of through the UI.
+
+    Built on a Playwright ``APIRequestContext`` (normally ``page.context.request``), so it shares
+    the browser session's cookies and reuses pooled keep-alive connections.
+    """
+
+    def __init__(self, request: APIRequestContext, base_url: str = None, path: str = Config.TASKS_API_PATH,
+                 bulk_delete_path: str = Config.TASKS_BULK_DELETE_PATH, batch_size: int = Config.TASKS_BATCH_SIZE):
+        self.request = request
+        self.url = (base_url or Config.BASE_URL).rstrip("/") + "/" + path.strip("/") if path else None
+        self.bulk_delete_url = (base_url or Config.BASE_URL).rstrip("/") + "/" + bulk_delete_path.strip("/") \
+            if bulk_delete_path else None
+        self.batch_size = batch_size
+        self._available = None
+
+    @property
+    def available(self) -> bool:
+        """Whether the endpoint answers a task listing; probed once. An empty TASKS_API_PATH turns the API off."""
+        if self._available is None:
+            self._available = False
+            if self.url:
+                try:
+                    response = self.request.get(self.url)
+                    body = response.json() if response.ok else None
+                    self._available = isinstance(body, list) or (isinstance(body, dict) and "tasks" in body)
+                except Exception as exc:
+                    logger.info("Task API probe of %s failed: %s", self.url, exc)
+            if not self._available:
+                logger.info("Task API not available at %s; Task Board data goes through the UI", self.url)
+        return self._available
+
+    @staticmethod
+    def _check(response: APIResponse, action: str) -> APIResponse:
+        if not response.ok:
+            raise ApiError(f"{action} failed: HTTP {response.status} {response.status_text}")
+        return response
+
+    def list(self) -> list:
+        body = self._check(self.request.get(self.url), "List tasks").json()
+        return body["tasks"] if isinstance(body, dict) else body
+
+    def create(self, title: str, column: int = 0, **fields) -> dict:
+        response = self.request.post(self.url, data={"title": title, "column": column, **fields})
+        return self._check(response, f"Create task '{title}'").json()
+
+    def create_many(self, titles: list, column: int = 0) -> list:
+        return [self.create(title, column) for title in titles]
+
+    def move(self, task_id, column: int) -> dict:
+        return self._check(self.request.patch(f"{self.url}/{task_id}", data={"column": column}),
+                           f"Move task {task_id}").json()
+
+    def delete(self, task_id):
+        response = self.request.delete(f"{self.url}/{task_id}")
+        if response.status != 404:  # already gone is fine for teardown
+            self._check(response, f"Delete task {task_id}")
+
+    def delete_many(self, task_ids: list):
+        """Deletes in batches through the bulk endpoint, falling back to one call per task."""
+        task_ids = list(task_ids)
+        for start in range(0, len(task_ids), self.batch_size):
+            batch = task_ids[start:start + self.batch_size]
+            if self.bulk_delete_url:
+                response = self.request.post(self.bulk_delete_url, data={"ids": batch})
+                if response.ok:
+                    continue
+                if response.status not in (404, 405):
+                    self._check(response, "Bulk delete tasks")
+                self.bulk_delete_url = None  # server has no bulk endpoint; stop trying
+            for task_id in batch:
+                self.delete(task_id)
+
+
+class TaskDataLayer:
+    """Creates Task Board fixtures and removes everything it (or the UI tests) added.
+
+    The API is used when :attr:`TaskApi.available`. Otherwise (the live app exposes no task
+    endpoint) tasks are created and removed through ``ui``, a ``TaskBoardPage``.
+    """
+
+    def __init__(self, api: TaskApi, ui=None):
+        self.api = api
+        self.ui = ui
+        self.created_ids = []
+        self.ui_titles = set()
+
+    def create(self, title: str, column: int = 0) -> dict:
+        if not self.api.available:
+            return self._create_in_ui(title, column)
+        task = self.api.create(title, column)
+        self.created_ids.append(task["id"])
+        return task
+
+    def create_many(self, titles: list, column: int = 0) -> list:
+        if not self.api.available:
+            return [self._create_in_ui(title, column) for title in titles]
+        tasks = self.api.create_many(titles, column)
+        self.created_ids.extend(t["id"] for t in tasks)
+        return tasks
+
+    def _create_in_ui(self, title: str, column: int) -> dict:
+        if self.ui is None:
+            raise ApiError(f"Task API not available at {self.api.url} and no UI fallback given")
+        self.ui.visit(Config.TASKBOARD_URL)
+        self.ui.add_task_to_column(column, title)
+        self.track_title(title)
+        return {"id": None, "title": title, "column": column}
+
+    def move(self, task: dict, column: int) -> dict:
+        if not self.api.available:
+            raise ApiError(f"Task API not available at {self.api.url}; move the card with TaskBoardPage instead")
+        return self.api.move(task["id"], column)
+
+    def track_title(self, title: str):
+        """Registers a task created through the UI so teardown deletes it as well."""
+        self.ui_titles.add(title)
+
+    def teardown(self):
+        if self.api.available:
+            ids = set(self.created_ids)
+            if self.ui_titles:
+                ids.update(t["id"] for t in self.api.list() if t.get("title") in self.ui_titles)
+            self.api.delete_many(sorted(ids))
+        elif self.ui is not None and self.ui_titles:
+            self._delete_in_ui(self.ui_titles)
+        self.created_ids.clear()
+        self.ui_titles.clear()
+
+    def _delete_in_ui(self, titles):
+        """Best effort: a card a test already deleted or renamed is simply not there any more."""
+        self.ui.visit(Config.TASKBOARD_URL)
+        for title in sorted(titles):
+            try:
+                if self.ui.is_task_present(title):
+                    self.ui.delete_task_card(title)
+            except Exception as exc:
+                logger.warning("Could not delete task '%s' through the UI: %s", title, exc)
@@ -0,0 +1,122 @@
+import json
+import os
+import time
+from contextlib import contextmanager, suppress
+from urllib.parse import urlsplit
+
+from playwright.sync_api import Browser
+
+from pages.login_page import LoginPage
+from utils.config import Config
+
+
+class AuthStateCache:
+    """Logs in once and shares the saved storage state (cookies + localStorage) between contexts.
+
+    The state file is reused until it is older than ``max_age`` seconds or one of its
+    cookies expires. After a page lands back on the login screen (e.g. a logout test) the
+    state is only re-validated, and a new UI login happens just if it was really revoked.
+    """
+
+    EXPIRY_MARGIN = 60  # refresh a little before a cookie actually expires
+
+    def __init__(self, browser: Browser, path: str = None, max_age: int = Config.AUTH_STATE_TTL):
+        self.browser = browser
+        host = urlsplit(Config.BASE_URL).netloc.replace(":", "_") or "default"
+        self.path = path or os.path.join(Config.AUTH_STATE_DIR, f"{host}.json")
+        self.max_age = max_age
+        self.logins = 0
+        self._suspect = False
+
+    def storage_state(self) -> str:
+        """Returns the path of a valid storage state, logging in only when needed."""
+        if self.is_fresh() and not self._suspect:
+            return self.path
+        # Parallel workers share the state file, so only one of them logs in at a time
+        with self._lock():
+            if not self.is_fresh():
+                self.refresh()
+            elif self._suspect and not self.is_valid():
+                self.refresh()
+        self._suspect = False
+        return self.path
+
+    @contextmanager
+    def _lock(self, timeout: float = 120):
+        lock_path = self.path + ".lock"
+        os.makedirs(os.path.dirname(lock_path), exist_ok=True)
+        deadline = time.time() + timeout
+        while True:
+            try:
+                fd = os.open(lock_path, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+                break
+            except FileExistsError:
+                # A worker that died mid-login leaves the lock behind; take it over once stale
+                try:
+                    stale = time.time() - os.path.getmtime(lock_path) > timeout
+                except FileNotFoundError:
+                    continue
+                if stale or time.time() > deadline:
+                    with suppress(FileNotFoundError):
+                        os.remove(lock_path)
+                    continue
+                time.sleep(0.2)
+        try:
+            yield
+        finally:
+            os.close(fd)
+            os.remove(lock_path)
+
+    def is_fresh(self) -> bool:
+        if not os.path.exists(self.path):
+            return False
+        now = time.time()
+        if now - os.path.getmtime(self.path) > self.max_age:
+            return False
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                cookies = json.load(f).get("cookies", [])
+        except (OSError, ValueError):
+            return False
+        # Session cookies carry expires == -1 and live as long as the state file does
+        return all(c.get("expires", -1) < 0 or c["expires"] > now + self.EXPIRY_MARGIN for c in cookies)
+
+    def is_valid(self) -> bool:
+        """Opens the dashboard with the stored state and checks the user is still signed in."""
+        context = self.browser.new_context(storage_state=self.path)
+        try:
+            login_page = LoginPage(context.new_page())
+            login_page.visit(Config.BASE_URL)
+            return login_page.is_login_successful()
+        finally:
+            context.close()
+
+    def refresh(self):
+        """Performs the real UI login and writes the resulting storage state to disk."""
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        context = self.browser.new_context()
+        try:
+            login_page = LoginPage(context.new_page())
+            login_page.visit(Config.BASE_URL)
+            login_page.login(Config.TEST_EMAIL, Config.PASSWORD)
+            if not login_page.is_login_successful():
+                raise RuntimeError("Login failed while building the shared auth state.")
+            context.storage_state(path=self.path)
+            self.logins += 1
+        finally:
+            context.close()
+
+    def mark_suspect(self):
+        """Flags the state for re-validation before it is handed to the next context."""
+        self._suspect = True
+
+    def invalidate(self):
+        if os.path.exists(self.path):
+            os.remove(self.path)
+
+    def watch(self, page):
+        """Marks the state suspect whenever ``page`` ends up on the login form."""
+        def on_navigated(frame):
+            if frame == page.main_frame and "login" in frame.url.lower():
+                self.mark_suspect()
+        page.on("framenavigated", on_navigated)
@@ -0,0 +1,94 @@
+from collections import deque
+from contextlib import contextmanager
+
+from playwright.sync_api import Browser, BrowserContext
+
+from utils.config import Config
+
+
+class BrowserPool:
+    """Keeps browsers warm and hands out brand-new, isolated ``BrowserContext``s.
+
+    A context is never reused: after a test it is closed and a fresh spare is
+    pre-created in its place, so every test still starts with empty cookies,
+    storage and cache, while the browser process start is paid only once.
+    Browsers are relaunched after ``max_uses`` contexts to keep memory flat.
+    """
+
+    def __init__(self, browser: Browser, size: int = Config.BROWSER_POOL_SIZE,
+                 spares: int = Config.BROWSER_POOL_SPARES, max_uses: int = Config.BROWSER_POOL_MAX_USES,
+                 **launch_options):
+        self._launch_options = {"headless": Config.HEADLESS, **launch_options}
+        self._browser_type = browser.browser_type
+        self._owned = set()
+        self._browsers = [browser] + [self._launch() for _ in range(max(0, size - 1))]
+        self._uses = {id(b): 0 for b in self._browsers}
+        self._spare_count = spares
+        self._max_uses = max_uses
+        self._spares = deque()
+        self._top_up()
+
+    def _launch(self) -> Browser:
+        browser = self._browser_type.launch(**self._launch_options)
+        self._owned.add(id(browser))
+        return browser
+
+    def _pick_browser(self) -> Browser:
+        # Least busy browser first; a crashed one is relaunched in place
+        for i, browser in enumerate(self._browsers):
+            if not browser.is_connected():
+                self._browsers[i] = self._launch()
+                self._uses[id(self._browsers[i])] = 0
+        return min(self._browsers, key=lambda b: len(b.contexts))
+
+    def _recycle_worn_browsers(self):
+        for i, browser in enumerate(self._browsers):
+            if id(browser) not in self._owned or self._uses[id(browser)] < self._max_uses:
+                continue
+            # Idle spares do not keep a worn browser alive; _top_up re-creates them elsewhere
+            spares = [c for c in self._spares if c.browser is browser]
+            if len(browser.contexts) > len(spares):
+                continue    # still running a test
+            for context in spares:
+                self._spares.remove(context)
+                context.close()
+            browser.close()
+            self._owned.discard(id(browser))
+            self._browsers[i] = self._launch()
+            self._uses[id(self._browsers[i])] = 0
+
+    def _new_context(self, **options) -> BrowserContext:
+        browser = self._pick_browser()
+        self._uses[id(browser)] += 1
+        return browser.new_context(**options)
+
+    def _top_up(self):
+        while len(self._spares) < self._spare_count:
+            self._spares.append(self._new_context())
+
+    def acquire(self, **options) -> BrowserContext:
+        """Returns a fresh context; pre-warmed spares are used when no custom options are given."""
+        if self._spares and not options:
+            return self._spares.popleft()
+        return self._new_context(**options)
+
+    def release(self, context: BrowserContext):
+        context.close()
+        self._recycle_worn_browsers()
+        self._top_up()
+
+    @contextmanager
+    def context(self, **options):
+        context = self.acquire(**options)
+        try:
+            yield context
+        finally:
+            self.release(context)
+
+    def close(self):
+        while self._spares:
+            self._spares.popleft().close()
+        for browser in self._browsers:
+            if id(browser) in self._owned:
+                browser.close()
+        self._owned.clear()
@@ -0,0 +1,256 @@
+"""One Chromium per machine, shared by every pytest session and parallel worker.
+
+The Python API has no ``launch_server``, so the server is a Chromium process started with
+remote debugging. It is detached from the process that started it, and its CDP endpoint is
+recorded in ``Config.BROWSER_SERVER_FILE`` (one file per headless mode, so a headed and a
+headless session each keep their own server). Every process calls :meth:`BrowserServer.ensure`,
+which reuses a healthy server (``/json/version`` answers) or starts a new one under a lock, and
+then attaches with ``connect_over_cdp``. Each test module still gets its own fresh context. A
+server that crashed is replaced the next time anyone needs it, and :class:`SharedBrowser`
+reconnects on its own. A recorded PID is only signalled while its command line still names the
+server's profile directory, since after a reboot it may belong to an unrelated process.
+
+    python -m utils.browser_server start|status|stop
+"""
+import argparse
+import json
+import os
+import shutil
+import signal
+import subprocess
+import sys
+import tempfile
+import time
+import urllib.request
+
+from playwright.sync_api import sync_playwright
+
+from utils.config import Config
+
+
+class CdpBrowser:
+    """A Chromium process with remote debugging; any number of Playwright clients attach to it."""
+
+    def __init__(self, executable: str, headless: bool = True, detach: bool = False):
+        self.executable = executable
+        self.headless = headless
+        self.detach = detach   # keep running after this process exits (the machine-wide server)
+        self.endpoint = None
+        self.pid = None
+        self.profile_dir = None
+        self._process = None
+
+    def start(self, timeout_s: float = 30) -> "CdpBrowser":
+        self.profile_dir = tempfile.mkdtemp(prefix="rak-chromium-")
+        args = [self.executable, "--remote-debugging-port=0", f"--user-data-dir={self.profile_dir}",
+                "--no-first-run", "--no-default-browser-check", "about:blank"]
+        if self.headless:
+            args.insert(1, "--headless=new")
+        self._process = subprocess.Popen(args, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+                                         start_new_session=self.detach)
+        self.pid = self._process.pid
+        # Chromium writes the port it picked to DevToolsActivePort once it's listening
+        port_file = os.path.join(self.profile_dir, "DevToolsActivePort")
+        deadline = time.monotonic() + timeout_s
+        while time.monotonic() < deadline:
+            if self._process.poll() is not None:
+                raise RuntimeError(f"Chromium exited with code {self._process.returncode} during startup")
+            if os.path.exists(port_file):
+                with open(port_file) as f:
+                    port = f.readline().strip()
+                if port:
+                    self.endpoint = f"http://127.0.0.1:{port}"
+                    return self
+            time.sleep(0.05)
+        self.stop()
+        raise RuntimeError(f"Chromium did not open a debugging port within {timeout_s}s")
+
+    def stop(self):
+        if self._process and self._process.poll() is None:
+            self._process.terminate()
+            try:
+                self._process.wait(timeout=10)
+            except subprocess.TimeoutExpired:
+                self._process.kill()
+        if self.profile_dir:
+            shutil.rmtree(self.profile_dir, ignore_errors=True)
+
+
+def healthy(endpoint: str, timeout_s: float = 2.0) -> bool:
+    """True when the browser behind ``endpoint`` answers its DevTools version query."""
+    try:
+        with urllib.request.urlopen(f"{endpoint}/json/version", timeout=timeout_s) as response:
+            return response.status == 200 and "Browser" in json.load(response)
+    except (OSError, ValueError):
+        return False
+
+
+class FileLock:
+    """Cross-process lock via an exclusively created file; a lock older than ``stale_s`` is broken."""
+
+    def __init__(self, path: str, timeout_s: float = 60, stale_s: float = 60):
+        self.path = path
+        self.timeout_s = timeout_s
+        self.stale_s = stale_s
+
+    def __enter__(self):
+        deadline = time.monotonic() + self.timeout_s
+        while True:
+            try:
+                os.close(os.open(self.path, os.O_CREAT | os.O_EXCL | os.O_WRONLY))
+                return self
+            except FileExistsError:
+                try:
+                    if time.time() - os.path.getmtime(self.path) > self.stale_s:
+                        os.remove(self.path)
+                        continue
+                except OSError:
+                    continue
+                if time.monotonic() > deadline:
+                    raise TimeoutError(f"Timed out waiting for {self.path}")
+                time.sleep(0.1)
+
+    def __exit__(self, *exc):
+        try:
+            os.remove(self.path)
+        except OSError:
+            pass
+
+
+def command_line(pid: int):
+    """The process's command line, or None if it isn't running (or can't be inspected)."""
+    try:
+        with open(f"/proc/{pid}/cmdline", "rb") as f:
+            return f.read().replace(b"\0", b" ").decode(errors="replace")
+    except OSError:
+        pass
+    if os.name == "nt":
+        command = ["powershell", "-NoProfile", "-Command",
+                   f"(Get-CimInstance Win32_Process -Filter 'ProcessId={int(pid)}').CommandLine"]
+    else:
+        command = ["ps", "-p", str(int(pid)), "-o", "command="]
+    try:
+        output = subprocess.run(command, capture_output=True, text=True, timeout=10).stdout.strip()
+    except (OSError, subprocess.SubprocessError):
+        return None
+    return output or None
+
+
+class BrowserServer:
+    def __init__(self, state_file: str = None, headless: bool = None):
+        self.headless = Config.HEADLESS if headless is None else headless
+        root, extension = os.path.splitext(state_file or Config.BROWSER_SERVER_FILE)
+        self.state_file = f"{root}-{'headless' if self.headless else 'headed'}{extension}"
+        self.restarts = 0
+
+    def state(self):
+        try:
+            with open(self.state_file, encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    @staticmethod
+    def usable(state) -> bool:
+        return bool(state) and healthy(state["endpoint"])
+
+    def ensure(self, executable: str) -> str:
+        """Endpoint of a healthy shared browser, starting (or replacing) one if needed."""
+        state = self.state()
+        if self.usable(state):
+            return state["endpoint"]
+        os.makedirs(os.path.dirname(self.state_file), exist_ok=True)
+        with FileLock(self.state_file + ".lock"):
+            state = self.state()  # another process may have started one while we waited
+            if self.usable(state):
+                return state["endpoint"]
+            if state:
+                self._terminate(state)
+                self.restarts += 1
+            browser = CdpBrowser(executable, self.headless, detach=True).start()
+            state = {"endpoint": browser.endpoint, "pid": browser.pid, "profile_dir": browser.profile_dir,
+                     "headless": self.headless, "started": time.time()}
+            tmp = f"{self.state_file}.{os.getpid()}.tmp"
+            with open(tmp, "w", encoding="utf-8") as f:
+                json.dump(state, f)
+            os.replace(tmp, self.state_file)
+            return browser.endpoint
+
+    def stop(self) -> bool:
+        with FileLock(self.state_file + ".lock"):
+            state = self.state()
+            if not state:
+                return False
+            self._terminate(state)
+            os.remove(self.state_file)
+            return True
+
+    @staticmethod
+    def _terminate(state: dict):
+        profile_dir = state.get("profile_dir")
+        pid = state.get("pid")
+        if not profile_dir:
+            return  # nothing identifies the server's process; never signal a bare PID
+        if pid and profile_dir in (command_line(pid) or ""):
+            try:
+                os.kill(pid, signal.SIGTERM)
+                time.sleep(0.2)
+            except OSError:
+                pass  # exited in the meantime
+        # Otherwise it's already gone (crashed, or the machine rebooted and the PID was reused)
+        shutil.rmtree(profile_dir, ignore_errors=True)
+
+
+class SharedBrowser:
+    """Stands in for a ``Browser``: attached to the shared server, reconnecting if it went away.
+
+    Every attribute is looked up on the live connection, so fixtures and helpers use it exactly
+    like a launched browser. ``close()`` only disconnects; the server keeps running.
+    """
+
+    def __init__(self, playwright, server: BrowserServer = None):
+        self._browser_type = playwright.chromium
+        self._server = server or BrowserServer()
+        self._browser = None
+        self.connects = 0
+
+    def current(self):
+        if self._browser is None or not self._browser.is_connected():
+            endpoint = self._server.ensure(self._browser_type.executable_path)
+            self._browser = self._browser_type.connect_over_cdp(endpoint)
+            self.connects += 1
+        return self._browser
+
+    def __getattr__(self, name):
+        return getattr(self.current(), name)
+
+    def close(self):
+        if self._browser is not None and self._browser.is_connected():
+            self._browser.close()
+        self._browser = None
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Manage the machine-wide shared Chromium.")
+    parser.add_argument("command", choices=["start", "status", "stop"])
+    parser.add_argument("--headed", action="store_true", help="The headed server (default: the HEADLESS setting's)")
+    args = parser.parse_args(argv)
+    server = BrowserServer(headless=False if args.headed else None)
+    if args.command == "start":
+        with sync_playwright() as p:
+            print(server.ensure(p.chromium.executable_path))
+    elif args.command == "status":
+        state = server.state()
+        if not state:
+            print("not running")
+            return 1
+        alive = healthy(state["endpoint"])
+        print(f"{state['endpoint']} pid {state['pid']} — {'healthy' if alive else 'not responding'}")
+        return 0 if alive else 1
+    else:
+        print("stopped" if server.stop() else "not running")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,8 +1,10 @@
 import os
+import tempfile
 from dotenv import load_dotenv
 
 # Force .env to load from the root directory of the project
-env_path = os.path.join(os.path.dirname(os.path.dirname(__file__)), '.env')
+ROOT_DIR = os.path.dirname(os.path.dirname(__file__))
+env_path = os.path.join(ROOT_DIR, '.env')
 load_dotenv(dotenv_path=env_path)
 
 class Config:
@@ -12,3 +14,72 @@ class Config:
     TASKBOARD_URL = f"{BASE_URL}scrumboard/kanban"
     TEST_EMAIL = os.getenv("TEST_EMAIL")
     PASSWORD = os.getenv("PASSWORD")
+    HEADLESS = os.getenv("HEADLESS", "false").lower() == "true"
+
+    @classmethod
+    def point_to(cls, base_url: str):
+        """Re-targets the suite at another server (e.g. the local stand-in) at runtime."""
+        cls.BASE_URL = base_url if base_url.endswith("/") else base_url + "/"
+        cls.PIPELINE_URL = f"{cls.BASE_URL}pipeline"
+        cls.PORTFOLIO_URL = f"{cls.BASE_URL}portfolio"
+        cls.TASKBOARD_URL = f"{cls.BASE_URL}scrumboard/kanban"
+
+    # Session-wide login cache (cookies + localStorage) shared by every browser context
+    # (one file per target host, so live and stand-in runs never share cookies)
+    AUTH_STATE_DIR = os.getenv("AUTH_STATE_DIR", os.path.join(ROOT_DIR, ".auth"))
+    AUTH_STATE_TTL = int(os.getenv("AUTH_STATE_TTL", "1800"))  # seconds
+
+    # --shared-browser: where the machine-wide Chromium's CDP endpoint is recorded; "-headless"/"-headed" is added per mode
+    BROWSER_SERVER_FILE = os.getenv("BROWSER_SERVER_FILE",
+                                    os.path.join(tempfile.gettempdir(), "rak-wbg-browser-server.json"))
+
+    # Warm browser/context pool used by tests that need a clean, unauthenticated session
+    BROWSER_POOL_SIZE = int(os.getenv("BROWSER_POOL_SIZE", "1"))
+    BROWSER_POOL_SPARES = int(os.getenv("BROWSER_POOL_SPARES", "1"))
+    BROWSER_POOL_MAX_USES = int(os.getenv("BROWSER_POOL_MAX_USES", "200"))
+
+    # Network record/replay (--record / --replay); None archives every request
+    HAR_URL_PATTERN = os.getenv("HAR_URL_PATTERN") or None
+    REPLAY_PASSTHROUGH = os.getenv("REPLAY_PASSTHROUGH", "false").lower() == "true"
+
+    # Task Board HTTP API used for test-data setup/teardown; probed once, an empty path or no answer means
+    # tasks are created through the UI instead (the live app has no such endpoint, the stand-in server does)
+    TASKS_API_PATH = os.getenv("TASKS_API_PATH", "api/tasks")
+    TASKS_BULK_DELETE_PATH = os.getenv("TASKS_BULK_DELETE_PATH", "api/tasks/bulk-delete")
+    TASKS_BATCH_SIZE = int(os.getenv("TASKS_BATCH_SIZE", "50"))
+
+    # Bounded LRU for filled-in parameterised selectors and per-page Locator objects
+    LOCATOR_CACHE_SIZE = int(os.getenv("LOCATOR_CACHE_SIZE", "256"))
+
+    # Streaming results sink (report_stream in pytest.ini); older runs are rolled into history.json
+    REPORT_STREAM_DIR = os.getenv("REPORT_STREAM_DIR", os.path.join(ROOT_DIR, "reports", "stream"))
+    REPORT_KEEP_RUNS = int(os.getenv("REPORT_KEEP_RUNS", "20"))
+
+    # Failure artifacts (screenshot, DOM, console and network logs); 0 MB turns capture off
+    FAILURE_ARTIFACTS_MAX_MB = float(os.getenv("FAILURE_ARTIFACTS_MAX_MB", "50"))
+    FAILURE_LOG_ENTRIES = int(os.getenv("FAILURE_LOG_ENTRIES", "200"))
+    FAILURE_COMPRESS_KB = int(os.getenv("FAILURE_COMPRESS_KB", "64"))
+    FAILURE_JPEG_QUALITY = int(os.getenv("FAILURE_JPEG_QUALITY", "80"))
+
+    # --trace-failures: per-test trace chunks kept on disk (the failing test plus the ones before it)
+    TRACE_RING_SIZE = int(os.getenv("TRACE_RING_SIZE", "3"))
+
+    # Flaky tests (flaky_retries in pytest.ini): retry time per process, and when a test is quarantined
+    FLAKY_RETRY_BUDGET_S = float(os.getenv("FLAKY_RETRY_BUDGET_S", "300"))
+    FLAKY_HISTORY_FILE = os.getenv("FLAKY_HISTORY_FILE", os.path.join(ROOT_DIR, "reports", "flaky_history.json"))
+    FLAKY_WINDOW = int(os.getenv("FLAKY_WINDOW", "20"))          # latest runs a flip rate is taken over
+    FLAKY_MIN_RUNS = int(os.getenv("FLAKY_MIN_RUNS", "5"))
+    FLAKY_THRESHOLD = float(os.getenv("FLAKY_THRESHOLD", "0.2"))  # share of consecutive outcomes that flip
+
+    # Visual checks (BasePage.check_visual): content-addressed baselines, and how far a region may drift
+    VISUAL_BASELINE_DIR = os.getenv("VISUAL_BASELINE_DIR", os.path.join(ROOT_DIR, "visual_baselines"))
+    VISUAL_HASH_DISTANCE = int(os.getenv("VISUAL_HASH_DISTANCE", "0"))        # differing perceptual-hash bits
+    VISUAL_PIXEL_TOLERANCE = int(os.getenv("VISUAL_PIXEL_TOLERANCE", "16"))   # per channel, 0-255
+    VISUAL_MAX_CHANGED_PIXELS = int(os.getenv("VISUAL_MAX_CHANGED_PIXELS", "20"))  # past the tolerance
+    VISUAL_SSIM_MIN = float(os.getenv("VISUAL_SSIM_MIN", "0.98"))
+
+    # Responsive checks (viewport_matrix fixture): viewports opened side by side, from utils.viewports.VIEWPORTS
+    VIEWPORT_MATRIX = [v.strip() for v in os.getenv("VIEWPORT_MATRIX", "mobile,tablet,desktop").split(",") if v.strip()]
+
+    # Parsed allure-results summaries for history-driven ordering (history_schedule in pytest.ini)
+    TEST_HISTORY_CACHE = os.getenv("TEST_HISTORY_CACHE", os.path.join(ROOT_DIR, "reports", "test_history.json"))
@@ -0,0 +1,181 @@
+"""Failure artifacts: screenshot, DOM, console log and recent network log of a failed test.
+
+Passing tests pay only for two ring buffers per page (console messages and responses,
+``FAILURE_LOG_ENTRIES`` each), filled from events Playwright delivers anyway. When a test fails,
+the screenshot and DOM are taken on the test thread (the sync API is not thread-safe) and the
+Allure attachment entries are registered straight away. Encoding, gzip of large DOMs and every
+file write happen on one background thread, overlapping with teardown and the next test.
+``FAILURE_ARTIFACTS_MAX_MB`` caps the bytes written per run; artifacts past the cap are dropped
+and the test gets a note saying so.
+"""
+import gzip
+import json
+import os
+import threading
+import time
+import uuid
+import weakref
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+
+import allure
+import allure_commons
+from allure_commons.model2 import Attachment
+
+from utils.config import Config
+
+
+class PageLog:
+    """Most recent console messages and network responses of one page."""
+
+    def __init__(self, page, size: int):
+        self.console = deque(maxlen=size)
+        self.network = deque(maxlen=size)
+        page.on("console", lambda msg: self.console.append((time.time(), msg.type, msg.text)))
+        page.on("pageerror", lambda error: self.console.append((time.time(), "pageerror", str(error))))
+        # Response attributes are already on the Python side: no extra round trips to the browser
+        page.on("response", lambda response: self.network.append(
+            (time.time(), response.request.method, response.status, response.url)))
+        page.on("requestfailed", lambda request: self.network.append(
+            (time.time(), request.method, request.failure or "failed", request.url)))
+
+    def console_text(self) -> str:
+        return "\n".join(f"{_clock(ts)} [{kind}] {text}" for ts, kind, text in self.console)
+
+    def network_text(self) -> str:
+        return "\n".join(f"{_clock(ts)} {method} {status} {url}" for ts, method, status, url in self.network)
+
+
+def _clock(timestamp: float) -> str:
+    return time.strftime("%H:%M:%S", time.localtime(timestamp)) + f".{int(timestamp % 1 * 1000):03d}"
+
+
+class FailureArtifacts:
+    def __init__(self, max_bytes: int = None, log_entries: int = None, compress_bytes: int = None):
+        self.max_bytes = int(Config.FAILURE_ARTIFACTS_MAX_MB * 1024 * 1024) if max_bytes is None else max_bytes
+        self.log_entries = Config.FAILURE_LOG_ENTRIES if log_entries is None else log_entries
+        self.compress_bytes = Config.FAILURE_COMPRESS_KB * 1024 if compress_bytes is None else compress_bytes
+        self.reserved = 0       # bytes promised to queued artifacts (raw size until written)
+        self.written = 0
+        self.dropped = 0
+        self.captured = 0
+        self._lock = threading.Lock()
+        self._logs = weakref.WeakKeyDictionary()
+        self._executor = None
+        self._pending = []
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_bytes > 0
+
+    def watch(self, page):
+        if self.enabled and page not in self._logs:
+            self._logs[page] = PageLog(page, self.log_entries)
+
+    # --- Capture (test thread) ------------------------------------------------------------
+
+    def capture(self, page, allure_logger=None, sink=None):
+        """Grabs the page's state now; compression and writing are queued for the background thread."""
+        if not self.enabled or page.is_closed():
+            return
+        self.captured += 1
+        artifacts = []
+        try:
+            artifacts.append(("Failure screenshot", page.screenshot(type="jpeg", quality=Config.FAILURE_JPEG_QUALITY),
+                              "image/jpeg", "jpg"))
+        except Exception as e:  # a crashed or navigating page must not hide the original failure
+            artifacts.append(("Failure screenshot (unavailable)", str(e), "text/plain", "txt"))
+        try:
+            dom = page.content()
+            artifacts.append(("DOM snapshot", dom, "text/html", "html"))
+        except Exception:
+            pass
+        log = self._logs.get(page)
+        if log:
+            artifacts.append(("Console log", log.console_text() or "(no console output)", "text/plain", "txt"))
+            artifacts.append(("Network log", log.network_text() or "(no responses)", "text/plain", "txt"))
+        artifacts.append(("Page", json.dumps({"url": page.url, "viewport": page.viewport_size}), "application/json",
+                          "json"))
+
+        skipped = []
+        for name, body, mime, extension in artifacts:
+            size = len(body)
+            compress = mime == "text/html" and size > self.compress_bytes
+            if compress:
+                name, mime, extension = f"{name} (gzip)", "application/gzip", "html.gz"
+            if not self._reserve(size):
+                skipped.append(name)
+                continue
+            targets = self._targets(name, mime, extension, allure_logger, sink)
+            self._submit(body, compress, targets, size)
+        if skipped:
+            self.dropped += len(skipped)
+            allure.attach(f"FAILURE_ARTIFACTS_MAX_MB={Config.FAILURE_ARTIFACTS_MAX_MB} reached; dropped: "
+                          + ", ".join(skipped), name="Failure artifacts capped",
+                          attachment_type=allure.attachment_type.TEXT)
+
+    def _reserve(self, size: int) -> bool:
+        with self._lock:
+            if self.written + self.reserved + size > self.max_bytes:
+                return False
+            self.reserved += size
+            return True
+
+    @staticmethod
+    def _targets(name, mime, extension, allure_logger, sink) -> list:
+        """Registers the attachment with Allure (and the streaming sink) now; the file follows later."""
+        targets = []
+        if allure_logger is not None:
+            test = allure_logger.get_test(None)
+            if test is not None:
+                file_name = f"{uuid.uuid4()}-attachment.{extension}"
+                test.attachments.append(Attachment(name=name, source=file_name, type=mime))
+                targets.append(("allure", file_name))
+        if sink is not None:
+            path = sink.reserve(name, extension)
+            if path:
+                targets.append(("file", path))
+        return targets
+
+    def _submit(self, body, compress, targets, size):
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="failure-artifacts")
+        self._pending.append(self._executor.submit(self._write, body, compress, targets, size))
+
+    # --- Background thread ----------------------------------------------------------------
+
+    def _write(self, body, compress, targets, size):
+        data = body.encode("utf-8") if isinstance(body, str) else body
+        if compress:
+            data = gzip.compress(data, compresslevel=6)
+        for kind, destination in targets:
+            if kind == "allure":
+                allure_commons.plugin_manager.hook.report_attached_data(body=data, file_name=destination)
+            else:
+                os.makedirs(os.path.dirname(destination), exist_ok=True)
+                with open(destination + ".tmp", "wb") as f:
+                    f.write(data)
+                os.replace(destination + ".tmp", destination)
+        with self._lock:
+            self.reserved -= size
+            self.written += len(data)
+
+    def flush(self, timeout: float = 60):
+        """Waits for queued artifacts; call before anything reads the results directories."""
+        deadline = time.monotonic() + timeout
+        for future in self._pending:
+            future.result(timeout=max(0.0, deadline - time.monotonic()))
+        self._pending = []
+
+    def close(self):
+        if self._executor is not None:
+            self.flush()
+            self._executor.shutdown()
+            self._executor = None
+
+    def describe(self) -> str:
+        return (f"{self.captured} failure(s) captured, {self.written / 1024:.0f} KB written"
+                + (f", {self.dropped} artifact(s) dropped by the size cap" if self.dropped else ""))
+
+
+failure_artifacts = FailureArtifacts()
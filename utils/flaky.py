@@ -0,0 +1,248 @@
+"""Bounded retries for failing tests, and a quarantine for the ones that keep flipping.
+
+Retries are opt-in: with ``--retries N`` (or ``flaky_retries`` in pytest.ini, 0 by default) a test
+that fails in setup or call is run again, up to N times. Only that test is re-run, not its module.
+Between attempts only the test's own (function-scoped) fixtures are torn down and set up again, so
+a function-scoped ``page`` is fresh for the retry, while the module's ``page`` is kept even for the
+last test of a module: most tests carry on from the page the previous test left behind. Before each
+retry the module page is sent back to the URL it showed when the first attempt started; a test that
+closed it is not retried. Once the test is done, whatever the next test doesn't share is torn down
+as usual. Retries stop for good once this process has spent ``FLAKY_RETRY_BUDGET_S`` seconds on
+them. The failed attempt is reported as ``rerun`` (``R``).
+
+Every run appends one letter per test to ``Config.FLAKY_HISTORY_FILE``: ``P`` passed, ``F`` failed,
+``R`` failed and then passed on a retry. A flip is a change from fail to pass or back, the one
+inside an ``R`` included. A test with at least ``FLAKY_MIN_RUNS`` runs whose flip rate (share of
+consecutive outcomes that flip) reaches ``FLAKY_THRESHOLD`` is quarantined. It still runs, but non-blocking (xfail) and without retries,
+and it leaves the quarantine once its flip rate drops back. ``--quarantine skip`` and
+``--quarantine only`` split quarantined tests into a lane of their own.
+
+    python -m utils.flaky           # flip rates, quarantined tests first
+"""
+import json
+import os
+import sys
+import time
+
+import pytest
+from _pytest.runner import call_and_report
+
+from utils.browser_server import FileLock
+from utils.config import Config
+
+
+def flip_rate(results: str) -> float:
+    """Share of consecutive outcomes in ``"PPRFP"``-style results that flip; an ``R`` is a fail then a pass."""
+    sequence = "".join("FP" if r == "R" else r for r in results)
+    if len(sequence) < 2:
+        return 0.0
+    return sum(a != b for a, b in zip(sequence, sequence[1:])) / (len(sequence) - 1)
+
+
+class FlakyHistory:
+    def __init__(self, path: str = None):
+        self.path = path or Config.FLAKY_HISTORY_FILE
+        self.results = {}   # nodeid -> "PFR...", oldest first, at most FLAKY_WINDOW runs
+
+    @classmethod
+    def load(cls, path: str = None) -> "FlakyHistory":
+        history = cls(path)
+        try:
+            with open(history.path, encoding="utf-8") as f:
+                history.results = json.load(f).get("results", {})
+        except (OSError, ValueError):
+            pass
+        return history
+
+    def flip_rate(self, nodeid: str) -> float:
+        return flip_rate(self.results.get(nodeid, ""))
+
+    def quarantined(self, nodeid: str) -> bool:
+        return (len(self.results.get(nodeid, "")) >= Config.FLAKY_MIN_RUNS
+                and self.flip_rate(nodeid) >= Config.FLAKY_THRESHOLD)
+
+    def save(self, outcomes: dict):
+        """Appends this run's letters; re-read under a lock so parallel workers don't drop each other's."""
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        with FileLock(self.path + ".lock"):
+            results = FlakyHistory.load(self.path).results
+            for nodeid, outcome in outcomes.items():
+                results[nodeid] = (results.get(nodeid, "") + outcome)[-Config.FLAKY_WINDOW:]
+            tmp = f"{self.path}.{os.getpid()}.tmp"
+            with open(tmp, "w", encoding="utf-8") as f:
+                json.dump({"updated": time.time(), "results": results}, f, indent=1, sort_keys=True)
+            os.replace(tmp, self.path)
+        self.results = results
+
+
+def _first_failure(reports: list):
+    return next((r for r in reports if r.when in ("setup", "call") and r.failed), None)
+
+
+class FlakyTests:
+    """pytest plugin (registered in conftest): retries, the quarantine lane and this run's flip letters."""
+
+    def __init__(self):
+        self.retries = 0
+        self.lane = "run"
+        self.spent_s = 0.0      # kept across sessions: a parallel worker runs one session per module
+        self.rerun = 0
+        self.recovered = []     # nodeids that passed on a retry
+        self.out_of_budget = 0  # failures not retried because the budget was used up
+        self.quarantined = {}   # nodeid -> flip rate when the session started
+        self.history = FlakyHistory()
+        self.outcomes = {}      # nodeid -> P/F/R for this session
+        self._retried = set()
+        self._start = {}        # nodeid -> URL its page showed when the first attempt started
+
+    def configure(self, retries: int, lane: str):
+        self.retries, self.lane = retries, lane
+        self.history = FlakyHistory.load()
+        self.outcomes, self._retried, self.quarantined, self._start = {}, set(), {}, {}
+
+    def pytest_collection_modifyitems(self, config, items):
+        for item in items:
+            if self.history.quarantined(item.nodeid):
+                rate = self.quarantined[item.nodeid] = self.history.flip_rate(item.nodeid)
+                item.add_marker(pytest.mark.quarantine)
+                item.add_marker(pytest.mark.xfail(reason=f"quarantined as flaky (flip rate {rate:.0%})", strict=False))
+        if self.lane != "run":
+            wanted = self.lane == "only"
+            deselected = [item for item in items if (item.nodeid in self.quarantined) != wanted]
+            if deselected:
+                config.hook.pytest_deselected(items=deselected)
+                items[:] = [item for item in items if (item.nodeid in self.quarantined) == wanted]
+
+    @pytest.hookimpl(tryfirst=True)
+    def pytest_runtest_call(self, item):
+        page = (item.funcargs or {}).get("page")
+        if self.retries > 0 and page is not None and item.nodeid not in self._start:
+            self._start[item.nodeid] = page.url
+
+    @pytest.hookimpl(tryfirst=True)
+    def pytest_runtest_protocol(self, item, nextitem):
+        if self.retries <= 0 or item.get_closest_marker("quarantine"):
+            return None
+        item.ihook.pytest_runtest_logstart(nodeid=item.nodeid, location=item.location)
+        for attempt in range(1, self.retries + 2):
+            reports, retry = self._attempt(item, nextitem, attempt)
+            if not retry:
+                break
+            failure = _first_failure(reports)
+            self.rerun += 1
+            self._retried.add(item.nodeid)
+            for report in reports:
+                if report is failure:
+                    report.outcome = "rerun"
+                item.ihook.pytest_runtest_logreport(report=report)
+            reason = (failure.longreprtext.strip().splitlines() or [""])[-1]
+            item.user_properties.append(("flaky_retry", f"attempt {attempt} failed in {failure.when}: {reason}"))
+        for report in reports:
+            item.ihook.pytest_runtest_logreport(report=report)
+        item.ihook.pytest_runtest_logfinish(nodeid=item.nodeid, location=item.location)
+        return True
+
+    def _attempt(self, item, nextitem, attempt: int) -> tuple:
+        """One setup/call/teardown, as ``runtestprotocol`` runs it; (reports, whether to retry).
+
+        The retry decision is taken before the teardown: a test that will be retried only has its
+        own fixtures torn down, so its module's (the shared ``page`` above all) stay up for the retry.
+        """
+        if hasattr(item, "_request") and not item._request:
+            item._initrequest()     # a retry: the previous attempt dropped the fixture request
+        try:
+            started = time.monotonic()
+            reports = [call_and_report(item, "setup", log=False)]
+            if reports[0].passed:
+                reports.append(call_and_report(item, "call", log=False))
+            retry = self._should_retry(item, reports, attempt, time.monotonic() - started)
+            reports.append(call_and_report(item, "teardown", log=False, nextitem=item.parent if retry else nextitem))
+        finally:
+            if hasattr(item, "_request"):
+                item._request = False
+                item.funcargs = None
+        return reports, retry
+
+    def _should_retry(self, item, reports: list, attempt: int, elapsed: float) -> bool:
+        if _first_failure(reports) is None or attempt > self.retries:
+            return False
+        if item.session.shouldfail or item.session.shouldstop:
+            return False
+        if self.spent_s + elapsed > Config.FLAKY_RETRY_BUDGET_S:
+            self.out_of_budget += 1
+            return False
+        if not self._restore_page(item):
+            return False
+        self.spent_s += elapsed
+        return True
+
+    def _restore_page(self, item) -> bool:
+        """Puts the module's page back where the test found it; False when it can't be retried there."""
+        page = (item.funcargs or {}).get("page")
+        if page is None or self._page_scope(item) == "function":
+            return True     # no shared page (async and matrix tests), or the retry gets a new one
+        if page.is_closed():
+            return False
+        url = self._start.get(item.nodeid)
+        try:
+            if url and url != page.url and url != "about:blank":
+                page.goto(url)
+        except Exception:
+            return False
+        return True
+
+    @staticmethod
+    def _page_scope(item):
+        definitions = item._fixtureinfo.name2fixturedefs.get("page")
+        return definitions[-1].scope if definitions else None
+
+    def pytest_report_teststatus(self, report):
+        if report.outcome == "rerun":
+            return "rerun", "R", ("RERUN", {"yellow": True})
+        return None
+
+    def pytest_runtest_logreport(self, report):
+        if report.when not in ("setup", "call") or report.outcome == "rerun":
+            return
+        nodeid = report.nodeid
+        xfailed = report.skipped and hasattr(report, "wasxfail")
+        if report.failed or (xfailed and nodeid in self.quarantined):
+            self.outcomes[nodeid] = "F"
+        elif report.when == "call" and report.passed:
+            self.outcomes.setdefault(nodeid, "R" if nodeid in self._retried else "P")
+
+    def save(self):
+        self.recovered.extend(nodeid for nodeid, outcome in self.outcomes.items() if outcome == "R")
+        if self.outcomes:
+            self.history.save(self.outcomes)
+
+    def describe(self) -> str:
+        lines = []
+        if self.rerun:
+            lines.append(f"{self.rerun} retry(ies), {len(self.recovered)} test(s) passed on a retry; "
+                         f"{self.spent_s:.1f}s of the {Config.FLAKY_RETRY_BUDGET_S:.0f}s retry budget used")
+        if self.out_of_budget:
+            lines.append(f"{self.out_of_budget} failure(s) not retried: retry budget used up")
+        lines.extend(f"passed on a retry: {nodeid}" for nodeid in self.recovered)
+        lines.extend(f"quarantined (non-blocking): {nodeid} (flip rate {rate:.0%})"
+                     for nodeid, rate in self.quarantined.items())
+        return "\n".join(lines)
+
+
+flaky_tests = FlakyTests()
+
+
+def main() -> int:
+    history = FlakyHistory.load()
+    if not history.results:
+        print(f"no history in {history.path}")
+        return 0
+    rows = sorted(history.results, key=lambda n: (not history.quarantined(n), -history.flip_rate(n), n))
+    for nodeid in rows:
+        mark = "Q" if history.quarantined(nodeid) else " "
+        print(f"{mark} {history.flip_rate(nodeid):4.0%}  {history.results[nodeid]:<{Config.FLAKY_WINDOW}}  {nodeid}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
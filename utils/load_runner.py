@@ -0,0 +1,246 @@
+"""Load generation: the page-object flows as scripted journeys, driven by concurrent virtual users.
+
+Virtual users are coroutines on one ``playwright.async_api`` driver, running on its own event
+loop thread (so a session that already uses the sync API can start a run). A few Chromium
+processes are launched from that driver, and every user works in a fresh context on one of
+them. Users start spread over the ramp-up window and pause a random think time between steps.
+
+    python -m utils.load_runner --users 50 --browsers 4 --ramp-up 30 --journey pipeline --journey portfolio
+    python -m utils.load_runner --users 10 --base-url http://127.0.0.1:8765/ --json reports/load.json
+
+Works against any ``Config.BASE_URL``; ``tests/test_load.py`` runs it against a ``StubServer``.
+"""
+import argparse
+import asyncio
+import json
+import math
+import os
+import random
+import sys
+import time
+from dataclasses import asdict, dataclass
+
+from playwright.async_api import async_playwright
+
+from pages.aio import AsyncLoginPage, AsyncPipelinePage, AsyncPortfolioPage
+from utils.aio import LoopThread
+from utils.config import Config
+
+RM_SEARCHES = ["Martin", "Clarke", "Aisha", "Nonexistent RM"]
+FACILITY_SEARCHES = ["RCF", "Term Loan", "Overdraft", "Nonexistent Facility"]
+PORTFOLIO_LEVELS = ["Region Level", "WBG Level"]
+
+
+@dataclass
+class LoadProfile:
+    users: int = 10
+    browsers: int = 2
+    ramp_up_s: float = 10.0
+    think_time_s: tuple = (0.5, 2.0)
+    iterations: int = 1
+
+
+@dataclass
+class StepResult:
+    journey: str
+    step: str
+    user: int
+    elapsed_ms: float
+    ok: bool
+    error: str = None
+
+
+class UserSession:
+    """What a journey sees: the user's page, a timed ``step()`` and ``think()`` pauses."""
+
+    def __init__(self, page, user: int, journey: str, results: list, base_url: str,
+                 username: str, password: str, think_time_s: tuple, rnd: random.Random):
+        self.page = page
+        self.user = user
+        self.journey = journey
+        self.results = results
+        self.base_url = base_url.rstrip("/") + "/"
+        self.username = username
+        self.password = password
+        self.think_time_s = think_time_s
+        self.rnd = rnd
+
+    def url(self, path: str = "") -> str:
+        return self.base_url + path.lstrip("/")
+
+    async def step(self, name: str, action):
+        """Times ``await action()``; an exception or an explicit ``False`` counts as an error and ends the iteration."""
+        start = time.perf_counter()
+        try:
+            result = await action()
+            if result is False:
+                raise AssertionError(f"{name} reported failure")
+        except Exception as exc:
+            self.results.append(StepResult(self.journey, name, self.user, (time.perf_counter() - start) * 1000,
+                                           False, f"{type(exc).__name__}: {str(exc).splitlines()[0] if str(exc) else ''}"))
+            raise
+        self.results.append(StepResult(self.journey, name, self.user, (time.perf_counter() - start) * 1000, True))
+        return result
+
+    async def think(self):
+        low, high = self.think_time_s
+        if high > 0:
+            await asyncio.sleep(self.rnd.uniform(low, high))
+
+    async def login(self) -> bool:
+        login = AsyncLoginPage(self.page)
+        await login.visit(self.base_url)    # the app shows the form at its root, as utils.auth does
+        await login.login(self.username, self.password)
+        return await login.is_login_successful()
+
+
+async def pipeline_journey(session: UserSession):
+    pipeline = AsyncPipelinePage(session.page)
+    await session.step("login", session.login)
+    await session.think()
+    await session.step("open pipeline", lambda: pipeline.visit(session.url("pipeline")))
+    await session.think()
+    await session.step("search_rm", lambda: pipeline.search_rm(session.rnd.choice(RM_SEARCHES)))
+
+
+async def portfolio_journey(session: UserSession):
+    portfolio = AsyncPortfolioPage(session.page)
+    await session.step("login", session.login)
+    await session.think()
+    await session.step("open portfolio", lambda: portfolio.visit(session.url("portfolio")))
+    await session.think()
+    await session.step("search_facility", lambda: portfolio.search_facility(session.rnd.choice(FACILITY_SEARCHES)))
+    await session.think()
+    await session.step("select_dropdown_option",
+                       lambda: portfolio.select_dropdown_option(session.rnd.choice(PORTFOLIO_LEVELS)))
+
+
+JOURNEYS = {"pipeline": pipeline_journey, "portfolio": portfolio_journey}
+
+
+def percentile(values: list, pct: float) -> float:
+    """Nearest-rank percentile."""
+    ordered = sorted(values)
+    return ordered[max(0, math.ceil(pct / 100 * len(ordered)) - 1)]
+
+
+class LoadReport:
+    def __init__(self, results: list, profile: LoadProfile, duration_s: float):
+        self.results = results
+        self.profile = profile
+        self.duration_s = duration_s
+
+    @property
+    def error_rate(self) -> float:
+        return sum(not r.ok for r in self.results) / len(self.results) if self.results else 0.0
+
+    def stats(self) -> list:
+        groups = {}
+        for result in self.results:
+            groups.setdefault((result.journey, result.step), []).append(result)
+        rows = []
+        for (journey, step), results in groups.items():
+            timings = [r.elapsed_ms for r in results if r.ok] or [0.0]
+            errors = [r for r in results if not r.ok]
+            rows.append({
+                "journey": journey, "step": step, "count": len(results), "errors": len(errors),
+                "error_rate": len(errors) / len(results), "p50_ms": round(percentile(timings, 50), 1),
+                "p95_ms": round(percentile(timings, 95), 1), "p99_ms": round(percentile(timings, 99), 1),
+                "max_ms": round(max(timings), 1), "first_error": errors[0].error if errors else None,
+            })
+        return rows
+
+    def table(self) -> str:
+        lines = [f"{self.profile.users} users on {self.profile.browsers} browser(s), {len(self.results)} steps "
+                 f"in {self.duration_s:.1f}s, error rate {self.error_rate:.1%}",
+                 f"{'journey':<10} {'step':<24} {'count':>5} {'err%':>6} {'p50':>8} {'p95':>8} {'p99':>8}"]
+        for row in self.stats():
+            lines.append(f"{row['journey']:<10} {row['step']:<24} {row['count']:>5} {row['error_rate']:>6.1%} "
+                         f"{row['p50_ms']:>8.0f} {row['p95_ms']:>8.0f} {row['p99_ms']:>8.0f}")
+            if row["first_error"]:
+                lines.append(f"{'':<10} first error: {row['first_error']}")
+        return "\n".join(lines)
+
+    def as_dict(self) -> dict:
+        return {"profile": asdict(self.profile), "duration_s": round(self.duration_s, 1),
+                "error_rate": self.error_rate, "steps": self.stats()}
+
+
+async def _virtual_user(user: int, journey, browser, start_delay_s: float, profile: LoadProfile,
+                        results: list, base_url: str, username: str, password: str):
+    await asyncio.sleep(start_delay_s)
+    name = journey.__name__.replace("_journey", "")
+    rnd = random.Random(user)
+    for _ in range(profile.iterations):
+        try:
+            context = await browser.new_context()
+        except Exception as exc:
+            results.append(StepResult(name, "new_context", user, 0.0, False, f"{type(exc).__name__}: {exc}"))
+            return
+        try:
+            session = UserSession(await context.new_page(), user, name, results, base_url, username, password,
+                                  profile.think_time_s, rnd)
+            await journey(session)
+        except Exception:
+            pass  # already recorded by step(); the next iteration starts from a clean context
+        finally:
+            await context.close()
+
+
+async def _run_users(journeys: list, profile: LoadProfile, base_url: str, username: str, password: str) -> list:
+    results = []
+    async with async_playwright() as p:
+        browsers = [await p.chromium.launch(headless=Config.HEADLESS) for _ in range(max(1, profile.browsers))]
+        try:
+            await asyncio.gather(*(
+                _virtual_user(user, journeys[user % len(journeys)], browsers[user % len(browsers)],
+                              profile.ramp_up_s * user / profile.users, profile, results, base_url, username, password)
+                for user in range(profile.users)))
+        finally:
+            for browser in browsers:
+                await browser.close()
+    return results
+
+
+def run_load(journeys: list, profile: LoadProfile = None, base_url: str = None,
+             username: str = None, password: str = None) -> LoadReport:
+    """Runs ``profile.users`` virtual users, assigning ``journeys`` round-robin."""
+    profile = profile or LoadProfile()
+    base_url = base_url or Config.BASE_URL
+    username = username or Config.TEST_EMAIL
+    password = password or Config.PASSWORD
+    started = time.perf_counter()
+    # Own loop thread: the calling thread may already be running the sync API's event loop
+    runner = LoopThread().start()
+    try:
+        results = runner.run(_run_users(journeys, profile, base_url, username, password))
+    finally:
+        runner.close()
+    return LoadReport(results, profile, time.perf_counter() - started)
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Drive the page-object journeys with concurrent virtual users.")
+    parser.add_argument("--users", type=int, default=10)
+    parser.add_argument("--browsers", type=int, default=2, help="Chromium processes shared by the users")
+    parser.add_argument("--ramp-up", type=float, default=10.0, help="Seconds over which users start")
+    parser.add_argument("--think-time", type=float, nargs=2, default=(0.5, 2.0), metavar=("MIN", "MAX"))
+    parser.add_argument("--iterations", type=int, default=1, help="Journey repetitions per user")
+    parser.add_argument("--journey", action="append", choices=sorted(JOURNEYS),
+                        help="Journey to run (repeatable; default: all)")
+    parser.add_argument("--base-url", help="Target (default: Config.BASE_URL)")
+    parser.add_argument("--json", help="Also write the report to this file")
+    args = parser.parse_args(argv)
+
+    profile = LoadProfile(args.users, args.browsers, args.ramp_up, tuple(args.think_time), args.iterations)
+    report = run_load([JOURNEYS[name] for name in (args.journey or sorted(JOURNEYS))], profile, args.base_url)
+    print(report.table())
+    if args.json:
+        os.makedirs(os.path.dirname(os.path.abspath(args.json)), exist_ok=True)
+        with open(args.json, "w") as f:
+            json.dump(report.as_dict(), f, indent=2)
+    return 1 if report.error_rate else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
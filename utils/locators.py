@@ -0,0 +1,171 @@
+"""Declarative page-object selectors.
+
+Page objects declare each selector once as a class attribute. ``Selector`` is a ``str``, so it
+works anywhere a selector string does; ``{}`` placeholders make it parameterised and calling
+it fills them in, memoised with a bounded LRU::
+
+    class DashboardPage(BasePage):
+        SIDEBAR_SELECTOR = Selector("ul.ant-menu li.ant-menu-item a >> text={}")
+
+        def navigate_to_sidebar_item(self, item):
+            self.page.click(self.SIDEBAR_SELECTOR(item))
+
+``BasePage.locate()`` additionally memoises the Playwright ``Locator`` per page. Every
+UPPER_CASE string on a page object is syntax-checked when the suite is collected
+(``invalid_selectors``), so a typo fails the run up front instead of halfway through it.
+"""
+import functools
+import re
+import string
+import threading
+import weakref
+from collections import OrderedDict
+
+from utils.config import Config
+
+# UPPER_CASE page-object attributes that are strings but not selectors
+NOT_SELECTORS = {"URL_PATH"}
+ENGINES = {"css", "xpath", "text", "id", "data-testid", "data-test-id", "data-test", "role", "nth", "visible"}
+_ENGINE_PREFIX = re.compile(r"^([a-zA-Z][\w-]*(?::[\w-]+)?)=(.*)$", re.S)
+_ROLE = re.compile(r"[a-z]+(\s*\[[^\]]*\])*")
+
+
+class Selector(str):
+    def __new__(cls, template: str, cache_size: int = None):
+        self = super().__new__(cls, template)
+        fields = [f for _, f, _, _ in string.Formatter().parse(template) if f is not None]
+        if any(fields):
+            raise ValueError(f"Selector placeholders must be positional '{{}}': {template!r}")
+        self.arity = len(fields)
+        self.owner = self.name = None
+        self._fill = functools.lru_cache(maxsize=cache_size or Config.LOCATOR_CACHE_SIZE)(
+            functools.partial(str.format, str(template)))
+        return self
+
+    def __set_name__(self, owner, name):
+        self.owner, self.name = owner, name
+
+    def __call__(self, *args) -> str:
+        if len(args) != self.arity:
+            raise TypeError(f"{self.name or 'Selector'} takes {self.arity} argument(s), got {len(args)}")
+        return self._fill(*args)
+
+    def cache_info(self):
+        return self._fill.cache_info()
+
+
+class LocatorCache:
+    """Playwright ``Locator`` objects memoised per page (weakly keyed, so closed pages drop out)."""
+
+    def __init__(self, size: int = None):
+        self.size = size or Config.LOCATOR_CACHE_SIZE
+        self._pages = weakref.WeakKeyDictionary()
+        self._lock = threading.Lock()
+
+    def get(self, page, selector: str, args: tuple = ()):
+        with self._lock:
+            cache = self._pages.get(page)
+            if cache is None:
+                cache = self._pages[page] = OrderedDict()
+        key = (selector, args)
+        locator = cache.get(key)
+        if locator is not None:
+            cache.move_to_end(key)
+            return locator
+        locator = page.locator(selector(*args) if isinstance(selector, Selector) else selector)
+        cache[key] = locator
+        if len(cache) > self.size:
+            cache.popitem(last=False)
+        return locator
+
+
+def _split_chain(selector: str) -> list:
+    """Splits on ``>>`` outside quotes; ``None`` if a quote is never closed."""
+    parts, start, quote, i = [], 0, None, 0
+    while i < len(selector):
+        char = selector[i]
+        if quote:
+            if char == "\\":
+                i += 1
+            elif char == quote:
+                quote = None
+        elif char in "'\"":
+            quote = char
+        elif selector.startswith(">>", i):
+            parts.append(selector[start:i])
+            start = i + 2
+            i += 1
+        i += 1
+    if quote:
+        return None
+    parts.append(selector[start:])
+    return parts
+
+
+def _unbalanced(text: str) -> str:
+    closing = {"]": "[", ")": "("}
+    stack, quote = [], None
+    for i, char in enumerate(text):
+        if quote:
+            if char == quote and text[i - 1] != "\\":
+                quote = None
+        elif char in "'\"":
+            quote = char
+        elif char in "[(":
+            stack.append(char)
+        elif char in closing:
+            if not stack or stack.pop() != closing[char]:
+                return f"unexpected '{char}'"
+    if stack:
+        return f"unclosed '{stack[-1]}'"
+    return None
+
+
+def selector_error(selector: str) -> str:
+    """Offline syntax check of a Playwright selector; returns the problem or ``None``."""
+    parts = _split_chain(selector)
+    if parts is None:
+        return "unterminated quote"
+    for part in parts:
+        part = part.strip()
+        if not part:
+            return "empty step in '>>' chain"
+        match = _ENGINE_PREFIX.match(part)
+        engine, body = (match.group(1), match.group(2).strip()) if match else (None, part)
+        if engine is None:
+            engine = "xpath" if part.startswith(("//", "..", "(//")) else "text" if part[0] in "'\"" else "css"
+        elif engine not in ENGINES and not engine.startswith("internal:"):
+            return f"unknown selector engine '{engine}'"
+        if not body:
+            return f"empty {engine} selector"
+        if engine in ("css", "xpath"):
+            problem = _unbalanced(body)
+            if problem:
+                return f"{engine}: {problem}"
+            if engine == "css" and body[-1] in ">+~,":
+                return "css: dangling combinator"
+        elif engine == "role" and not _ROLE.fullmatch(body):
+            return f"role: expected 'role[name=...]', got {body!r}"
+        elif engine == "nth" and not body.lstrip("-").isdigit():
+            return "nth: expected an integer"
+    return None
+
+
+def invalid_selectors(base_cls) -> list:
+    """Checks every UPPER_CASE string on ``base_cls`` and its subclasses; returns error lines."""
+    errors, seen, pending = [], set(), [base_cls]
+    while pending:
+        cls = pending.pop()
+        pending.extend(cls.__subclasses__())
+        for name, value in vars(cls).items():
+            if not name.isupper() or name in NOT_SELECTORS or not isinstance(value, str) or id(value) in seen:
+                continue
+            seen.add(id(value))
+            sample = value(*["x"] * value.arity) if isinstance(value, Selector) else value
+            problem = selector_error(sample)
+            if problem:
+                errors.append(f"{cls.__module__}.{cls.__name__}.{name} = {str(value)!r}: {problem}")
+    return errors
+
+
+locator_cache = LocatorCache()
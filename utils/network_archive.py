@@ -0,0 +1,99 @@
+import os
+import shutil
+
+from playwright.sync_api import BrowserContext, Route
+
+from utils.config import Config, ROOT_DIR
+
+HAR_DIR = os.path.join(ROOT_DIR, "hars")
+REPLAY_STATE_PATH = os.path.join(HAR_DIR, "storage_state.json")
+
+
+class NetworkArchive:
+    """Records a module's network traffic to ``hars/<module>.har`` or replays it offline.
+
+    Replay serves responses from the HAR through ``context.route_from_har``. Anything the
+    archive cannot answer falls through to a catch-all route that logs it as unmatched and
+    aborts it (or lets it through to the live server with ``REPLAY_PASSTHROUGH=true``).
+    """
+
+    RECORD = "record"
+    REPLAY = "replay"
+
+    def __init__(self, mode: str, name: str, url_pattern: str = Config.HAR_URL_PATTERN,
+                 passthrough: bool = Config.REPLAY_PASSTHROUGH):
+        self.mode = mode
+        self.name = name
+        self.url_pattern = url_pattern
+        self.passthrough = passthrough
+        self.path = os.path.join(HAR_DIR, f"{name}.har")
+        self.unmatched = []
+
+    @property
+    def replaying(self) -> bool:
+        return self.mode == self.REPLAY
+
+    def replay_state(self):
+        """Login state captured while recording, so replay never needs the live login."""
+        return REPLAY_STATE_PATH if os.path.exists(REPLAY_STATE_PATH) else None
+
+    def keep_state(self, live_state: str):
+        os.makedirs(HAR_DIR, exist_ok=True)
+        shutil.copyfile(live_state, REPLAY_STATE_PATH)
+
+    def attach(self, context: BrowserContext):
+        if self.mode == self.RECORD:
+            os.makedirs(HAR_DIR, exist_ok=True)
+            # The HAR is written when the context closes
+            context.route_from_har(self.path, url=self.url_pattern, update=True, update_content="embed")
+            return
+        if not os.path.exists(self.path):
+            raise FileNotFoundError(f"No recording for '{self.name}' at {self.path}; run with --record first.")
+        # Routes are matched newest-first, so the catch-all only sees what the HAR could not answer
+        context.route("**/*", self._on_unmatched)
+        context.route_from_har(self.path, url=self.url_pattern, not_found="fallback")
+
+    def _on_unmatched(self, route: Route):
+        request = route.request
+        self.unmatched.append(f"{request.method} {request.url}")
+        if self.passthrough:
+            route.continue_()
+        else:
+            route.abort("internetdisconnected")
+
+
+def archive_for(config, module_name: str):
+    """Builds the archive for a test module from --record/--replay, or None when neither is set."""
+    if config.getoption("--record"):
+        mode = NetworkArchive.RECORD
+    elif config.getoption("--replay"):
+        mode = NetworkArchive.REPLAY
+    else:
+        return None
+    archive = NetworkArchive(mode, module_name.rsplit(".", 1)[-1])
+    archive_registry.add(archive)
+    return archive
+
+
+class ArchiveRegistry:
+    """Run-wide view of the archives in use, keyed by test module name."""
+
+    def __init__(self):
+        self.archives = {}
+
+    def add(self, archive: NetworkArchive):
+        self.archives[archive.name] = archive
+
+    def get(self, module_name: str):
+        return self.archives.get(module_name.rsplit(".", 1)[-1])
+
+    def unmatched_report(self) -> list:
+        lines = []
+        for name, archive in self.archives.items():
+            if archive.unmatched:
+                lines.append(f"{name}: {len(archive.unmatched)} unmatched request(s)")
+                lines.extend(f"    {entry}" for entry in archive.unmatched)
+        return lines
+
+
+archive_registry = ArchiveRegistry()
@@ -0,0 +1,328 @@
+"""Read-only page checks answered from one capture of the rendered DOM.
+
+:meth:`PageSnapshot.capture` walks the DOM under a root element in a single ``evaluate`` and
+keeps every element that is not ``display:none``: its tag, ARIA role (explicit or implicit), key
+attributes, bounding box, visibility, and its content as text runs interleaved with child
+indexes, so element texts can be rebuilt in order. Queries (``find``, ``texts``,
+``is_visible``) then run in Python against that copy, in the selector subset described on
+:class:`PageSnapshot`, instead of one browser round trip per element.
+"""
+import re
+
+from playwright.sync_api import Page
+
+_CAPTURE_SCRIPT = """(rootSelector) => {
+    const root = document.querySelector(rootSelector) || document.body;
+    const ATTRS = ['id', 'class', 'href', 'type', 'name', 'placeholder', 'title', 'alt', 'role', 'src',
+                   'aria-label', 'aria-selected', 'aria-expanded', 'aria-checked', 'aria-disabled',
+                   'data-testid', 'disabled', 'checked', 'readonly'];
+    const ROLES = {A: 'link', BUTTON: 'button', SELECT: 'combobox', TEXTAREA: 'textbox', IMG: 'img',
+                   NAV: 'navigation', UL: 'list', OL: 'list', LI: 'listitem', TABLE: 'table', TR: 'row',
+                   TD: 'cell', TH: 'columnheader', H1: 'heading', H2: 'heading', H3: 'heading',
+                   H4: 'heading', H5: 'heading', H6: 'heading', MAIN: 'main', HEADER: 'banner',
+                   FOOTER: 'contentinfo', FORM: 'form', DIALOG: 'dialog', ASIDE: 'complementary'};
+    const INPUT_ROLES = {checkbox: 'checkbox', radio: 'radio', button: 'button', submit: 'button',
+                         reset: 'button', range: 'slider', search: 'searchbox'};
+    const SKIP = new Set(['SCRIPT', 'STYLE', 'NOSCRIPT', 'TEMPLATE', 'HEAD', 'META', 'LINK']);
+    const nodes = [];
+    const walk = (el, parent) => {
+        if (SKIP.has(el.tagName)) return null;
+        const style = getComputedStyle(el);
+        if (style.display === 'none') return null;
+        const rect = el.getBoundingClientRect();
+        const attrs = {};
+        for (const name of ATTRS) {
+            const value = el.getAttribute(name);
+            if (value !== null) attrs[name] = value;
+        }
+        if (el.tagName === 'INPUT' || el.tagName === 'TEXTAREA' || el.tagName === 'SELECT') attrs.value = el.value;
+        const role = attrs.role || (el.tagName === 'INPUT' ? INPUT_ROLES[el.type] || 'textbox' : ROLES[el.tagName]) || null;
+        const node = {tag: el.tagName.toLowerCase(), parent, role, attrs, content: [],
+                      box: [rect.x, rect.y, rect.width, rect.height].map(Math.round),
+                      visible: style.visibility !== 'hidden' && rect.width > 0 && rect.height > 0,
+                      next: el.nextSibling ? (el.nextSibling.textContent || '').trim().slice(0, 200) : ''};
+        const index = nodes.push(node) - 1;
+        if (node.tag === 'svg') return index;  // icon internals are noise
+        for (const child of el.childNodes) {
+            if (child.nodeType === Node.TEXT_NODE) {
+                if (child.textContent.trim()) node.content.push(child.textContent);
+            } else if (child.nodeType === Node.ELEMENT_NODE) {
+                const childIndex = walk(child, index);
+                if (childIndex !== null) node.content.push(childIndex);
+            }
+        }
+        return index;
+    };
+    walk(root, null);
+    return {url: location.href, nodes};
+}"""
+
+_WS = re.compile(r"\s+")
+_QUOTED = r"""(?:"([^"]*)"|'([^']*)'|([^\]\)]*))"""
+_SIMPLE = re.compile(r"\.([\w-]+)|#([\w-]+)|\[([\w-]+)(?:([*^$~]?=)" + _QUOTED + r")?\]|:([\w-]+)(?:\(" + _QUOTED + r"\))?")
+_TAG = re.compile(r"[a-zA-Z][\w-]*|\*")
+
+
+def _norm(text: str) -> str:
+    return _WS.sub(" ", text).strip()
+
+
+def _split_top_level(query: str, separators: tuple) -> list:
+    """Splits on any of ``separators`` outside quotes, brackets and parentheses; keeps the separators."""
+    parts, current, depth, quote, i = [], "", 0, None, 0
+    while i < len(query):
+        ch = query[i]
+        if quote:
+            quote = None if ch == quote else quote
+        elif ch in "'\"":
+            quote = ch
+        elif ch in "[(":
+            depth += 1
+        elif ch in "])":
+            depth -= 1
+        elif depth == 0:
+            separator = next((s for s in separators if query.startswith(s, i)), None)
+            if separator:
+                parts.extend([current, separator])
+                current = ""
+                i += len(separator)
+                continue
+        current += ch
+        i += 1
+    parts.append(current)
+    return parts
+
+
+class Node:
+    """One rendered element of a :class:`PageSnapshot`."""
+
+    def __init__(self, snapshot, index: int, data: dict):
+        self.snapshot = snapshot
+        self.index = index
+        self.tag = data["tag"]
+        self.role = data["role"]
+        self.attrs = data["attrs"]
+        self.box = tuple(data["box"])       # x, y, width, height in CSS pixels
+        self.visible = data["visible"]
+        self.next_text = data["next"]       # text of the DOM node right after this one (label -> value)
+        self._content = data["content"]
+        self._parent = data["parent"]
+        self._text = None
+
+    def __repr__(self):
+        return f"<{self.tag} {self.attrs.get('class', '')!r} {self.text[:40]!r}>"
+
+    @property
+    def parent(self):
+        return None if self._parent is None else self.snapshot.nodes[self._parent]
+
+    @property
+    def children(self) -> list:
+        return [self.snapshot.nodes[part] for part in self._content if isinstance(part, int)]
+
+    @property
+    def own_text(self) -> str:
+        return _norm(" ".join(part for part in self._content if isinstance(part, str)))
+
+    @property
+    def text(self) -> str:
+        """Whitespace-normalised text of the element and everything rendered inside it."""
+        if self._text is None:
+            pieces = [part if isinstance(part, str) else self.snapshot.nodes[part].text for part in self._content]
+            self._text = _norm(" ".join(pieces))
+        return self._text
+
+    @property
+    def classes(self) -> list:
+        return self.attrs.get("class", "").split()
+
+    def ancestors(self):
+        node = self.parent
+        while node is not None:
+            yield node
+            node = node.parent
+
+    def descendants(self):
+        for child in self.children:
+            yield child
+            yield from child.descendants()
+
+    # Queries scoped to this element, same language as PageSnapshot.find
+    def find(self, query: str) -> list:
+        return self.snapshot.find(query, within=[self])
+
+    def first(self, query: str):
+        return next(iter(self.find(query)), None)
+
+    def is_visible(self, query: str) -> bool:
+        return any(node.visible for node in self.find(query))
+
+    def texts(self, query: str) -> list:
+        return [node.text for node in self.find(query)]
+
+
+class PageSnapshot:
+    """In-memory model of the rendered page, captured in a single round trip.
+
+    Read-only checks query the model instead of asking the browser element by element.
+    Queries are a CSS subset with Playwright's text extensions:
+
+    * ``tag``, ``*``, ``.class``, ``#id``, ``[attr]``, ``[attr=v]`` (also ``*=``, ``^=``, ``$=``, ``~=``),
+      ``[role=button]`` (explicit or implicit ARIA role); descendant (space) and child (``>``) combinators
+    * ``:has-text('x')`` (case-insensitive substring of the element's text), ``:text-is('x')`` (exact),
+      ``:visible``
+    * ``text=x`` (smallest elements containing x, case-insensitive) and ``text="x"`` (exact)
+    * ``a >> b`` runs ``b`` inside each match of ``a``
+
+    So most page-object selectors (``Selector`` templates included) work unchanged. The model is a
+    copy: it does not follow later changes to the page, so take a new snapshot after acting.
+    """
+
+    def __init__(self, url: str, nodes: list):
+        self.url = url
+        self.nodes = [Node(self, i, data) for i, data in enumerate(nodes)]
+
+    @classmethod
+    def capture(cls, page: Page, root: str = "body") -> "PageSnapshot":
+        data = page.evaluate(_CAPTURE_SCRIPT, root)
+        return cls(data["url"], data["nodes"])
+
+    @classmethod
+    async def capture_async(cls, page, root: str = "body") -> "PageSnapshot":
+        """Same single round trip for a ``playwright.async_api`` page."""
+        data = await page.evaluate(_CAPTURE_SCRIPT, root)
+        return cls(data["url"], data["nodes"])
+
+    @property
+    def root(self):
+        return self.nodes[0] if self.nodes else None
+
+    def find(self, query: str, within: list = None) -> list:
+        """Elements matching ``query`` in document order (inside the ``within`` elements, if given)."""
+        scopes = within
+        for part in _split_top_level(query, (">>",))[::2]:
+            matches = self._find_one(part.strip(), scopes)
+            scopes = matches
+        return scopes
+
+    def first(self, query: str):
+        return next(iter(self.find(query)), None)
+
+    def is_visible(self, query: str) -> bool:
+        """True when any element matching ``query`` is rendered (non-empty box, not visibility:hidden)."""
+        return any(node.visible for node in self.find(query))
+
+    def texts(self, query: str) -> list:
+        return [node.text for node in self.find(query)]
+
+    # --- Query evaluation -----------------------------------------------------------------
+
+    def _candidates(self, scopes):
+        if scopes is None:
+            return self.nodes
+        seen, found = set(), []
+        for scope in scopes:
+            for node in scope.descendants():
+                if node.index not in seen:
+                    seen.add(node.index)
+                    found.append(node)
+        return sorted(found, key=lambda n: n.index)
+
+    def _find_one(self, query: str, scopes):
+        if not query:
+            raise ValueError("Empty snapshot query")
+        candidates = self._candidates(scopes)
+        if query.startswith("text="):
+            return self._match_text(query[5:], candidates)
+        compounds, combinators, pending = [], [], None
+        for token in _split_top_level(query, (">", " ")):
+            if token in (">", " "):
+                pending = ">" if token == ">" or pending == ">" else " "
+            elif token:
+                if compounds:
+                    if pending is None:
+                        raise ValueError(f"Unsupported snapshot query: {query!r}")
+                    combinators.append(pending)
+                compounds.append(token)
+                pending = None
+        if not compounds or pending == ">":
+            raise ValueError(f"Unsupported snapshot query: {query!r}")
+        tests = [self._compile(c) for c in compounds]
+        return [node for node in candidates if self._matches_chain(node, tests, combinators)]
+
+    @staticmethod
+    def _match_text(text: str, candidates: list) -> list:
+        exact = len(text) > 1 and text[0] == text[-1] and text[0] in "'\""
+        wanted = _norm(text[1:-1] if exact else text)
+        lowered = wanted.lower()
+
+        def contains(node):
+            return node.text == wanted if exact else lowered in node.text.lower()
+
+        matched = [node for node in candidates if contains(node)]
+        matched_ids = {node.index for node in matched}
+        # Smallest elements only: drop any match with a matching child
+        return [node for node in matched if not any(child.index in matched_ids for child in node.children)]
+
+    @staticmethod
+    def _matches_chain(node, tests, combinators) -> bool:
+        if not tests[-1](node):
+            return False
+        if len(tests) == 1:
+            return True
+        rest, combinator = tests[:-1], combinators[-1]
+        if combinator == ">":
+            parent = node.parent
+            return parent is not None and PageSnapshot._matches_chain(parent, rest, combinators[:-1])
+        return any(PageSnapshot._matches_chain(a, rest, combinators[:-1]) for a in node.ancestors())
+
+    @staticmethod
+    def _compile(compound: str):
+        tag = _TAG.match(compound)
+        checks = []
+        if tag and tag.group(0) != "*":
+            name = tag.group(0).lower()
+            checks.append(lambda n: n.tag == name)
+        position = tag.end() if tag else 0
+        for match in _SIMPLE.finditer(compound, position):
+            if match.start() != position:
+                break
+            position = match.end()
+            cls, id_, attr, op, *rest = match.groups()
+            value = next((v for v in rest[:3] if v is not None), None)
+            pseudo = rest[3]
+            argument = next((v for v in rest[4:] if v is not None), None)
+            if cls:
+                checks.append(lambda n, c=cls: c in n.classes)
+            elif id_:
+                checks.append(lambda n, i=id_: n.attrs.get("id") == i)
+            elif attr:
+                checks.append(_attribute_check(attr, op, value))
+            elif pseudo == "has-text" and argument is not None:
+                checks.append(lambda n, t=_norm(argument).lower(): t in n.text.lower())
+            elif pseudo == "text-is" and argument is not None:
+                checks.append(lambda n, t=_norm(argument): n.text == t)
+            elif pseudo == "visible":
+                checks.append(lambda n: n.visible)
+            else:
+                raise ValueError(f"Unsupported pseudo-class :{pseudo} in snapshot query {compound!r}")
+        if position != len(compound):
+            raise ValueError(f"Unsupported snapshot query part: {compound[position:]!r}")
+        return lambda n: all(check(n) for check in checks)
+
+
+def _attribute_check(attr: str, op: str, value: str):
+    def actual(node):
+        return node.role if attr == "role" else node.attrs.get(attr)
+
+    if op is None:
+        return lambda n: actual(n) is not None
+    operators = {
+        "=": lambda a: a == value,
+        "*=": lambda a: value in a,
+        "^=": lambda a: a.startswith(value),
+        "$=": lambda a: a.endswith(value),
+        "~=": lambda a: value in a.split(),
+    }
+    compare = operators[op]
+    return lambda n: actual(n) is not None and compare(actual(n))
@@ -0,0 +1,305 @@
+"""Opt-in timing of page-object methods (``pytest --page-timings``).
+
+Every public method of ``BasePage`` and its subclasses is wrapped to record its wall time.
+While timings are on, a page object's ``self.page`` is a thin proxy (:meth:`PageTimings.watch`)
+that tallies the Playwright round trips made through it and the locators, keyboard and frames
+it hands out: how many, how much of that was spent waiting (``wait_for*``, and ``expect_*``
+until the event arrives) versus acting (clicks, fills, evaluations), and how many ran into their
+timeout, including timeouts the page object caught itself (e.g. a settle signal that never
+fired). Nothing inside Playwright is patched. Nested calls (e.g. ``search_rm`` -> ``settle``)
+form a tree per test, attached to Allure as a flame-style table; the run-level JSON summary
+ranks methods by the total time they took across the suite.
+"""
+import functools
+import html
+import inspect
+import json
+import os
+import threading
+import time
+import weakref
+from dataclasses import dataclass, field
+
+from playwright.sync_api import ElementHandle, Frame as PlaywrightFrame, FrameLocator, Keyboard, Locator, Mouse, Page
+from playwright.sync_api import TimeoutError
+
+from utils.config import ROOT_DIR
+
+SUMMARY_PATH = os.path.join(ROOT_DIR, "reports", "page_timings.json")
+_WRAPPED = "__page_timing__"
+# Handed out by a watched page and watched in turn, so their calls are counted too
+_WATCHED_TYPES = (Locator, FrameLocator, PlaywrightFrame, ElementHandle, Keyboard, Mouse)
+# Build locators or register listeners without a round trip to the browser: not counted
+_LOCAL_CALLS = {"locator", "frame_locator", "get_by_role", "get_by_text", "get_by_label", "get_by_placeholder",
+                "get_by_alt_text", "get_by_title", "get_by_test_id", "nth", "filter", "and_", "or_",
+                "on", "once", "remove_listener"}
+
+
+def _is_wait(name: str) -> bool:
+    return name.startswith(("wait_for", "expect_"))
+
+
+@dataclass
+class Frame:
+    """One page-object call (or the test body itself) and everything it triggered."""
+    name: str
+    wall_ms: float = 0.0
+    calls: int = 0
+    wait_ms: float = 0.0
+    act_ms: float = 0.0
+    timeouts: int = 0           # Playwright calls that timed out, whether or not the method caught it
+    children: list = field(default_factory=list)
+
+    @property
+    def self_ms(self) -> float:
+        return max(0.0, self.wall_ms - sum(c.wall_ms for c in self.children))
+
+    def walk(self, depth: int = 0):
+        yield depth, self
+        for child in self.children:
+            yield from child.walk(depth + 1)
+
+    def totals(self) -> "Frame":
+        """This frame with its descendants' Playwright calls folded in."""
+        total = Frame(self.name, self.wall_ms, self.calls, self.wait_ms, self.act_ms, self.timeouts)
+        for child in self.children:
+            sub = child.totals()
+            total.calls += sub.calls
+            total.wait_ms += sub.wait_ms
+            total.act_ms += sub.act_ms
+            total.timeouts += sub.timeouts
+        return total
+
+
+@dataclass
+class MethodStats:
+    name: str
+    calls: int = 0
+    total_ms: float = 0.0
+    self_ms: float = 0.0
+    max_ms: float = 0.0
+    slowest_test: str = ""
+    playwright_calls: int = 0
+    wait_ms: float = 0.0
+    act_ms: float = 0.0
+    timeouts: int = 0
+
+    def add(self, frame: Frame, test: str):
+        totals = frame.totals()
+        self.calls += 1
+        self.total_ms += frame.wall_ms
+        self.self_ms += frame.self_ms
+        if frame.wall_ms > self.max_ms:
+            self.max_ms, self.slowest_test = frame.wall_ms, test
+        self.playwright_calls += totals.calls
+        self.wait_ms += totals.wait_ms
+        self.act_ms += totals.act_ms
+        self.timeouts += totals.timeouts
+
+    def as_dict(self) -> dict:
+        return {
+            "method": self.name, "calls": self.calls, "total_ms": round(self.total_ms, 1),
+            "self_ms": round(self.self_ms, 1), "mean_ms": round(self.total_ms / self.calls, 1),
+            "max_ms": round(self.max_ms, 1), "slowest_test": self.slowest_test,
+            "playwright_calls": self.playwright_calls, "wait_ms": round(self.wait_ms, 1),
+            "act_ms": round(self.act_ms, 1), "timeouts": self.timeouts,
+        }
+
+
+class _Watched:
+    """Proxy for a Playwright object that reports each blocking call on it to the recorder."""
+
+    def __init__(self, target, recorder: "PageTimings"):
+        self._target = target
+        self._recorder = recorder
+
+    def __repr__(self):
+        return repr(self._target)
+
+    @property
+    def __class__(self):
+        # isinstance() sees the wrapped type, so Playwright still accepts the proxy as an argument
+        # (e.g. screenshot masks) and unwraps it through the forwarded _impl_obj
+        return type(self._target)
+
+    def __getattr__(self, name):
+        value = getattr(self._target, name)
+        recorder = self._recorder
+        if not callable(value):
+            return recorder.watch(value)
+        if name in _LOCAL_CALLS:
+            return lambda *args, **kwargs: recorder.watch(value(*args, **kwargs))
+        if name.startswith("expect_"):
+            # The call only registers the wait; it blocks when the ``with`` block exits
+            return lambda *args, **kwargs: _WatchedEvent(value(*args, **kwargs), name, recorder)
+
+        def call(*args, **kwargs):
+            return recorder.watch(recorder.timed_call(name, lambda: value(*args, **kwargs)))
+
+        return call
+
+
+class _WatchedEvent:
+    """``expect_*`` context manager; the time spent in ``__exit__`` is the wait."""
+
+    def __init__(self, manager, name: str, recorder: "PageTimings"):
+        self._manager = manager
+        self._name = name
+        self._recorder = recorder
+
+    def __enter__(self):
+        return self._manager.__enter__()
+
+    def __exit__(self, *exc_info):
+        return self._recorder.timed_call(self._name, lambda: self._manager.__exit__(*exc_info))
+
+
+def untimed(func):
+    """Keeps a cheap helper (e.g. ``BasePage.locate``) out of the timing tree."""
+    setattr(func, _WRAPPED, True)
+    return func
+
+
+class PageTimings:
+    def __init__(self):
+        self.enabled = False
+        self.methods = {}
+        self.tests = 0
+        self._local = threading.local()
+        self._pages = weakref.WeakValueDictionary()     # id(page) -> its proxy; the proxy keeps the page alive
+
+    # --- Setup -----------------------------------------------------------------------
+
+    def enable(self):
+        self.enabled = True
+
+    def watch(self, value):
+        """``value`` behind a counting proxy if it is a page (or a locator, frame, ... one handed out)."""
+        if not self.enabled or type(value) is _Watched or not isinstance(value, (Page, *_WATCHED_TYPES)):
+            return value
+        if not isinstance(value, Page):
+            return _Watched(value, self)
+        # One proxy per page while any page object holds it, so per-page caches (locator_cache) still hit
+        proxy = self._pages.get(id(value))
+        if proxy is None:
+            proxy = self._pages[id(value)] = _Watched(value, self)
+        return proxy
+
+    def instrument(self, base_cls):
+        """Wraps the public methods of ``base_cls`` and every subclass loaded so far."""
+        classes, pending = [], [base_cls]
+        while pending:
+            cls = pending.pop()
+            classes.append(cls)
+            pending.extend(cls.__subclasses__())
+        for cls in classes:
+            for name, attr in list(vars(cls).items()):
+                if name.startswith("_") or not inspect.isfunction(attr) or getattr(attr, _WRAPPED, False):
+                    continue
+                setattr(cls, name, self._wrap(name, attr))
+
+    def _wrap(self, name: str, func):
+        recorder = self
+
+        @functools.wraps(func)
+        def timed(page_object, *args, **kwargs):
+            stack = recorder._stack()
+            if not stack:  # not inside a test being timed (e.g. the session login)
+                return func(page_object, *args, **kwargs)
+            frame = Frame(f"{type(page_object).__name__}.{name}")
+            stack[-1].children.append(frame)
+            stack.append(frame)
+            start = time.perf_counter()
+            try:
+                return func(page_object, *args, **kwargs)
+            finally:
+                frame.wall_ms = (time.perf_counter() - start) * 1000
+                stack.pop()
+
+        setattr(timed, _WRAPPED, True)
+        return timed
+
+    # --- Recording -------------------------------------------------------------------
+
+    def _stack(self) -> list:
+        if not hasattr(self._local, "stack"):
+            self._local.stack = []
+        return self._local.stack
+
+    def begin_test(self, name: str):
+        root = Frame(name)
+        self._local.stack = [root]
+        self._local.started = time.perf_counter()
+
+    def end_test(self) -> Frame:
+        stack = self._stack()
+        if not stack:
+            return None
+        root = stack[0]
+        root.wall_ms = (time.perf_counter() - self._local.started) * 1000
+        self._local.stack = []
+        self.tests += 1
+        for depth, frame in root.walk():
+            if depth:
+                self.methods.setdefault(frame.name, MethodStats(frame.name)).add(frame, root.name)
+        return root
+
+    def timed_call(self, name: str, call):
+        """Runs one Playwright round trip and charges it to the innermost page-object method."""
+        start = time.perf_counter()
+        timed_out = False
+        try:
+            return call()
+        except TimeoutError:
+            timed_out = True
+            raise
+        finally:
+            stack = self._stack()
+            if stack:
+                frame = stack[-1]
+                frame.calls += 1
+                elapsed_ms = (time.perf_counter() - start) * 1000
+                if _is_wait(name):
+                    frame.wait_ms += elapsed_ms
+                else:
+                    frame.act_ms += elapsed_ms
+                frame.timeouts += timed_out
+
+    # --- Reporting -------------------------------------------------------------------
+
+    @staticmethod
+    def flame_table(root: Frame) -> str:
+        """HTML table, one row per call in call order, indented by depth with a bar scaled to the test."""
+        scale = root.wall_ms or 1
+        rows = []
+        for depth, frame in root.walk():
+            totals = frame.totals()
+            width = max(0.5, frame.wall_ms / scale * 100)
+            rows.append(
+                f"<tr><td style='padding-left:{depth * 16 + 4}px;white-space:nowrap'>{html.escape(frame.name)}</td>"
+                f"<td style='width:40%'><div style='background:{'#e4572e' if totals.timeouts else '#f0a202'};"
+                f"width:{width:.1f}%;height:12px'></div></td>"
+                f"<td>{frame.wall_ms:.0f}</td><td>{frame.self_ms:.0f}</td><td>{totals.calls}</td>"
+                f"<td>{totals.wait_ms:.0f}</td><td>{totals.act_ms:.0f}</td><td>{totals.timeouts}</td></tr>"
+            )
+        return (
+            "<table style='border-collapse:collapse;font:12px monospace' border='1' cellpadding='3'>"
+            "<tr><th>Call</th><th>Wall time</th><th>Total ms</th><th>Self ms</th><th>Playwright calls</th>"
+            "<th>Waiting ms</th><th>Acting ms</th><th>Timeouts</th></tr>"
+            + "".join(rows) + "</table>"
+        )
+
+    def slowest(self, limit: int = None) -> list:
+        ranked = sorted(self.methods.values(), key=lambda m: m.total_ms, reverse=True)
+        return ranked[:limit] if limit else ranked
+
+    def write_summary(self, path: str = None) -> str:
+        worker = os.environ.get("RAK_WORKER_ID")
+        path = path or (SUMMARY_PATH.replace(".json", f"-w{worker}.json") if worker else SUMMARY_PATH)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "w") as f:
+            json.dump({"tests": self.tests, "methods": [m.as_dict() for m in self.slowest()]}, f, indent=2)
+        return path
+
+
+page_timings = PageTimings()
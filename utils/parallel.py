@@ -0,0 +1,205 @@
+"""Parallel runner: N worker processes, each with its own browser, pulling test modules from a shared queue.
+
+Usage:
+    python -m utils.parallel -n 4                      # every module under tests/
+    python -m utils.parallel -n 2 tests/test_pipeline.py tests/test_portfolio.py -- -m smoke
+    python -m utils.parallel -n 4 --changed-pages origin/main
+    python -m utils.parallel -n 4 -- --shared-browser     # workers attach to one machine-wide Chromium
+
+A module is the unit of work, so order-dependent modules (e.g. test_pipeline.py, whose tests
+build on the previous one's navigation) always run start-to-finish on a single worker. Idle
+workers take the next module from the queue, so one slow module never holds up the rest.
+Each worker is one pytest session over every module: it collects them all, but only runs the
+ones it pulls. Session fixtures (browser, stub server, login state) and module singletons are
+therefore set up once per worker and live on from one module to the next.
+The queue is filled in history order (utils.scheduler): recently failed modules first, then
+longest-first, so the workers finish together instead of one picking up a long module last.
+"""
+import argparse
+import glob
+import multiprocessing
+import os
+import sys
+import time
+from queue import Empty
+
+import pytest
+
+from utils.config import Config, ROOT_DIR
+from utils.report_sink import ReportBuilder, new_run_id
+from utils.scheduler import TestHistory, select_for_changed_pages
+
+
+class WorkerPlugin:
+    """Replaces the session's run loop: runs only the modules this worker pulls from the queue."""
+
+    def __init__(self, worker_id: int, queue, results):
+        self.worker_id = worker_id
+        self.queue = queue
+        self.results = results
+        self._module = None
+        self._failed = set()        # modules with a failed test or collection error
+        self._durations = {}        # module -> seconds spent running its tests
+
+    def pytest_sessionstart(self, session):
+        self._rootpath = session.config.rootpath
+
+    def pytest_collectreport(self, report):
+        if report.failed:
+            self._failed.add(str(self._rootpath / report.fspath))
+
+    def pytest_runtest_logreport(self, report):
+        if report.failed:
+            self._failed.add(self._module)
+
+    @pytest.hookimpl(tryfirst=True)
+    def pytest_runtestloop(self, session):
+        if session.config.option.collectonly:
+            return None
+        by_module = {}
+        for item in session.items:
+            by_module.setdefault(str(item.path), []).append(item)
+        # A module's last test runs once the next module is known, so pytest only tears down
+        # what the two do not share; session fixtures stay up until the worker is done
+        held = None
+        while not self._stopping(session):
+            module = self.queue.get()
+            if module is None:
+                break
+            module = os.path.abspath(module)
+            items = by_module.get(module)
+            if not items:
+                self._report(module)
+                continue
+            if held:
+                self._run(held, items[0])
+                held = None
+            for item, nextitem in zip(items, [*items[1:], None]):
+                if self._stopping(session):
+                    # -x / --maxfail hit: what is left of the module is not run
+                    self._report(module, pytest.ExitCode.INTERRUPTED)
+                    break
+                if nextitem is None:
+                    held = item
+                else:
+                    self._run(item, nextitem)
+        if held:
+            self._run(held, None)
+        if session.shouldfail:
+            raise session.Failed(session.shouldfail)
+        if session.shouldstop:
+            raise session.Interrupted(session.shouldstop)
+        return True
+
+    @staticmethod
+    def _stopping(session) -> bool:
+        return bool(session.shouldfail or session.shouldstop)
+
+    def _run(self, item, nextitem):
+        module = str(item.path)
+        self._module = module
+        started = time.perf_counter()
+        item.ihook.pytest_runtest_protocol(item=item, nextitem=nextitem)
+        self._durations[module] = self._durations.get(module, 0.0) + time.perf_counter() - started
+        if nextitem is None or str(nextitem.path) != module:
+            self._report(module)
+
+    def _report(self, module: str, code=None):
+        if code is None:
+            if module in self._failed:
+                code = pytest.ExitCode.TESTS_FAILED
+            elif module in self._durations:
+                code = pytest.ExitCode.OK
+            else:
+                code = pytest.ExitCode.NO_TESTS_COLLECTED
+        self.results.put((self.worker_id, module, int(code), self._durations.get(module, 0.0)))
+
+
+def discover_modules(paths=None) -> list:
+    """Expands files/directories into test modules, skipping empty placeholder files."""
+    paths = paths or [os.path.join(ROOT_DIR, "tests")]
+    modules = []
+    for path in paths:
+        if os.path.isdir(path):
+            modules.extend(sorted(glob.glob(os.path.join(path, "test_*.py"))))
+        else:
+            modules.append(path)
+    return [m for m in modules if os.path.getsize(m) > 0]
+
+
+def _worker(worker_id: int, modules: list, queue, results, pytest_args: list):
+    os.environ["RAK_WORKER_ID"] = str(worker_id)
+    plugin = WorkerPlugin(worker_id, queue, results)
+    # Results stream into the shared report run (RAK_RUN_ID); it is built once all workers are done.
+    # A module that fails to import is reported as failed instead of stopping the whole worker.
+    pytest.main([*modules, "--continue-on-collection-errors", *pytest_args], plugins=[plugin])
+
+
+def run_parallel(modules: list, workers: int, pytest_args: list = ()) -> int:
+    os.environ.setdefault("RAK_RUN_ID", new_run_id())  # every worker streams into the same run
+    ctx = multiprocessing.get_context("spawn")
+    queue, results = ctx.Queue(), ctx.Queue()
+    for module in modules:
+        queue.put(module)
+    workers = max(1, min(workers, len(modules)))
+    for _ in range(workers):
+        queue.put(None)
+
+    processes = [ctx.Process(target=_worker, args=(i, list(modules), queue, results, list(pytest_args)))
+                 for i in range(workers)]
+    for proc in processes:
+        proc.start()
+
+    exit_code = 0
+    pending = len(modules)
+    while pending:
+        try:
+            worker_id, module, code, duration = results.get(timeout=1)
+        except Empty:
+            if not any(proc.is_alive() for proc in processes):
+                print(f"All workers exited with {pending} module(s) unfinished.", flush=True)
+                exit_code = pytest.ExitCode.INTERNAL_ERROR
+                break
+            continue
+        pending -= 1
+        status = "passed" if code in (pytest.ExitCode.OK, pytest.ExitCode.NO_TESTS_COLLECTED) else f"exit {code}"
+        print(f"[worker {worker_id}] {os.path.relpath(module, ROOT_DIR)} — {status} in {duration:.1f}s", flush=True)
+        if status != "passed":
+            exit_code = pytest.ExitCode.TESTS_FAILED
+    for proc in processes:
+        proc.join()
+        if proc.exitcode:
+            exit_code = exit_code or pytest.ExitCode.INTERNAL_ERROR
+    if os.path.isdir(os.path.join(Config.REPORT_STREAM_DIR, "runs")):
+        builder = ReportBuilder()
+        builder.compact()
+        stats = builder.build()
+        print(f"Report: {os.path.join(Config.REPORT_STREAM_DIR, 'report.html')} ({stats['tests']} tests)", flush=True)
+    return int(exit_code)
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Run test modules in parallel worker processes.")
+    parser.add_argument("-n", "--workers", type=int, default=os.cpu_count() or 2)
+    parser.add_argument("--changed-pages", metavar="REF",
+                        help="Only modules affected by changes under pages/ since the git ref REF")
+    parser.add_argument("--no-history-schedule", action="store_true", help="Keep alphabetical module order")
+    parser.add_argument("paths", nargs="*", help="Test modules or directories (default: tests/)")
+    argv = list(sys.argv[1:] if argv is None else argv)
+    # Everything after "--" is handed to pytest untouched
+    split = argv.index("--") if "--" in argv else len(argv)
+    args = parser.parse_args(argv[:split])
+    pytest_args = argv[split + 1:]
+    modules = discover_modules(args.paths)
+    if args.changed_pages:
+        modules = select_for_changed_pages(modules, args.changed_pages)
+    if not args.no_history_schedule:
+        modules = TestHistory.load().order(modules)
+    if not modules:
+        print("No test modules found.")
+        return int(pytest.ExitCode.NO_TESTS_COLLECTED)
+    return run_parallel(modules, args.workers, pytest_args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
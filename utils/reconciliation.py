@@ -0,0 +1,143 @@
+"""Cross-page reconciliation of the financial figures the app shows in more than one place.
+
+Each source (the dashboard's Pipeline Snapshot card, the Pipeline table's Total row, the
+Portfolio table) is read once per run into a keyed dataset of ``Decimal`` values, e.g.
+``pipeline.pending.funded``. Then every rule is checked locally in one pass. A rule compares two
+sums of keys within an absolute tolerance (exact by default), and every mismatch is reported
+together rather than stopping at the first.
+"""
+from dataclasses import dataclass
+from decimal import Decimal
+
+from pages.portfolio_page import PortfolioPage
+from utils.table_snapshot import to_decimal
+
+
+class ReconciliationError(AssertionError):
+    pass
+
+
+class Dataset:
+    """Keyed figures of one run: ``"<source>.<group>.<field>" -> Decimal``, plus the raw text behind each."""
+
+    def __init__(self):
+        self.values = {}
+        self.raw = {}
+        self.sources = {}   # source -> URL it was read from
+
+    def record(self, source: str, figures: dict, url: str = None):
+        """Stores a (nested) dict of figures under ``source``, replacing any earlier reading of it."""
+        stale = [k for k in self.values if k.startswith(source + ".")]
+        for key in stale:
+            del self.values[key], self.raw[key]
+        for key, text in _flatten(figures, source):
+            self.raw[key] = text
+            self.values[key] = to_decimal(text)
+        self.sources[source] = url
+
+    def has(self, source: str) -> bool:
+        return source in self.sources
+
+    def get(self, key: str):
+        return self.values.get(key)
+
+
+def _flatten(figures: dict, prefix: str):
+    for name, value in figures.items():
+        key = f"{prefix}.{name}"
+        if isinstance(value, dict):
+            yield from _flatten(value, key)
+        else:
+            yield key, value
+
+
+@dataclass(frozen=True)
+class Mismatch:
+    rule: str
+    left: object
+    right: object
+    detail: str
+
+    def describe(self) -> str:
+        return f"{self.rule}: {self.detail}"
+
+
+@dataclass(frozen=True)
+class Rule:
+    """``left`` and ``right`` are '+'-separated dataset keys; they must agree within ``tolerance``."""
+    name: str
+    left: str
+    right: str
+    tolerance: Decimal = Decimal(0)
+
+    def keys(self) -> list:
+        return [k.strip() for side in (self.left, self.right) for k in side.split("+")]
+
+    def check(self, dataset: Dataset):
+        missing = [k for k in self.keys() if k not in dataset.values]
+        if missing:
+            return Mismatch(self.name, None, None, "missing " + ", ".join(missing))
+        unparsable = [k for k in self.keys() if dataset.values[k] is None]
+        if unparsable:
+            return Mismatch(self.name, None, None,
+                            "not a number: " + ", ".join(f"{k}={dataset.raw[k]!r}" for k in unparsable))
+        left = sum((dataset.values[k.strip()] for k in self.left.split("+")), Decimal(0))
+        right = sum((dataset.values[k.strip()] for k in self.right.split("+")), Decimal(0))
+        if abs(left - right) > self.tolerance:
+            return Mismatch(self.name, left, right, f"{self.left} = {left} but {self.right} = {right} "
+                                                    f"(off by {left - right}, tolerance {self.tolerance})")
+        return None
+
+
+def balances(prefix: str) -> Rule:
+    """Funded + non-funded adds up to the total within one group."""
+    return Rule(f"{prefix} balances", f"{prefix}.funded + {prefix}.non_funded", f"{prefix}.total")
+
+
+def agree(left_prefix: str, right_prefix: str, fields=("funded", "non_funded", "total"),
+          tolerance: Decimal = Decimal(0)) -> list:
+    """The same figures shown on two pages match field by field."""
+    return [Rule(f"{left_prefix}.{f} matches {right_prefix}.{f}", f"{left_prefix}.{f}", f"{right_prefix}.{f}",
+                 tolerance) for f in fields]
+
+
+RULES = [
+    balances("dashboard.pending"),
+    balances("dashboard.pipeline"),
+    balances("pipeline.pending"),
+    balances("pipeline.pipeline"),
+    *agree("dashboard.pending", "pipeline.pending"),
+    *agree("dashboard.pipeline", "pipeline.pipeline"),
+    *[balances(f"portfolio.total.{g}") for g in PortfolioPage.FIGURE_GROUPS],
+    *[Rule(f"portfolio rows add up to the Total row ({g}.{f})", f"portfolio.rows.{g}.{f}", f"portfolio.total.{g}.{f}")
+      for g in PortfolioPage.FIGURE_GROUPS for f in ("funded", "non_funded", "total")],
+    Rule("portfolio rows add up to the Total row (new funded)", "portfolio.rows.new_funded",
+         "portfolio.total.new_funded"),
+]
+
+
+class Reconciler:
+    def __init__(self, rules: list = None):
+        self.rules = list(RULES if rules is None else rules)
+        self.dataset = Dataset()
+
+    def collect(self, source: str, read, url: str = None):
+        """Reads ``source`` with ``read()`` unless this run already has it."""
+        if not self.dataset.has(source):
+            self.dataset.record(source, read(), url)
+
+    def check(self) -> list:
+        return [m for m in (rule.check(self.dataset) for rule in self.rules) if m is not None]
+
+    def table(self) -> str:
+        lines = [f"{key:<45} {self.dataset.raw[key]!s:>18}  ->  {value}" for key, value in sorted(self.dataset.values.items())]
+        return "\n".join(lines)
+
+    def assert_reconciled(self):
+        mismatches = self.check()
+        if mismatches:
+            raise ReconciliationError(f"{len(mismatches)} of {len(self.rules)} reconciliation rule(s) failed:\n  "
+                                      + "\n  ".join(m.describe() for m in mismatches))
+
+
+reconciler = Reconciler()
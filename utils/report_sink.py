@@ -0,0 +1,304 @@
+"""Streaming results sink with an incrementally rebuilt report.
+
+Layout under ``Config.REPORT_STREAM_DIR`` (default ``reports/stream``)::
+
+    runs/<run>[.w<worker>].jsonl   one line per finished test, appended and flushed as it happens
+    attachments/ab/<sha256>.<ext>  attachment bodies, stored once per distinct content
+                                   (failure artifacts written in the background use a random key)
+    index.json                     latest result per test, plus each test's detail-fragment hash
+    fragments/<key>.html           per-test detail blocks, rewritten only when that test changed
+    history.json                   runs older than REPORT_KEEP_RUNS rolled up into per-test counts
+    report.html                    the assembled report
+
+    python -m utils.report_sink build      # fold new runs into the index and reassemble
+    python -m utils.report_sink compact    # roll old runs into history.json, drop unused attachments
+"""
+import argparse
+import glob
+import hashlib
+import html
+import json
+import os
+import sys
+import time
+import uuid
+
+import allure_commons
+
+from utils.config import Config
+
+OUTCOME_ORDER = {"failed": 0, "error": 1, "skipped": 2, "passed": 3}
+
+
+def new_run_id() -> str:
+    return time.strftime("%Y%m%d-%H%M%S") + f"-{os.getpid()}"
+
+
+def _key(nodeid: str) -> str:
+    return hashlib.sha1(nodeid.encode("utf-8")).hexdigest()[:16]
+
+
+def _extension(attachment_type, extension) -> str:
+    if extension:
+        return extension
+    return getattr(attachment_type, "extension", None) or "txt"
+
+
+class ResultSink:
+    """pytest plugin appending one JSON line per finished test; attachments go to content-addressed files."""
+
+    def __init__(self, root: str = None, run_id: str = None):
+        self.root = root or Config.REPORT_STREAM_DIR
+        self.run_id = run_id or os.environ.get("RAK_RUN_ID") or new_run_id()
+        worker = os.environ.get("RAK_WORKER_ID")
+        self.path = os.path.join(self.root, "runs", f"{self.run_id}{f'.w{worker}' if worker else ''}.jsonl")
+        self.written = 0
+        self._file = None  # opened on the first result, so collect-only runs leave nothing behind
+        self._current = None
+
+    # --- Attachments (allure_commons hooks, so every allure.attach lands here too) ---------
+
+    def store(self, body: bytes, extension: str) -> str:
+        digest = hashlib.sha256(body).hexdigest()
+        path = os.path.join(self.root, "attachments", digest[:2], f"{digest}.{extension}")
+        if not os.path.exists(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            tmp = f"{path}.{os.getpid()}.tmp"
+            with open(tmp, "wb") as f:
+                f.write(body)
+            os.replace(tmp, path)
+        return os.path.relpath(path, self.root)
+
+    def reserve(self, name: str, extension: str):
+        """Links a not-yet-written attachment to the current test; the caller writes the returned path."""
+        if self._current is None:
+            return None
+        key = uuid.uuid4().hex
+        path = os.path.join("attachments", key[:2], f"{key}.{extension}")
+        self._current["attachments"].append({"name": name, "path": path})
+        return os.path.join(self.root, path)
+
+    @allure_commons.hookimpl
+    def attach_data(self, body, name, attachment_type, extension):
+        if self._current is not None:
+            data = body.encode("utf-8") if isinstance(body, str) else body
+            path = self.store(data, _extension(attachment_type, extension))
+            self._current["attachments"].append({"name": name, "path": path})
+
+    @allure_commons.hookimpl
+    def attach_file(self, source, name, attachment_type, extension):
+        if self._current is not None:
+            with open(source, "rb") as f:
+                path = self.store(f.read(), _extension(attachment_type, extension or os.path.splitext(source)[1][1:]))
+            self._current["attachments"].append({"name": name, "path": path})
+
+    # --- pytest hooks ---------------------------------------------------------------------
+
+    def pytest_runtest_logstart(self, nodeid, location):
+        self._current = {"nodeid": nodeid, "run": self.run_id, "outcome": "passed", "duration": 0.0,
+                         "message": None, "attachments": [], "properties": []}
+
+    def pytest_runtest_logreport(self, report):
+        record = self._current
+        if record is None or record["nodeid"] != report.nodeid:
+            return
+        record["duration"] += report.duration
+        if report.failed:
+            record["outcome"] = "failed" if report.when == "call" else "error"
+            record["message"] = record["message"] or report.longreprtext[-4000:]
+        elif report.skipped and record["outcome"] == "passed":
+            record["outcome"] = "skipped"
+            record["message"] = report.longrepr[2] if isinstance(report.longrepr, tuple) else None
+        record["properties"] = [[str(k), str(v)] for k, v in report.user_properties]
+
+    def pytest_runtest_logfinish(self, nodeid, location):
+        record, self._current = self._current, None
+        if record is None:
+            return
+        if self._file is None:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            self._file = open(self.path, "a", encoding="utf-8")
+        record["duration"] = round(record["duration"], 3)
+        record["finished"] = time.time()
+        self._file.write(json.dumps(record) + "\n")
+        self._file.flush()
+        self.written += 1
+
+    def close(self):
+        if self._file:
+            self._file.close()
+
+
+class ReportBuilder:
+    def __init__(self, root: str = None, keep_runs: int = None):
+        self.root = root or Config.REPORT_STREAM_DIR
+        self.keep_runs = Config.REPORT_KEEP_RUNS if keep_runs is None else keep_runs
+        self.index_path = os.path.join(self.root, "index.json")
+        self.history_path = os.path.join(self.root, "history.json")
+
+    def _load(self, path: str, default):
+        if os.path.exists(path):
+            with open(path, encoding="utf-8") as f:
+                return json.load(f)
+        return default
+
+    def _save(self, path: str, data):
+        tmp = f"{path}.{os.getpid()}.tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(data, f, indent=1)
+        os.replace(tmp, path)
+
+    def run_files(self) -> dict:
+        """run id -> its jsonl files (a parallel run has one file per worker), oldest run first."""
+        runs = {}
+        for path in sorted(glob.glob(os.path.join(self.root, "runs", "*.jsonl"))):
+            runs.setdefault(os.path.basename(path).split(".")[0], []).append(path)
+        return dict(sorted(runs.items()))
+
+    @staticmethod
+    def read_records(paths: list):
+        for path in paths:
+            with open(path, encoding="utf-8") as f:
+                for line in f:
+                    if line.strip():
+                        try:
+                            yield json.loads(line)
+                        except json.JSONDecodeError:
+                            continue  # a line cut short by a crashed worker
+
+    # --- Incremental build ----------------------------------------------------------------
+
+    def build(self) -> dict:
+        """Folds runs not yet indexed into ``index.json`` and rewrites only the changed fragments."""
+        index = self._load(self.index_path, {"tests": {}, "indexed": {}})
+        changed = 0
+        for run_id, paths in self.run_files().items():
+            sizes = {os.path.basename(p): os.path.getsize(p) for p in paths}
+            if index["indexed"].get(run_id) == sizes:
+                continue
+            for record in self.read_records(paths):
+                fragment = self._fragment(record)
+                digest = hashlib.sha1(fragment.encode("utf-8")).hexdigest()
+                entry = index["tests"].get(record["nodeid"])
+                if not entry or entry["fragment"] != digest:
+                    os.makedirs(os.path.join(self.root, "fragments"), exist_ok=True)
+                    with open(os.path.join(self.root, "fragments", _key(record["nodeid"]) + ".html"), "w",
+                              encoding="utf-8") as f:
+                        f.write(fragment)
+                    changed += 1
+                index["tests"][record["nodeid"]] = {
+                    "outcome": record["outcome"], "duration": record["duration"], "run": record["run"],
+                    "fragment": digest, "attachments": [a["path"] for a in record.get("attachments", [])],
+                }
+            index["indexed"][run_id] = sizes
+        self._save(self.index_path, index)
+        self._assemble(index)
+        return {"tests": len(index["tests"]), "fragments_rewritten": changed}
+
+    @staticmethod
+    def _fragment(record: dict) -> str:
+        """Everything about a test except its timing, so an unchanged test keeps an identical fragment."""
+        parts = []
+        if record.get("message"):
+            parts.append(f"<pre>{html.escape(record['message'])}</pre>")
+        for name, value in record.get("properties", []):
+            parts.append(f"<div class='prop'><b>{html.escape(name)}</b>: {html.escape(value)}</div>")
+        for attachment in record.get("attachments", []):
+            parts.append(f"<div class='att'><a href='{html.escape(attachment['path'])}'>"
+                         f"{html.escape(attachment['name'] or attachment['path'])}</a></div>")
+        return "\n".join(parts)
+
+    def _assemble(self, index: dict):
+        history = self._load(self.history_path, {"runs": [], "tests": {}})
+        tests = sorted(index["tests"].items(), key=lambda item: (OUTCOME_ORDER.get(item[1]["outcome"], 9), item[0]))
+        counts = {}
+        rows = []
+        for nodeid, entry in tests:
+            counts[entry["outcome"]] = counts.get(entry["outcome"], 0) + 1
+            fragment_path = os.path.join(self.root, "fragments", _key(nodeid) + ".html")
+            detail = ""
+            if os.path.exists(fragment_path):
+                with open(fragment_path, encoding="utf-8") as f:
+                    detail = f.read()
+            past = history["tests"].get(nodeid)
+            trend = f"{past['failed']}/{past['runs']} failed before" if past else ""
+            rows.append(
+                f"<tr class='{entry['outcome']}'><td>{entry['outcome']}</td><td>"
+                + (f"<details><summary>{html.escape(nodeid)}</summary>{detail}</details>" if detail
+                   else html.escape(nodeid))
+                + f"</td><td>{entry['duration']:.2f}s</td><td>{html.escape(entry['run'])}</td><td>{trend}</td></tr>"
+            )
+        summary = ", ".join(f"{n} {outcome}" for outcome, n in sorted(counts.items()))
+        page = (
+            "<!DOCTYPE html><html><head><meta charset='utf-8'><title>RAK-WBG test report</title><style>"
+            "body{font:13px sans-serif} table{border-collapse:collapse;width:100%} td{border-bottom:1px solid #ddd;"
+            "padding:3px;vertical-align:top} .failed td:first-child,.error td:first-child{color:#c00}"
+            ".passed td:first-child{color:#080} .skipped td:first-child{color:#888} pre{white-space:pre-wrap}"
+            f"</style></head><body><h1>RAK-WBG test report</h1><p>{summary} — "
+            f"{len(history['runs'])} older run(s) rolled up</p><table><tr><th>Outcome</th><th>Test</th>"
+            "<th>Duration</th><th>Run</th><th>History</th></tr>" + "".join(rows) + "</table></body></html>"
+        )
+        with open(os.path.join(self.root, "report.html"), "w", encoding="utf-8") as f:
+            f.write(page)
+
+    # --- Compaction -----------------------------------------------------------------------
+
+    def compact(self) -> dict:
+        """Rolls all but the newest ``keep_runs`` runs into ``history.json`` and drops orphaned attachments."""
+        runs = self.run_files()
+        old = list(runs)[:-self.keep_runs] if self.keep_runs else list(runs)
+        if old:
+            history = self._load(self.history_path, {"runs": [], "tests": {}})
+            index = self._load(self.index_path, {"tests": {}, "indexed": {}})
+            for run_id in old:
+                totals = {"run": run_id, "passed": 0, "failed": 0, "error": 0, "skipped": 0, "duration": 0.0}
+                for record in self.read_records(runs[run_id]):
+                    outcome = record["outcome"]
+                    totals[outcome] = totals.get(outcome, 0) + 1
+                    totals["duration"] = round(totals["duration"] + record["duration"], 3)
+                    test = history["tests"].setdefault(record["nodeid"], {"runs": 0, "passed": 0, "failed": 0,
+                                                                          "skipped": 0, "total_duration": 0.0})
+                    test["runs"] += 1
+                    test[{"error": "failed"}.get(outcome, outcome)] += 1
+                    test["total_duration"] = round(test["total_duration"] + record["duration"], 3)
+                    if outcome in ("failed", "error"):
+                        test["last_failure"] = run_id
+                history["runs"].append(totals)
+                index["indexed"].pop(run_id, None)
+                for path in runs[run_id]:
+                    os.remove(path)
+            self._save(self.history_path, history)
+            self._save(self.index_path, index)
+        removed = self._sweep_attachments()
+        return {"runs_compacted": len(old), "attachments_removed": removed}
+
+    def _sweep_attachments(self) -> int:
+        # Still needed: anything a retained run or the current report links to
+        index = self._load(self.index_path, {"tests": {}})
+        keep = {path for entry in index["tests"].values() for path in entry.get("attachments", [])}
+        for paths in self.run_files().values():
+            for record in self.read_records(paths):
+                keep.update(a["path"] for a in record.get("attachments", []))
+        removed = 0
+        for path in glob.glob(os.path.join(self.root, "attachments", "*", "*")):
+            if os.path.relpath(path, self.root) not in keep:
+                os.remove(path)
+                removed += 1
+        return removed
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Build or compact the streaming test report.")
+    parser.add_argument("command", choices=["build", "compact"])
+    parser.add_argument("--root", help=f"Sink directory (default: {Config.REPORT_STREAM_DIR})")
+    parser.add_argument("--keep", type=int, help=f"Runs kept in full by compact (default: {Config.REPORT_KEEP_RUNS})")
+    args = parser.parse_args(argv)
+    builder = ReportBuilder(args.root, args.keep)
+    result = builder.compact() if args.command == "compact" else {}
+    result.update(builder.build())
+    print(", ".join(f"{k.replace('_', ' ')}: {v}" for k, v in result.items()))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
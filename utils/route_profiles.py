@@ -0,0 +1,129 @@
+import re
+from dataclasses import dataclass, field
+
+from playwright.sync_api import BrowserContext, Route
+
+ANALYTICS_PATTERN = re.compile(
+    r"google-analytics|googletagmanager|doubleclick|hotjar|segment\.(io|com)|mixpanel|clarity\.ms|newrelic|sentry"
+)
+CHART_LIBRARY_PATTERN = re.compile(r"(highcharts|chart(\.min)?\.js|echarts|apexcharts|d3(\.min)?\.js)", re.I)
+
+
+@dataclass(frozen=True)
+class RouteProfile:
+    name: str
+    block_types: frozenset = frozenset()
+    block_url: re.Pattern = None
+
+    def blocks(self, resource_type: str, url: str) -> bool:
+        return resource_type in self.block_types or bool(self.block_url and self.block_url.search(url))
+
+
+PROFILES = {
+    "full": RouteProfile("full"),
+    # Tables and numbers only: no images, fonts, media or third-party analytics
+    "minimal": RouteProfile("minimal", frozenset({"image", "font", "media"}), ANALYTICS_PATTERN),
+    # Like minimal, and also skips chart libraries for pure data checks
+    "data": RouteProfile("data", frozenset({"image", "font", "media"}),
+                         re.compile(f"{ANALYTICS_PATTERN.pattern}|{CHART_LIBRARY_PATTERN.pattern}", re.I)),
+}
+
+class ResourceSizes:
+    """Content-Length per URL, learned from the responses of every watched context.
+
+    A blocked request only counts towards bytes saved if its URL was loaded earlier in the
+    session, on any context and under any profile, so ``blocked_bytes`` is a lower bound.
+    """
+
+    def __init__(self):
+        self._sizes = {}
+        self._watched = set()
+
+    def watch(self, context: BrowserContext):
+        key = id(context)
+        if key in self._watched:
+            return
+        self._watched.add(key)
+        context.on("response", self._learn)
+        context.on("close", lambda _: self._watched.discard(key))
+
+    def get(self, url: str):
+        return self._sizes.get(url)
+
+    def _learn(self, response):
+        length = response.headers.get("content-length")
+        if length and length.isdigit():
+            self._sizes[response.url] = int(length)
+
+
+@dataclass
+class RouteStats:
+    blocked_requests: int = 0
+    blocked_bytes: int = 0      # lower bound: only requests whose size was seen earlier in the session
+    sized_requests: int = 0     # blocked requests that contributed to blocked_bytes
+    by_type: dict = field(default_factory=dict)
+
+    def copy(self) -> "RouteStats":
+        return RouteStats(self.blocked_requests, self.blocked_bytes, self.sized_requests, dict(self.by_type))
+
+    def since(self, earlier: "RouteStats") -> "RouteStats":
+        by_type = {k: v - earlier.by_type.get(k, 0) for k, v in self.by_type.items() if v - earlier.by_type.get(k, 0)}
+        return RouteStats(self.blocked_requests - earlier.blocked_requests, self.blocked_bytes - earlier.blocked_bytes,
+                          self.sized_requests - earlier.sized_requests, by_type)
+
+    def describe(self) -> str:
+        kinds = ", ".join(f"{k}: {v}" for k, v in sorted(self.by_type.items()))
+        return (f"{self.blocked_requests} request(s) blocked ({kinds}), at least {self.blocked_bytes / 1024:.1f} KiB "
+                f"saved (sizes of {self.sized_requests} of them, seen earlier in the run)")
+
+
+class ContextRouter:
+    """Applies a named ``RouteProfile`` to every request of a browser context.
+
+    The route handler is only installed the first time a blocking profile is used, so
+    contexts that stay on ``full`` pay nothing. Allowed requests fall back to any other
+    handlers on the context (e.g. --replay), blocked ones are aborted and counted.
+    """
+
+    _routers = {}
+
+    def __init__(self, context: BrowserContext, sizes: ResourceSizes):
+        self.context = context
+        self.sizes = sizes
+        self.profile = PROFILES["full"]
+        self.stats = RouteStats()
+        self._installed = False
+
+    @classmethod
+    def for_context(cls, context: BrowserContext, sizes: ResourceSizes) -> "ContextRouter":
+        key = id(context)
+        if key not in cls._routers:
+            cls._routers[key] = cls(context, sizes)
+            context.on("close", lambda _: cls._routers.pop(key, None))
+        return cls._routers[key]
+
+    @classmethod
+    def exists(cls, context: BrowserContext) -> bool:
+        return id(context) in cls._routers
+
+    def use(self, name: str):
+        if name not in PROFILES:
+            raise ValueError(f"Unknown route profile '{name}'. Available: {', '.join(PROFILES)}")
+        self.profile = PROFILES[name]
+        if self.profile.block_types or self.profile.block_url:
+            if not self._installed:
+                self.context.route("**/*", self._handle)
+                self._installed = True
+
+    def _handle(self, route: Route):
+        request = route.request
+        if not self.profile.blocks(request.resource_type, request.url):
+            route.fallback()
+            return
+        self.stats.blocked_requests += 1
+        size = self.sizes.get(request.url)
+        if size is not None:
+            self.stats.blocked_bytes += size
+            self.stats.sized_requests += 1
+        self.stats.by_type[request.resource_type] = self.stats.by_type.get(request.resource_type, 0) + 1
+        route.abort("blockedbyclient")
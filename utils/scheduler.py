@@ -0,0 +1,205 @@
+"""History-driven ordering and selection of test modules.
+
+Past outcomes and durations come from ``allure-results/*-result.json`` (parsed once and cached in
+``reports/test_history.json``) and from the streaming report sink (``reports/stream``). Modules
+whose tests failed on their latest run go first, the rest longest-first, so parallel workers
+pick the big modules early and finish together. Modules are the unit: tests inside a module
+keep their order, because several modules build on the previous test's page state.
+
+``--changed-pages REF`` keeps only the test modules that import (directly, or through another
+page object such as ``pages.aio``) a file under ``pages/`` changed since ``REF``.
+"""
+import ast
+import glob
+import json
+import logging
+import os
+import statistics
+import subprocess
+import time
+from dataclasses import dataclass, field
+
+from utils.config import Config, ROOT_DIR
+
+PAGES_DIR = os.path.join(ROOT_DIR, "pages")
+logger = logging.getLogger("rak.scheduler")
+_OUTCOMES = {"passed": "passed", "failed": "failed", "broken": "error", "error": "error", "skipped": "skipped"}
+
+
+def allure_nodeid(full_name: str) -> str:
+    """``tests.test_login#test_login_success`` -> ``tests/test_login.py::test_login_success``."""
+    module, _, name = full_name.partition("#")
+    return module.replace(".", "/") + ".py::" + name
+
+
+def module_of(nodeid: str) -> str:
+    return nodeid.split("::", 1)[0]
+
+
+@dataclass
+class ModuleHistory:
+    path: str
+    duration: float = 0.0       # seconds, sum of each test's typical duration
+    last_failure: float = 0.0   # timestamp of the newest run in which one of its tests failed
+    tests: int = 0
+
+
+@dataclass
+class TestHistory:
+    results: dict = field(default_factory=dict)   # nodeid -> [(timestamp, outcome, duration)], oldest first
+
+    def add(self, nodeid: str, timestamp: float, outcome: str, duration: float):
+        self.results.setdefault(nodeid, []).append((timestamp, _OUTCOMES.get(outcome, outcome), duration))
+
+    @classmethod
+    def load(cls, allure_dir: str = None, stream_dir: str = None, cache_path: str = None) -> "TestHistory":
+        history = cls()
+        history._load_allure(allure_dir or os.path.join(ROOT_DIR, "allure-results"),
+                             cache_path or Config.TEST_HISTORY_CACHE)
+        history._load_stream(stream_dir or Config.REPORT_STREAM_DIR)
+        for records in history.results.values():
+            records.sort()
+        return history
+
+    def _load_allure(self, allure_dir: str, cache_path: str):
+        cache = {}
+        if os.path.exists(cache_path):
+            with open(cache_path, encoding="utf-8") as f:
+                cache = json.load(f)
+        current = {}
+        for path in glob.glob(os.path.join(allure_dir, "*-result.json")):
+            name = os.path.basename(path)
+            entry = cache.get(name)
+            if entry is None:
+                try:
+                    with open(path, encoding="utf-8") as f:
+                        result = json.load(f)
+                    entry = [allure_nodeid(result["fullName"]), result["start"] / 1000, result["status"],
+                             max(0, result["stop"] - result["start"]) / 1000]
+                except (KeyError, ValueError, OSError):
+                    entry = []  # remember unreadable files too, so they aren't parsed again
+            current[name] = entry
+            if entry:
+                self.add(*entry)
+        if current != cache:
+            os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+            with open(cache_path, "w", encoding="utf-8") as f:
+                json.dump(current, f)
+
+    def _load_stream(self, stream_dir: str):
+        history_path = os.path.join(stream_dir, "history.json")
+        if os.path.exists(history_path):
+            with open(history_path, encoding="utf-8") as f:
+                rolled_up = json.load(f)
+            for nodeid, test in rolled_up.get("tests", {}).items():
+                if test.get("runs"):
+                    # One synthetic record stands in for the rolled-up runs
+                    failed_at = _run_time(test["last_failure"]) if test.get("last_failure") else 0.0
+                    self.add(nodeid, failed_at, "failed" if failed_at else "passed",
+                             test["total_duration"] / test["runs"])
+        for path in glob.glob(os.path.join(stream_dir, "runs", "*.jsonl")):
+            with open(path, encoding="utf-8") as f:
+                for line in f:
+                    try:
+                        record = json.loads(line)
+                    except ValueError:
+                        continue
+                    self.add(record["nodeid"], record.get("finished", 0.0), record["outcome"], record["duration"])
+
+    def modules(self) -> dict:
+        modules = {}
+        for nodeid, records in self.results.items():
+            module = modules.setdefault(module_of(nodeid), ModuleHistory(module_of(nodeid)))
+            module.tests += 1
+            module.duration += statistics.median(r[2] for r in records[-5:])
+            timestamp, outcome, _ = records[-1]
+            if outcome in ("failed", "error"):
+                module.last_failure = max(module.last_failure, timestamp)
+        return modules
+
+    def order(self, modules: list) -> list:
+        """Recently failed modules first (newest failure first), then the rest longest-first.
+
+        ``modules`` are file paths; modules without history count as average length.
+        """
+        known = self.modules()
+        durations = [m.duration for m in known.values()] or [0.0]
+        average = sum(durations) / len(durations)
+
+        def key(path):
+            module = known.get(os.path.relpath(os.path.abspath(path), ROOT_DIR).replace(os.sep, "/"))
+            if module is None:
+                return (1, 0.0, -average)
+            return (0 if module.last_failure else 1, -module.last_failure, -module.duration)
+
+        return sorted(modules, key=key)
+
+
+def _run_time(run_id: str) -> float:
+    try:
+        return time.mktime(time.strptime(run_id[:15], "%Y%m%d-%H%M%S"))
+    except ValueError:
+        return 0.0
+
+
+# --- --changed-pages ----------------------------------------------------------------------
+
+def _module_name(path: str) -> str:
+    relative = os.path.relpath(os.path.abspath(path), ROOT_DIR)
+    name = os.path.splitext(relative)[0].replace(os.sep, ".")
+    return name[:-len(".__init__")] if name.endswith(".__init__") else name
+
+
+def imports_of(path: str) -> set:
+    with open(path, encoding="utf-8") as f:
+        tree = ast.parse(f.read(), path)
+    names = set()
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Import):
+            names.update(alias.name for alias in node.names)
+        elif isinstance(node, ast.ImportFrom) and node.module and not node.level:
+            names.add(node.module)
+            names.update(f"{node.module}.{alias.name}" for alias in node.names)
+    return names
+
+
+def changed_files(ref: str) -> list:
+    """Files changed since ``ref``: committed, staged and uncommitted."""
+    output = subprocess.run(["git", "diff", "--name-only", ref, "--"], cwd=ROOT_DIR,
+                            capture_output=True, text=True, check=True).stdout
+    untracked = subprocess.run(["git", "ls-files", "--others", "--exclude-standard"], cwd=ROOT_DIR,
+                               capture_output=True, text=True, check=True).stdout
+    return [line for line in (output + untracked).splitlines() if line.endswith(".py")]
+
+
+def affected_page_modules(changed: list) -> set:
+    """Changed page modules plus every page module importing one of them, transitively."""
+    page_imports = {_module_name(p): imports_of(p) for p in glob.glob(os.path.join(PAGES_DIR, "**", "*.py"),
+                                                                        recursive=True)}
+    affected = {_module_name(os.path.join(ROOT_DIR, p)) for p in changed
+                if os.path.abspath(os.path.join(ROOT_DIR, p)).startswith(PAGES_DIR + os.sep)}
+    grew = True
+    while grew:
+        grew = False
+        for module, imports in page_imports.items():
+            if module not in affected and imports & affected:
+                affected.add(module)
+                grew = True
+    return affected
+
+
+def select_for_changed_pages(test_modules: list, ref: str) -> list:
+    """The test modules touched by page-object changes since ``ref`` (or changed themselves).
+
+    When git is missing or cannot resolve ``ref``, every module is kept.
+    """
+    try:
+        changed = changed_files(ref)
+    except (OSError, subprocess.CalledProcessError) as exc:
+        detail = getattr(exc, "stderr", None) or exc
+        logger.warning("Could not list changes since '%s', running every module: %s", ref, str(detail).strip())
+        return list(test_modules)
+    affected = affected_page_modules(changed)
+    changed_tests = {os.path.abspath(os.path.join(ROOT_DIR, p)) for p in changed}
+    return [m for m in test_modules
+            if os.path.abspath(m) in changed_tests or imports_of(m) & affected]
@@ -0,0 +1,4 @@
+from utils.stub_server.app import StubServer
+from utils.stub_server.data import StubData
+
+__all__ = ["StubServer", "StubData"]
@@ -0,0 +1,38 @@
+"""Runs the stand-in RAK-WBG server.
+
+    python -m utils.stub_server --port 8765 --seed 7 --latency-ms 40
+    BASE_URL=http://127.0.0.1:8765/ pytest --replay   # or any normal run
+"""
+import argparse
+
+from utils.stub_server.app import StubServer
+from utils.stub_server.data import StubData
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Local stand-in for the RAK-WBG web app.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--seed", type=int, default=0, help="Seed for the generated RMs, facilities and tasks")
+    parser.add_argument("--data", help="JSON file with StubData fields (overrides --seed)")
+    parser.add_argument("--rms", type=int, default=8, help="Number of RMs in the Pipeline table")
+    parser.add_argument("--facilities", type=int, default=6, help="Facility types per Portfolio level")
+    parser.add_argument("--latency-ms", type=float, default=0, help="Delay added to every response")
+    parser.add_argument("--jitter-ms", type=float, default=0, help="Random +/- spread around --latency-ms")
+    parser.add_argument("--dump", help="Write the generated data to this JSON file and exit")
+    args = parser.parse_args(argv)
+
+    data = StubData.load(args.data) if args.data else StubData.generate(args.seed, args.rms, args.facilities)
+    if args.dump:
+        data.dump(args.dump)
+        return
+    server = StubServer(args.host, args.port, data, args.latency_ms, args.jitter_ms)
+    print(f"RAK-WBG stand-in serving {server.url} (user {data.username})", flush=True)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
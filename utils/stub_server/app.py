@@ -0,0 +1,242 @@
+import json
+import random
+import re
+import secrets
+import threading
+import time
+from http.cookies import SimpleCookie
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+from utils.stub_server import views
+from utils.stub_server.data import COLUMNS, StubData
+
+SESSION_COOKIE = "rak_session"
+PLACEHOLDER_PAGES = {"/arm": "ARM", "/account-planning": "Account Planning", "/companies": "Companies",
+                     "/threads": "Threads", "/mir": "MIR", "/pastdues": "Past Dues"}
+
+
+class StubServer:
+    """Lightweight stand-in for the RAK-WBG web app, for offline and overhead-measurement runs.
+
+    Serves the login form, sidebar layout, dashboard cards, Pipeline/Portfolio tables and the
+    kanban board from seedable ``StubData``, with an optional per-response latency::
+
+        with StubServer(data=StubData.generate(seed=7), latency_ms=50) as server:
+            os.environ["BASE_URL"] = server.url
+    """
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 0, data: StubData = None,
+                 latency_ms: float = 0, jitter_ms: float = 0):
+        self.data = data or StubData.generate()
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+        self.sessions = set()
+        self.lock = threading.Lock()
+        self.httpd = ThreadingHTTPServer((host, port), _handler_for(self))
+        self.httpd.daemon_threads = True
+        self._thread = None
+
+    @property
+    def url(self) -> str:
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host}:{port}/"
+
+    def start(self) -> "StubServer":
+        self._thread = threading.Thread(target=self.httpd.serve_forever, name="stub-server", daemon=True)
+        self._thread.start()
+        return self
+
+    def serve_forever(self):
+        self.httpd.serve_forever()
+
+    def stop(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+        if self._thread:
+            self._thread.join()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+    def delay(self):
+        if self.latency_ms or self.jitter_ms:
+            time.sleep(max(0.0, self.latency_ms + random.uniform(-self.jitter_ms, self.jitter_ms)) / 1000)
+
+
+def _handler_for(server: StubServer):
+    class Handler(RequestHandler):
+        stub = server
+    return Handler
+
+
+class RequestHandler(BaseHTTPRequestHandler):
+    stub: StubServer = None
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, format, *args):
+        pass  # keep test output clean
+
+    # --- Plumbing ------------------------------------------------------------------
+
+    @property
+    def path_only(self) -> str:
+        path = re.sub(r"/{2,}", "/", urlsplit(self.path).path)
+        return path.rstrip("/") or "/"
+
+    @property
+    def query(self) -> dict:
+        return {k: v[0] for k, v in parse_qs(urlsplit(self.path).query).items()}
+
+    def parse_request(self) -> bool:
+        self._cached_body = None  # the handler instance is reused across keep-alive requests
+        return super().parse_request()
+
+    def _body(self) -> bytes:
+        # Read once and cache: an unread body would corrupt the next request on a keep-alive connection
+        if self._cached_body is None:
+            length = int(self.headers.get("Content-Length") or 0)
+            self._cached_body = self.rfile.read(length) if length else b""
+        return self._cached_body
+
+    def _json_body(self) -> dict:
+        body = self._body()
+        return json.loads(body) if body else {}
+
+    def _send(self, status: int, body: bytes = b"", content_type: str = "text/html; charset=utf-8", headers: dict = None):
+        self._body()
+        self.stub.delay()
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        for key, value in (headers or {}).items():
+            self.send_header(key, value)
+        self.end_headers()
+        if self.command != "HEAD":
+            self.wfile.write(body)
+
+    def _html(self, html: str, status: int = 200):
+        self._send(status, html.encode("utf-8"))
+
+    def _json(self, payload, status: int = 200):
+        self._send(status, json.dumps(payload).encode("utf-8"), "application/json")
+
+    def _redirect(self, location: str, headers: dict = None):
+        self._send(302, headers={"Location": location, **(headers or {})})
+
+    def _session(self):
+        cookie = SimpleCookie(self.headers.get("Cookie", ""))
+        token = cookie[SESSION_COOKIE].value if SESSION_COOKIE in cookie else None
+        return token if token in self.stub.sessions else None
+
+    # --- Routes --------------------------------------------------------------------
+
+    def do_GET(self):
+        path, data = self.path_only, self.stub.data
+        if path == "/static/logo.svg":
+            return self._send(200, views.LOGO_SVG.encode("utf-8"), "image/svg+xml", {"Cache-Control": "max-age=3600"})
+        if path == "/login":
+            return self._redirect("/dashboard") if self._session() else self._html(views.login_page())
+        if not self._session():
+            if path.startswith("/api/"):
+                return self._json({"error": "unauthorized"}, 401)
+            return self._redirect("/login")
+
+        if path in ("/", "/dashboard"):
+            return self._html(views.dashboard_page(data))
+        if path == "/pipeline":
+            return self._html(views.pipeline_page(data))
+        if path == "/portfolio":
+            return self._html(views.portfolio_page(data))
+        if path == "/scrumboard/kanban":
+            return self._html(views.taskboard_page(data))
+        if path in PLACEHOLDER_PAGES:
+            return self._html(views.placeholder_page(data, PLACEHOLDER_PAGES[path]))
+        if path == "/api/pipeline":
+            rows = data.pipeline_rows(self.query.get("q", ""), self.query.get("sort"))
+            return self._json({"rows": rows, "total": views.total_row(rows, 7)})
+        if path == "/api/portfolio":
+            rows = data.portfolio_rows(self.query.get("level", "WBG Level"), self.query.get("q", ""))
+            return self._json({"rows": rows, "total": views.total_row(rows, 12)})
+        if path == "/api/tasks":
+            with self.stub.lock:
+                tasks = [dict(t) for t in data.tasks]
+            return self._json({"tasks": tasks, "columns": COLUMNS})
+        self._html("<h1>Not found</h1>", 404)
+
+    do_HEAD = do_GET
+
+    def do_POST(self):
+        path = self.path_only
+        if path == "/login":
+            form = {k: v[0] for k, v in parse_qs(self._body().decode("utf-8")).items()}
+            data = self.stub.data
+            if form.get("email") == data.username and form.get("password") == data.password:
+                token = secrets.token_hex(16)
+                self.stub.sessions.add(token)
+                return self._redirect("/dashboard", {"Set-Cookie": f"{SESSION_COOKIE}={token}; Path=/; HttpOnly"})
+            return self._html(views.login_page("Invalid username or password"))
+        if path == "/logout":
+            self.stub.sessions.discard(self._session())
+            return self._redirect("/login", {"Set-Cookie": f"{SESSION_COOKIE}=; Path=/; Max-Age=0"})
+        if not self._session():
+            return self._json({"error": "unauthorized"}, 401)
+        if path == "/api/tasks":
+            body = self._json_body()
+            with self.stub.lock:
+                task = {"id": self.stub.data.next_task_id(), "title": body.get("title", "Untitled"),
+                        "column": int(body.get("column", 0)), "due": body.get("due", time.strftime("%b %d")),
+                        "assignees": body.get("assignees", [])}
+                self.stub.data.tasks.append(task)
+            return self._json(task, 201)
+        if path == "/api/tasks/bulk-delete":
+            ids = set(self._json_body().get("ids", []))
+            with self.stub.lock:
+                before = len(self.stub.data.tasks)
+                self.stub.data.tasks = [t for t in self.stub.data.tasks if t["id"] not in ids]
+                deleted = before - len(self.stub.data.tasks)
+            return self._json({"deleted": deleted})
+        self._json({"error": "not found"}, 404)
+
+    def do_PATCH(self):
+        task_id = self._task_id()
+        if task_id is None:
+            return
+        body = self._json_body()
+        updated = None
+        with self.stub.lock:
+            for task in self.stub.data.tasks:
+                if task["id"] == task_id:
+                    task.update({k: body[k] for k in ("title", "column", "due", "assignees") if k in body})
+                    updated = dict(task)
+        if updated:
+            self._json(updated)
+        else:
+            self._json({"error": "not found"}, 404)
+
+    def do_DELETE(self):
+        task_id = self._task_id()
+        if task_id is None:
+            return
+        with self.stub.lock:
+            before = len(self.stub.data.tasks)
+            self.stub.data.tasks = [t for t in self.stub.data.tasks if t["id"] != task_id]
+            found = len(self.stub.data.tasks) != before
+        if found:
+            self._send(204)
+        else:
+            self._json({"error": "not found"}, 404)
+
+    def _task_id(self):
+        """Resolves /api/tasks/<id> for an authenticated caller, answering the error itself otherwise."""
+        if not self._session():
+            self._json({"error": "unauthorized"}, 401)
+            return None
+        match = re.fullmatch(r"/api/tasks/(\d+)", self.path_only)
+        if not match:
+            self._json({"error": "not found"}, 404)
+            return None
+        return int(match.group(1))
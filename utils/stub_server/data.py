@@ -0,0 +1,113 @@
+import json
+import random
+from dataclasses import asdict, dataclass, field
+
+# First names stay alphabetically before "Total" so the total row can sit last in tbody
+FIRST_NAMES = ["Aisha", "Bilal", "Carlos", "Dana", "Elena", "Farah", "Gabriel", "Hassan", "Imran",
+               "Jasmine", "Karim", "Layla", "Nadia", "Omar", "Priya", "Rashid", "Sara"]
+LAST_NAMES = ["Al Nuaimi", "Haddad", "Khan", "Mansour", "Nair", "Qureshi", "Rahman", "Saleh"]
+FACILITY_TYPES = ["RCF", "Term Loan", "Overdraft", "Trade Finance", "LC", "Guarantee", "Bill Discounting",
+                  "Working Capital", "Project Finance", "Syndicated Loan"]
+LEVELS = ["WBG Level", "Region Level"]
+COLUMNS = ["To-Do", "In Progress", "Review", "Done"]
+CARD_TITLES = ["Past Dues", "DBR", "Balance Sheet", "MIR", "Pipeline Snapshot", "Portfolio Summary",
+               "Profitability", "Liquidity", "Receivables", "Payables", "Escrow", "Corporate Cards"]
+SIDEBAR_ITEMS = [("Dashboard", "/dashboard"), ("ARM", "/arm"), ("Pipeline", "/pipeline"), ("Portfolio", "/portfolio"),
+                 ("Task Board", "/scrumboard/kanban"), ("Account Planning", "/account-planning"),
+                 ("Companies", "/companies"), ("Threads", "/threads")]
+
+
+@dataclass
+class StubData:
+    """Everything the stand-in server renders. Deterministic for a given seed."""
+    username: str = "clarkem"
+    password: str = "1234"
+    display_name: str = "Martin Clarke"
+    rms: list = field(default_factory=list)
+    facilities: list = field(default_factory=list)
+    tasks: list = field(default_factory=list)
+    receivables: dict = field(default_factory=lambda: {"total": 1500, "transactions": 2})
+
+    @classmethod
+    def generate(cls, seed: int = 0, rm_count: int = 8, facility_count: int = 6, task_count: int = 6,
+                 username: str = "clarkem", password: str = "1234") -> "StubData":
+        rnd = random.Random(seed)
+
+        def amount() -> int:
+            return rnd.randrange(0, 900) * 1000
+
+        rms = [{"name": "Martin Clarke"}]
+        names = {"Martin Clarke"}
+        while len(rms) < rm_count and len(names) <= len(FIRST_NAMES) * len(LAST_NAMES):
+            name = f"{rnd.choice(FIRST_NAMES)} {rnd.choice(LAST_NAMES)}"
+            if name not in names:
+                names.add(name)
+                rms.append({"name": name})
+        # Past the name space, the drawn names come round again with a numeric suffix ("Aisha Khan 2")
+        drawn = [rm["name"] for rm in rms[1:]]
+        for i in range(rm_count - len(rms)):
+            rms.append({"name": f"{drawn[i % len(drawn)]} {i // len(drawn) + 2}"})
+        for rm in rms:
+            rm.update(pending_funded=amount(), pending_non_funded=amount(),
+                      pipeline_funded=amount(), pipeline_non_funded=amount())
+
+        facilities = []
+        for level in LEVELS:
+            for facility_type in FACILITY_TYPES[:max(1, facility_count)]:
+                facilities.append({
+                    "type": facility_type, "level": level,
+                    "groups": [[amount(), amount()] for _ in range(3)],
+                    "existing_new": rnd.choice(["Existing", "New"]), "new_funded": amount(),
+                })
+
+        tasks = [
+            {"id": 1, "title": "TASK 1", "column": 0, "due": "Jul 23", "assignees": ["MC"]},
+            {"id": 2, "title": "First Task", "column": 1, "due": "Jul 24", "assignees": ["RA", "MC"]},
+        ]
+        for i in range(len(tasks), task_count):
+            tasks.append({"id": i + 1, "title": f"Seed Task {i + 1}", "column": rnd.randrange(len(COLUMNS)),
+                          "due": f"Aug {rnd.randrange(1, 29)}", "assignees": rnd.sample(["MC", "RA", "SK", "JL"], 2)})
+
+        return cls(username=username, password=password, rms=rms, facilities=facilities, tasks=tasks)
+
+    @classmethod
+    def load(cls, path: str) -> "StubData":
+        with open(path, encoding="utf-8") as f:
+            return cls(**json.load(f))
+
+    def dump(self, path: str):
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(asdict(self), f, indent=2)
+
+    # --- Derived views -------------------------------------------------------------
+
+    def pipeline_rows(self, query: str = "", sort: str = None) -> list:
+        rows = [r for r in self.rms if query.lower() in r["name"].lower()]
+        if sort == "asc":
+            rows = sorted(rows, key=lambda r: r["name"])
+        elif sort == "desc":
+            rows = sorted(rows, key=lambda r: r["name"], reverse=True)
+        return [[r["name"],
+                 r["pending_funded"], r["pending_non_funded"], r["pending_funded"] + r["pending_non_funded"],
+                 r["pipeline_funded"], r["pipeline_non_funded"], r["pipeline_funded"] + r["pipeline_non_funded"]]
+                for r in rows]
+
+    def portfolio_rows(self, level: str = "WBG Level", query: str = "") -> list:
+        rows = []
+        for f in self.facilities:
+            if f["level"] != level or query.lower() not in f["type"].lower():
+                continue
+            cells = [f["type"]]
+            for funded, non_funded in f["groups"]:
+                cells += [funded, non_funded, funded + non_funded]
+            rows.append(cells + [f["existing_new"], f["new_funded"]])
+        return rows
+
+    def pipeline_snapshot(self) -> dict:
+        """Totals shown on the dashboard's Pipeline Snapshot card (same source as the Pipeline table)."""
+        funded = sum(r["pipeline_funded"] for r in self.rms)
+        non_funded = sum(r["pipeline_non_funded"] for r in self.rms)
+        return {"funded": funded, "non_funded": non_funded, "total": funded + non_funded}
+
+    def next_task_id(self) -> int:
+        return max((t["id"] for t in self.tasks), default=0) + 1
@@ -0,0 +1,281 @@
+"""HTML for the stand-in server. Markup mirrors the selectors used by the page objects in pages/."""
+from html import escape
+
+from utils.stub_server.data import CARD_TITLES, COLUMNS, SIDEBAR_ITEMS, StubData
+
+LOGO_SVG = (
+    '<svg xmlns="http://www.w3.org/2000/svg" width="120" height="32" viewBox="0 0 120 32">'
+    '<rect width="120" height="32" rx="4" fill="#b0123b"/>'
+    '<text x="60" y="21" font-family="Arial" font-size="14" fill="#fff" text-anchor="middle">RAKtrack</text></svg>'
+)
+
+STYLE = """
+body { margin: 0; font-family: Arial, sans-serif; color: #1f1f1f; }
+header { display: flex; align-items: center; gap: 16px; padding: 8px 16px; border-bottom: 1px solid #ddd; }
+header .welcome { flex: 1; }
+.shell { display: flex; flex-wrap: wrap; }
+nav { width: 200px; border-right: 1px solid #ddd; }
+nav ul { list-style: none; margin: 0; padding: 8px 0; }
+nav li a { display: block; padding: 8px 16px; color: inherit; text-decoration: none; }
+main { flex: 1; min-width: 300px; padding: 16px; }
+.toolbar { display: flex; gap: 8px; align-items: center; margin-bottom: 12px; flex-wrap: wrap; }
+table { border-collapse: collapse; width: 100%; }
+th, td { border: 1px solid #ddd; padding: 4px 8px; text-align: right; }
+th:first-child, td:first-child { text-align: left; }
+th { cursor: pointer; background: #fafafa; }
+.cards { display: grid; grid-template-columns: repeat(auto-fill, minmax(240px, 1fr)); gap: 12px; }
+.card { border: 1px solid #ddd; border-radius: 6px; padding: 8px; }
+.card-header { display: flex; justify-content: space-between; font-weight: bold; }
+.ant-select-selector, [role=combobox] { border: 1px solid #ccc; padding: 4px 8px; min-width: 120px; cursor: pointer; }
+[role=listbox] { border: 1px solid #ccc; background: #fff; }
+[role=option] { padding: 4px 8px; cursor: pointer; }
+.kanban { display: grid; grid-template-columns: repeat(4, minmax(160px, 1fr)); gap: 12px; }
+.kanban-column { background: #f5f5f5; border-radius: 6px; padding: 8px; min-height: 200px; }
+.column-header { display: flex; align-items: center; gap: 8px; }
+.task-card { background: #fff; border: 1px solid #ddd; border-radius: 4px; padding: 6px; margin-top: 8px; }
+.user-tag { display: inline-block; background: #eee; border-radius: 8px; padding: 0 6px; margin-right: 4px; }
+.dropdown, [role=dialog] { position: fixed; top: 80px; left: 40%; background: #fff; border: 1px solid #ccc; padding: 8px; z-index: 10; }
+.dropdown [role=menuitem] { padding: 4px 12px; cursor: pointer; }
+#toast { position: fixed; top: 12px; right: 12px; }
+.error { color: #b0123b; }
+@media (max-width: 600px) { nav { width: 100%; border-right: 0; } .kanban { grid-template-columns: 1fr; } }
+"""
+
+# Shared client helpers; each page appends its own script.
+COMMON_SCRIPT = """
+const fmt = (n) => typeof n === 'number' ? n.toLocaleString('en-US') : String(n);
+const esc = (s) => String(s).replace(/[&<>"']/g, (c) => ({'&': '&amp;', '<': '&lt;', '>': '&gt;', '"': '&quot;', "'": '&#39;'}[c]));
+async function api(method, url, body) {
+  const res = await fetch(url, { method, headers: { 'Content-Type': 'application/json' },
+                                 body: body === undefined ? undefined : JSON.stringify(body) });
+  if (!res.ok) throw new Error(method + ' ' + url + ' -> ' + res.status);
+  return res.status === 204 ? null : res.json();
+}
+function renderRows(tbody, rows, total, width) {
+  if (!rows.length) { tbody.innerHTML = '<tr><td colspan="' + width + '">No data</td></tr>'; return; }
+  tbody.innerHTML = rows.concat([total]).map((r) => '<tr>' + r.map((c) => '<td>' + esc(fmt(c)) + '</td>').join('') + '</tr>').join('');
+}
+"""
+
+
+def _fmt(value) -> str:
+    return f"{value:,}" if isinstance(value, int) else str(value)
+
+
+def _rows_html(rows: list, total: list, width: int) -> str:
+    if not rows:
+        return f'<tr><td colspan="{width}">No data</td></tr>'
+    return "".join("<tr>" + "".join(f"<td>{escape(_fmt(c))}</td>" for c in row) + "</tr>" for row in rows + [total])
+
+
+def total_row(rows: list, width: int) -> list:
+    """'Total' followed by column sums; non-numeric columns show '-'."""
+    totals = ["Total"]
+    for c in range(1, width):
+        values = [r[c] for r in rows]
+        totals.append(sum(values) if all(isinstance(v, int) for v in values) else "-")
+    return totals
+
+
+def layout(data: StubData, title: str, body: str, script: str = "") -> str:
+    menu = "".join(f'<li class="ant-menu-item"><a href="{href}">{escape(label)}</a></li>' for label, href in SIDEBAR_ITEMS)
+    return f"""<!doctype html>
+<html lang="en"><head><meta charset="utf-8"><meta name="viewport" content="width=device-width, initial-scale=1">
+<title>RAKtrack | {escape(title)}</title><style>{STYLE}</style></head>
+<body>
+<div id="popup-root"></div>
+<header><img alt="logo" src="/static/logo.svg" width="120" height="32"><span class="welcome">Hi! {escape(data.display_name)}</span>
+<form method="post" action="/logout"><button type="submit">Logout</button></form></header>
+<div class="shell"><nav aria-label="Main menu"><ul class="ant-menu">{menu}</ul></nav>
+<main>{body}</main></div>
+<script>{COMMON_SCRIPT}{script}</script>
+</body></html>"""
+
+
+def login_page(error: str = "") -> str:
+    message = f'<p class="error" role="alert">{escape(error)}</p>' if error else ""
+    return f"""<!doctype html>
+<html lang="en"><head><meta charset="utf-8"><title>RAKtrack | Login</title><style>{STYLE}</style></head>
+<body><main><img alt="logo" src="/static/logo.svg" width="120" height="32">
+<form method="post" action="/login" class="login-form">
+<input id="login_email" name="email" placeholder="* Email or User ID" aria-label="Email or User ID">
+<input id="login_password" name="password" type="password" placeholder="* Password" aria-label="Password">
+<button type="submit">Login</button>{message}
+</form></main></body></html>"""
+
+
+def placeholder_page(data: StubData, title: str) -> str:
+    body = f'<h1 class="page-title">{escape(title)}</h1><button type="button" onclick="location.href=\'/dashboard\'">Back</button>'
+    return layout(data, title, body)
+
+
+def _pairs(pairs: list) -> str:
+    # Label and value are adjacent siblings: the page objects read label.nextSibling
+    return "".join(f'<div class="metric"><span class="label">{escape(k)}</span><span class="value">{escape(str(v))}</span></div>'
+                   for k, v in pairs)
+
+
+def dashboard_page(data: StubData) -> str:
+    snapshot = data.pipeline_snapshot()
+    pending_funded = sum(r["pending_funded"] for r in data.rms)
+    pending_non_funded = sum(r["pending_non_funded"] for r in data.rms)
+    bodies = {
+        "Pipeline Snapshot": (
+            '<div class="snapshot-group"><span class="group-title">Pending</span>'
+            + _pairs([("Funded", pending_funded), ("Non-Funded", pending_non_funded),
+                      ("Total", pending_funded + pending_non_funded)]) + "</div>"
+            '<div class="snapshot-group"><span class="group-title">Pipeline</span>'
+            + _pairs([("Funded", snapshot["funded"]), ("Non-Funded", snapshot["non_funded"]), ("Total", snapshot["total"])])
+            + "</div>"
+        ),
+        "Profitability": _pairs([("Revenue", "AED 1,250,000"), ("Net Profit", "AED 310,000")]),
+        "Receivables": _pairs([("Total Receivables (AED)", data.receivables["total"]),
+                               ("Total Transactions", data.receivables["transactions"])]),
+        "Balance Sheet": _pairs([("Assets Value", "AED 0"), ("Liabilities", "AED 0")]),
+        "Liquidity": _pairs([("Current Ratio", "1.4")]),
+    }
+    links = {"Past Dues": "/pastdues", "MIR": "/mir", "Pipeline Snapshot": "/pipeline", "Portfolio Summary": "/portfolio"}
+    cards = "".join(
+        f'<div class="card"><div class="card-header"><span class="card-title">{escape(title)}</span>'
+        f'<a href="{links.get(title, "/dashboard")}">View Details</a></div>'
+        f'<div class="card-body">{bodies.get(title, _pairs([("Count", 0)]))}</div>'
+        f'<div class="card-footer"><button type="button" class="show-trends">Show Trends</button>'
+        f'<div class="trends" hidden></div></div></div>'
+        for title in CARD_TITLES
+    )
+    script = """
+document.querySelectorAll('.show-trends').forEach((btn) => btn.addEventListener('click', () => {
+  const trends = btn.nextElementSibling;
+  trends.hidden = !trends.hidden;
+  trends.textContent = trends.hidden ? '' : 'Last 6 months: ▁▃▅▆▇█';
+}));
+"""
+    return layout(data, "Dashboard", f'<h1 class="page-title">Dashboard</h1><div class="cards">{cards}</div>', script)
+
+
+def pipeline_page(data: StubData) -> str:
+    rows = data.pipeline_rows()
+    headers = ["RM Name", "Pending Funded", "Pending Non-Funded", "Pending Total",
+               "Pipeline Funded", "Pipeline Non-Funded", "Pipeline Total"]
+    body = f"""<h1 class="page-title">Pipeline Snapshot</h1>
+<div class="toolbar"><button type="button" onclick="location.href='/dashboard'">Back</button>
+<input type="search" id="rm-search" placeholder="Search RM" aria-label="Search RM">
+<div class="ant-select"><div class="ant-select-selector" tabindex="0" role="button" aria-label="Level">WBG Level</div></div></div>
+<table aria-label="Pipeline by RM"><thead><tr>{"".join(f"<th>{h}</th>" for h in headers)}</tr></thead>
+<tbody>{_rows_html(rows, total_row(rows, 7), 7)}</tbody></table>"""
+    script = """
+let sort = null;
+async function refresh() {
+  const q = document.getElementById('rm-search').value;
+  const data = await api('GET', '/api/pipeline?q=' + encodeURIComponent(q) + (sort ? '&sort=' + sort : ''));
+  renderRows(document.querySelector('table tbody'), data.rows, data.total, 7);
+}
+document.getElementById('rm-search').addEventListener('keydown', (e) => { if (e.key === 'Enter') refresh(); });
+document.querySelector('th').addEventListener('click', () => { sort = sort === 'asc' ? 'desc' : 'asc'; refresh(); });
+"""
+    return layout(data, "Pipeline", body, script)
+
+
+def portfolio_page(data: StubData) -> str:
+    rows = data.portfolio_rows()
+    headers = ["Facility Type"] + ["Funded", "Non Funded", "Total"] * 3 + ["Existing/New", "Funded"]
+    body = f"""<h1 class="page-title">Portfolio Summary</h1>
+<div class="toolbar"><button type="button" onclick="location.href='/dashboard'">Back</button>
+<input type="search" id="facility-search" placeholder="Search by Facility Type" aria-label="Search by Facility Type">
+<div role="combobox" tabindex="0" aria-label="Level" aria-expanded="false" aria-controls="level-options">WBG Level</div>
+<div id="level-options" role="listbox" hidden><div role="option">WBG Level</div><div role="option">Region Level</div></div></div>
+<table aria-label="Portfolio by facility"><thead><tr>{"".join(f"<th>{h}</th>" for h in headers)}</tr></thead>
+<tbody>{_rows_html(rows, total_row(rows, 12), 12)}</tbody></table>"""
+    script = """
+const combo = document.querySelector('[role=combobox]');
+const options = document.getElementById('level-options');
+async function refresh() {
+  const q = document.getElementById('facility-search').value;
+  const data = await api('GET', '/api/portfolio?level=' + encodeURIComponent(combo.textContent) + '&q=' + encodeURIComponent(q));
+  renderRows(document.querySelector('table tbody'), data.rows, data.total, 12);
+}
+combo.addEventListener('click', () => { options.hidden = !options.hidden; combo.setAttribute('aria-expanded', String(!options.hidden)); });
+options.querySelectorAll('[role=option]').forEach((opt) => opt.addEventListener('click', () => {
+  combo.textContent = opt.textContent; options.hidden = true; combo.setAttribute('aria-expanded', 'false'); refresh();
+}));
+document.getElementById('facility-search').addEventListener('keydown', (e) => { if (e.key === 'Enter') refresh(); });
+"""
+    return layout(data, "Portfolio", body, script)
+
+
+def taskboard_page(data: StubData) -> str:
+    columns = "".join(
+        f'<div class="kanban-column" data-column="{i}"><div class="column-header">'
+        f'<div class="column-title"><span>{escape(name)}</span></div><span class="badge">0</span>'
+        f'<button type="button" aria-label="plus" class="add-task">+</button></div><div class="column-body"></div></div>'
+        for i, name in enumerate(COLUMNS)
+    )
+    body = f"""<h1 class="page-title">Task Board</h1>
+<div class="toolbar"><button type="button" onclick="location.href='/dashboard'">Back</button>
+<button type="button" onclick="location.href='/mir'">Goto Mir</button>
+<button type="button" onclick="location.href='/pastdues'">Goto Past Dues</button></div>
+<div class="kanban" id="kanban">{columns}</div>
+<div id="task-modal" role="dialog" aria-modal="true" aria-label="Task" hidden>
+<input id="task-title" placeholder="* Title" aria-label="Title"><button type="button" id="task-save">Save</button>
+<button type="button" id="task-close" aria-label="Close">Close</button></div>
+<div id="toast" role="status"></div>"""
+    script = """
+let tasks = [];
+let editing = null;
+let addingTo = 0;
+const modal = document.getElementById('task-modal');
+const popup = document.getElementById('popup-root');
+function card(t) {
+  return '<div class="task-card" draggable="true" data-id="' + t.id + '"><div class="task-title">' + esc(t.title) + '</div>' +
+         '<span class="date-label">' + esc(t.due) + '</span>' + t.assignees.map((a) => '<span class="user-tag">' + esc(a) + '</span>').join('') +
+         '<button type="button" aria-label="more" class="more">...</button></div>';
+}
+function render() {
+  document.querySelectorAll('.kanban-column').forEach((col) => {
+    const mine = tasks.filter((t) => t.column === Number(col.dataset.column));
+    col.querySelector('.badge').textContent = mine.length;
+    col.querySelector('.column-body').innerHTML = mine.map(card).join('');
+  });
+}
+async function load() { tasks = (await api('GET', '/api/tasks')).tasks; render(); }
+function openModal(title) { document.getElementById('task-title').value = title || ''; modal.hidden = false; }
+function toast(text) { const el = document.getElementById('toast'); el.textContent = text; setTimeout(() => { el.textContent = ''; }, 3000); }
+document.getElementById('kanban').addEventListener('click', (e) => {
+  const add = e.target.closest('.add-task');
+  if (add) { editing = null; addingTo = Number(add.closest('.kanban-column').dataset.column); openModal(''); return; }
+  const more = e.target.closest('.more');
+  if (!more) return;
+  const id = Number(more.closest('.task-card').dataset.id);
+  popup.innerHTML = '<div class="dropdown" role="menu"><div role="menuitem" data-action="edit">Edit</div>' +
+                    '<div role="menuitem" data-action="delete">Delete</div><div role="menuitem" data-action="view">View card</div></div>';
+  popup.onclick = async (ev) => {
+    const action = ev.target.dataset.action;
+    popup.innerHTML = '';
+    const task = tasks.find((t) => t.id === id);
+    if (action === 'edit') { editing = id; openModal(task.title); }
+    if (action === 'delete') { await api('DELETE', '/api/tasks/' + id); await load(); }
+    if (action === 'view') { editing = id; modal.setAttribute('aria-label', task.title); openModal(task.title); }
+  };
+});
+document.getElementById('task-save').addEventListener('click', async () => {
+  const title = document.getElementById('task-title').value.trim();
+  if (!title) return;
+  if (editing) { await api('PATCH', '/api/tasks/' + editing, { title }); }
+  else { await api('POST', '/api/tasks', { title, column: addingTo }); toast('Successfully created task'); }
+  modal.hidden = true; await load();
+});
+document.getElementById('task-close').addEventListener('click', () => { modal.hidden = true; });
+document.getElementById('kanban').addEventListener('dragstart', (e) => {
+  const c = e.target.closest('.task-card'); if (c) e.dataTransfer.setData('text/plain', c.dataset.id);
+});
+document.querySelectorAll('.kanban-column').forEach((col) => {
+  col.addEventListener('dragover', (e) => e.preventDefault());
+  col.addEventListener('drop', async (e) => {
+    e.preventDefault();
+    const id = e.dataTransfer.getData('text/plain');
+    if (id) { await api('PATCH', '/api/tasks/' + id, { column: Number(col.dataset.column) }); await load(); }
+  });
+});
+load();
+"""
+    return layout(data, "Task Board", body, script)
@@ -0,0 +1,132 @@
+import re
+from decimal import Decimal
+
+from playwright.sync_api import Page
+
+# Reads every header and body cell of the matching table(s) in a single round trip.
+# Ant Design may split the header and body into separate <table> elements, so all
+# matches are merged, mirroring what "table thead tr th" / "table tbody tr" select. Footer
+# rows come after the body rows, since a table may put its "Total" row in <tfoot>.
+_SNAPSHOT_SCRIPT = """(selector) => {
+    const tables = Array.from(document.querySelectorAll(selector));
+    const text = (el) => (el.textContent || '').trim();
+    const headers = [];
+    const rows = [];
+    for (const table of tables) {
+        table.querySelectorAll('thead tr th').forEach((th) => headers.push(text(th)));
+        for (const section of ['tbody tr', 'tfoot tr']) {
+            table.querySelectorAll(section).forEach((tr) => {
+                if (tr.getAttribute('aria-hidden') === 'true') return;  // antd measure rows
+                rows.push(Array.from(tr.querySelectorAll('td'), text));
+            });
+        }
+    }
+    return { headers, rows };
+}"""
+
+# The whole (space-free) text: optional minus and currency code or symbol, then one amount,
+# optionally in accounting parentheses. '1.2M' or '12.34.56' do not match.
+_AMOUNT = re.compile(r"(-?)(?:[A-Z]{3}|[$€£])?(-?)(\(?)(\d[\d,]*(?:\.\d+)?|\.\d+)(\)?)")
+
+
+def parse_number(text: str):
+    """'1,234.50' -> 1234.5, '' or '-' -> 0.0, anything else non-numeric ('N/A') -> None."""
+    cleaned = text.replace(",", "").strip()
+    if not cleaned or cleaned == "-":
+        return 0.0
+    try:
+        return float(cleaned)
+    except ValueError:
+        return None
+
+
+def to_decimal(text):
+    """'AED 1,234.50' -> Decimal('1234.50'), '(1,000)' -> Decimal('-1000'), '' or '-' -> 0, 'N/A' or '1.2M' -> None."""
+    if text is None:
+        return None
+    if isinstance(text, (Decimal, int)):
+        return Decimal(text)
+    cleaned = (text or "").strip()
+    if cleaned in ("", "-"):
+        return Decimal(0)
+    match = _AMOUNT.fullmatch(cleaned.replace(" ", ""))
+    if not match:
+        return None
+    sign, inner_sign, opening, number, closing = match.groups()
+    if bool(opening) != bool(closing) or (sign and inner_sign):
+        return None
+    value = Decimal(number.replace(",", ""))
+    return -value if sign or inner_sign or opening else value
+
+
+def decimal_sum(texts):
+    """Exact sum of shown amounts; None if any of them is not a number."""
+    values = [to_decimal(t) for t in texts]
+    return None if None in values else sum(values, Decimal(0))
+
+
+class TableSnapshot:
+    """Immutable copy of a table's headers and cells, with numbers parsed column by column.
+
+    ``rows`` holds the raw cell texts row by row; ``columns[c][r]`` holds the parsed value
+    of the same cell (``None`` when it is not a number). Column indexes are 0-based.
+    """
+
+    def __init__(self, headers: list, rows: list):
+        self.headers = headers
+        self.rows = rows
+        width = max((len(r) for r in rows), default=0)
+        self.columns = [[parse_number(r[c]) if c < len(r) else None for r in rows] for c in range(width)]
+
+    @classmethod
+    def capture(cls, page: Page, selector: str = "table") -> "TableSnapshot":
+        data = page.evaluate(_SNAPSHOT_SCRIPT, selector)
+        return cls(data["headers"], data["rows"])
+
+    @classmethod
+    async def capture_async(cls, page, selector: str = "table") -> "TableSnapshot":
+        """Same single round trip for a ``playwright.async_api`` page."""
+        data = await page.evaluate(_SNAPSHOT_SCRIPT, selector)
+        return cls(data["headers"], data["rows"])
+
+    @property
+    def row_count(self) -> int:
+        return len(self.rows)
+
+    def total_row_index(self):
+        """Index of the first row with a cell mentioning 'Total', or None."""
+        for i, row in enumerate(self.rows):
+            if any("Total" in cell for cell in row):
+                return i
+        return None
+
+    def total_row(self) -> list:
+        index = self.total_row_index()
+        return self.rows[index] if index is not None else []
+
+    def cell(self, row: int, col: int) -> str:
+        return self.rows[row][col]
+
+    def column(self, col: int, rows: slice = slice(None)) -> list:
+        return self.columns[col][rows]
+
+    def row_sums_match(self, part_cols: list, total_col: int, rows: slice = slice(None)) -> bool:
+        """True when, for every row in ``rows``, the ``part_cols`` add up to ``total_col``."""
+        parts = [self.columns[c][rows] for c in part_cols]
+        totals = self.columns[total_col][rows]
+        for i, total in enumerate(totals):
+            values = [p[i] for p in parts]
+            if total is None or None in values or sum(values) != total:
+                return False
+        return True
+
+    def column_sums_match(self, cols: list, total_row: int, body: slice) -> bool:
+        """True when each column's ``body`` rows add up to the value in ``total_row``."""
+        for c in cols:
+            values = self.columns[c][body]
+            expected = self.columns[c][total_row]
+            if expected is None or None in values:
+                return False
+            if round(sum(values), 2) != round(expected, 2):
+                return False
+        return True
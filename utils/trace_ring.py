@@ -0,0 +1,82 @@
+"""Playwright tracing for failing tests only, recorded as one chunk per test.
+
+With ``--trace-failures`` each module's browser context is traced, and every test records into
+its own chunk. Finished chunks rotate through ``TRACE_RING_SIZE`` slot files (default 3). The
+last few tests are on disk, never more. When a test fails (or fails and passes on a rerun),
+its chunk is attached to its Allure result together with the chunks of the tests that ran just
+before it on the same page. Module-scoped pages carry state from test to test, so those are
+usually where the bad state came from. A context that was not traced from its start (a test's
+own ``page`` from the browser pool, say) is attached when its first chunk begins. Open one with ``playwright show-trace <file>.zip``.
+
+With a ring of 1, passing tests' chunks are discarded without being written at all.
+"""
+import os
+import shutil
+import tempfile
+import weakref
+from collections import deque
+
+import allure
+
+from utils.config import Config
+
+
+class TraceRing:
+    def __init__(self, size: int = None):
+        self.size = max(1, Config.TRACE_RING_SIZE if size is None else size)
+        self.enabled = False
+        self.kept = 0
+        self.open = None         # nodeid of the test whose chunk is being recorded
+        self._context = None
+        self._dir = None
+        self._slot = 0
+        self._chunks = deque(maxlen=self.size)   # (nodeid, path), oldest first; a slot is reused as it drops out
+        self._traced = weakref.WeakSet()          # contexts tracing was started on
+
+    def enable(self):
+        self.enabled = True
+        self._dir = tempfile.mkdtemp(prefix="rak-traces-")
+
+    def attach(self, context):
+        """Starts tracing a new module's context; chunks of the previous page no longer apply."""
+        context.tracing.start(screenshots=True, snapshots=True, sources=False)
+        self._traced.add(context)
+        self._chunks.clear()
+
+    def begin(self, context, nodeid: str):
+        if context not in self._traced:
+            self.attach(context)   # start_chunk needs tracing.start() first
+        context.tracing.start_chunk(title=nodeid)
+        self._context, self.open = context, nodeid
+
+    def end(self, nodeid: str, keep: bool) -> list:
+        """Closes the test's chunk; returns the ring's chunks (this test's last) when ``keep``."""
+        context, self._context, self.open = self._context, None, None
+        if self.size == 1 and not keep:
+            context.tracing.stop_chunk()
+            return []
+        path = os.path.join(self._dir, f"slot-{self._slot}.zip")
+        self._slot = (self._slot + 1) % self.size
+        context.tracing.stop_chunk(path=path)
+        self._chunks.append((nodeid, path))
+        if not keep:
+            return []
+        self.kept += 1
+        return list(self._chunks)
+
+    @staticmethod
+    def attach_to_allure(chunks: list):
+        failing = len(chunks) - 1
+        for position, (nodeid, path) in enumerate(chunks):
+            test = nodeid.split("::")[-1]
+            label = "this test" if position == failing else f"{failing - position} test(s) earlier"
+            allure.attach.file(path, name=f"Playwright trace: {test} ({label})",
+                               attachment_type=allure.attachment_type.ZIP)
+
+    def close(self):
+        if self._dir:
+            shutil.rmtree(self._dir, ignore_errors=True)
+            self._dir = None
+
+
+trace_ring = TraceRing()
@@ -0,0 +1,148 @@
+"""Responsive layout checks at several viewport sizes, run side by side from one browser.
+
+Resizing the shared module ``page`` checks one size at a time and leaves every later test at
+that size. Instead, :class:`ViewportMatrix` opens one context per viewport from the async
+browser (mobile, tablet and desktop by default), all at once on the session event loop. Each
+context has its own size, touch and mobile flags and the saved login. It loads the page, runs
+the page object's ``LAYOUT_CHECKS`` in one round trip, and closes. The wall time is about that
+of the slowest viewport, and the shared page is never touched.
+
+Every viewport becomes one :class:`ViewportResult` row. A run's rows are attached to Allure as
+one table and listed in the terminal summary.
+"""
+import asyncio
+import time
+from dataclasses import dataclass, field
+
+import allure
+
+from utils.config import Config
+
+VIEWPORTS = {
+    "mobile": {"viewport": {"width": 375, "height": 812}, "is_mobile": True, "has_touch": True},
+    "tablet": {"viewport": {"width": 768, "height": 1024}, "has_touch": True},
+    "desktop": {"viewport": {"width": 1440, "height": 900}},
+}
+
+FITS_WIDTH = "fits width"   # the check every page gets: nothing makes the document scroll sideways
+
+# Arg: {name: css selector}. A check passes when any element it matches has a box and is not hidden.
+LAYOUT_SCRIPT = """
+(checks) => {
+  const shown = (el) => {
+    const box = el.getBoundingClientRect();
+    const style = getComputedStyle(el);
+    return box.width > 0 && box.height > 0 && style.visibility !== 'hidden';
+  };
+  const result = {};
+  for (const [name, selector] of Object.entries(checks)) {
+    result[name] = Array.from(document.querySelectorAll(selector)).some(shown);
+  }
+  result['""" + FITS_WIDTH + """'] = document.documentElement.scrollWidth <= window.innerWidth + 1;
+  return result;
+}
+"""
+
+
+def size_of(name: str) -> str:
+    viewport = VIEWPORTS[name]["viewport"]
+    return f"{viewport['width']}x{viewport['height']}"
+
+
+@dataclass
+class ViewportResult:
+    page: str
+    viewport: str
+    size: str
+    checks: dict = field(default_factory=dict)   # check name -> passed
+    ms: float = 0.0
+    error: str = ""
+
+    @property
+    def failed_checks(self) -> list:
+        return [name for name, ok in self.checks.items() if not ok]
+
+    @property
+    def passed(self) -> bool:
+        return not self.error and bool(self.checks) and not self.failed_checks
+
+    def describe(self) -> str:
+        line = f"{self.page} @ {self.viewport} {self.size}: "
+        if self.error:
+            return line + self.error
+        line += f"{len(self.checks) - len(self.failed_checks)}/{len(self.checks)} check(s) in {self.ms:.0f} ms"
+        if self.failed_checks:
+            line += ", failed: " + ", ".join(self.failed_checks)
+        return line
+
+
+class ViewportMatrix:
+    def __init__(self):
+        self.rows = []
+        self.runs = []          # (page object name, wall ms, summed ms) per run
+        self._loop = None
+        self._browser = None
+        self._storage_state = None
+
+    def bind(self, loop, browser, storage_state: str = None) -> "ViewportMatrix":
+        """``loop`` is the session ``LoopThread``, ``browser`` the ``async_browser`` it drives."""
+        self._loop, self._browser, self._storage_state = loop, browser, storage_state
+        return self
+
+    def run(self, page_class, url: str, viewports=None) -> list:
+        """Blocking form of :meth:`run_async`, for sync tests."""
+        return self._loop.run(self.run_async(page_class, url, viewports))
+
+    async def run_async(self, page_class, url: str, viewports=None) -> list:
+        """Loads ``url`` in one new context per viewport, concurrently; one row per viewport."""
+        names = list(viewports or Config.VIEWPORT_MATRIX)
+        started = time.perf_counter()
+        page_name = getattr(page_class, "SYNC_PAGE", page_class).__name__
+        rows = list(await asyncio.gather(*(self._check(page_class, page_name, url, name) for name in names)))
+        wall_ms = (time.perf_counter() - started) * 1000
+        self.rows.extend(rows)
+        self.runs.append((page_name, wall_ms, sum(row.ms for row in rows)))
+        allure.attach(self.table(rows), name=f"Viewport matrix: {page_name}",
+                      attachment_type=allure.attachment_type.TEXT)
+        return rows
+
+    async def _check(self, page_class, page_name: str, url: str, name: str) -> ViewportResult:
+        row = ViewportResult(page_name, name, size_of(name))
+        started = time.perf_counter()
+        context = await self._browser.new_context(storage_state=self._storage_state, **VIEWPORTS[name])
+        try:
+            page_object = page_class(await context.new_page())
+            await page_object.visit(url)
+            await page_object.page.wait_for_load_state("networkidle")
+            row.checks = await page_object.layout_checks()
+        except Exception as e:
+            row.error = f"{type(e).__name__}: {(str(e).strip().splitlines() or [''])[0]}"
+        finally:
+            await context.close()
+        row.ms = (time.perf_counter() - started) * 1000
+        return row
+
+    @staticmethod
+    def table(rows: list) -> str:
+        names = []
+        for row in rows:
+            names.extend(name for name in row.checks if name not in names)
+        lines = ["  ".join([f"{'viewport':<18}", *(f"{name:^12}" for name in names), f"{'ms':>6}"])]
+        for row in rows:
+            cells = [f"{row.viewport + ' ' + row.size:<18}"]
+            cells.extend(f"{('ok' if row.checks[name] else 'FAIL') if name in row.checks else '-':^12}"
+                         for name in names)
+            cells.append(f"{row.ms:6.0f}")
+            if row.error:
+                cells.append(row.error)
+            lines.append("  ".join(cells))
+        return "\n".join(lines)
+
+    def describe(self) -> str:
+        lines = [f"{page}: {wall_ms:.0f} ms wall for {summed_ms:.0f} ms of viewport checks"
+                 for page, wall_ms, summed_ms in self.runs]
+        lines.extend(row.describe() for row in self.rows)
+        return "\n".join(lines)
+
+
+viewport_matrix = ViewportMatrix()
@@ -0,0 +1,297 @@
+"""Visual checks of named page regions against stored baselines.
+
+A region screenshot is compared in steps, cheapest first:
+
+1. its SHA-256 equals the baseline's: pass, nothing is decoded;
+2. its perceptual hash equals the baseline's (up to ``VISUAL_HASH_DISTANCE`` differences): pass.
+   The hash is a quarter-size thumbnail's horizontal and vertical edges plus the mean colour of
+   every tile, so anti-aliasing noise leaves it alone while a changed figure, a moved element or
+   a recoloured one does not. Only the screenshot is decoded; the baseline's hash is stored next
+   to it;
+3. otherwise only the ``TILE``-pixel tiles whose part of the hash changed are diffed, with numpy:
+   the number of pixels off by more than ``VISUAL_PIXEL_TOLERANCE`` in any channel, and SSIM per
+   tile. Either past its limit fails the check, with baseline, actual and diff attached.
+
+Baselines are content-addressed: ``objects/<sha[:2]>/<sha>.png`` (and its ``.hash.npz``) under
+``VISUAL_BASELINE_DIR``, with ``index.json`` mapping each region key to its digest and size. An
+image already stored is never written again. A region without a baseline records one and
+passes; ``--visual-update`` records over failing ones.
+
+    python -m utils.visual prune    # delete objects no region points at any more
+"""
+import hashlib
+import io
+import json
+import os
+import sys
+import time
+from dataclasses import dataclass
+
+import allure
+import numpy as np
+from PIL import Image
+
+from utils.browser_server import FileLock
+from utils.config import Config
+
+HASH_SCALE = 4      # the hash is taken on a 1/HASH_SCALE-size thumbnail
+HASH_EDGE = 8       # brightness step (0-255) between neighbouring thumbnail pixels that counts as an edge
+HASH_COLOUR = 3.0   # change (0-255) in a tile's mean red, green or blue that counts as a difference
+TILE = 64           # pixels; the unit a changed hash is diffed in
+SSIM_WINDOW = 7
+_THUMB_TILE = TILE // HASH_SCALE
+
+
+def decode(png: bytes) -> Image.Image:
+    return Image.open(io.BytesIO(png)).convert("RGB")
+
+
+def _edges(step: np.ndarray) -> np.ndarray:
+    return np.stack([step > HASH_EDGE, step < -HASH_EDGE], axis=-1)
+
+
+def perceptual_hash(image: Image.Image) -> dict:
+    """Rising and falling edges between horizontal and vertical neighbours of a box-filtered
+    thumbnail, and the mean colour of each ``TILE``x``TILE`` tile."""
+    width, height = image.size
+    size = (max(2, -(-width // HASH_SCALE)), max(2, -(-height // HASH_SCALE)))
+    thumbnail = image.resize(size, Image.BOX)
+    gray = np.asarray(thumbnail.convert("L"), dtype=np.int16)
+    rgb = np.asarray(thumbnail, dtype=np.float64)
+    rows = np.arange(0, size[1], _THUMB_TILE)
+    columns = np.arange(0, size[0], _THUMB_TILE)
+    sums = np.add.reduceat(np.add.reduceat(rgb, rows, axis=0), columns, axis=1)
+    counts = np.outer(np.diff(np.append(rows, size[1])), np.diff(np.append(columns, size[0])))
+    return {
+        "horizontal": _edges(gray[:, 1:] - gray[:, :-1]),
+        "vertical": _edges(gray[1:, :] - gray[:-1, :]),
+        "colour": sums / counts[..., None],
+    }
+
+
+def changed_tiles(expected: dict, actual: dict) -> tuple:
+    """(hash differences, sorted (row, column) tiles they fall in)."""
+    tiles = set()
+    # An edge sits between two thumbnail pixels, which may lie in neighbouring tiles
+    rows, columns = np.nonzero((expected["horizontal"] != actual["horizontal"]).any(axis=-1))
+    for row, column in zip(rows, columns):
+        tiles.update({(row // _THUMB_TILE, column // _THUMB_TILE), (row // _THUMB_TILE, (column + 1) // _THUMB_TILE)})
+    distance = len(rows)
+    rows, columns = np.nonzero((expected["vertical"] != actual["vertical"]).any(axis=-1))
+    for row, column in zip(rows, columns):
+        tiles.update({(row // _THUMB_TILE, column // _THUMB_TILE), ((row + 1) // _THUMB_TILE, column // _THUMB_TILE)})
+    distance += len(rows)
+    rows, columns = np.nonzero((np.abs(expected["colour"] - actual["colour"]) > HASH_COLOUR).any(axis=-1))
+    tiles.update(zip(rows, columns))
+    distance += len(rows)
+    return distance, sorted((int(row), int(column)) for row, column in tiles)
+
+
+def _box_mean(a: np.ndarray, window: int) -> np.ndarray:
+    """Mean over every ``window``x``window`` patch, via an integral image."""
+    total = np.pad(a, ((1, 0), (1, 0))).cumsum(0).cumsum(1)
+    return (total[window:, window:] - total[:-window, window:] - total[window:, :-window]
+            + total[:-window, :-window]) / (window * window)
+
+
+def ssim(a: np.ndarray, b: np.ndarray, window: int = SSIM_WINDOW) -> float:
+    """Mean structural similarity of two same-sized grayscale images (1.0 = identical)."""
+    window = max(1, min(window, *a.shape))
+    c1, c2 = (0.01 * 255) ** 2, (0.03 * 255) ** 2
+    mu_a, mu_b = _box_mean(a, window), _box_mean(b, window)
+    var_a = _box_mean(a * a, window) - mu_a ** 2
+    var_b = _box_mean(b * b, window) - mu_b ** 2
+    covariance = _box_mean(a * b, window) - mu_a * mu_b
+    index = ((2 * mu_a * mu_b + c1) * (2 * covariance + c2)) / ((mu_a ** 2 + mu_b ** 2 + c1) * (var_a + var_b + c2))
+    return float(index.mean())
+
+
+def _grayscale(rgb: np.ndarray) -> np.ndarray:
+    return rgb @ np.array([0.299, 0.587, 0.114])
+
+
+def _png(image: Image.Image) -> bytes:
+    out = io.BytesIO()
+    image.save(out, format="PNG")
+    return out.getvalue()
+
+
+@dataclass
+class VisualResult:
+    key: str
+    status: str                 # new, exact, hash, diff (passed after diffing), updated, mismatch
+    ms: float
+    distance: int = None        # hash differences (edge bits, tile colours) from the baseline
+    tiles: int = None           # tiles diffed
+    changed: int = None         # pixels past VISUAL_PIXEL_TOLERANCE
+    similarity: float = None    # lowest SSIM of a diffed tile
+    detail: str = ""
+
+    @property
+    def passed(self) -> bool:
+        return self.status != "mismatch"
+
+    def describe(self) -> str:
+        parts = [f"{self.key}: {self.status} in {self.ms:.1f} ms"]
+        if self.changed is not None:
+            parts.append(f"{self.tiles} tile(s) diffed, {self.changed} pixel(s) changed, "
+                         f"lowest SSIM {self.similarity:.4f}")
+        if self.detail:
+            parts.append(self.detail)
+        return ", ".join(parts)
+
+
+class VisualBaselines:
+    def __init__(self, root: str = None):
+        self.root = root or Config.VISUAL_BASELINE_DIR
+        self.update = False
+        self.results = []
+        self._index = None
+
+    @property
+    def index_path(self) -> str:
+        return os.path.join(self.root, "index.json")
+
+    @property
+    def index(self) -> dict:
+        if self._index is None:
+            try:
+                with open(self.index_path, encoding="utf-8") as f:
+                    self._index = json.load(f)
+            except (OSError, ValueError):
+                self._index = {}
+        return self._index
+
+    def object_path(self, digest: str, extension: str = ".png") -> str:
+        return os.path.join(self.root, "objects", digest[:2], digest + extension)
+
+    def check(self, key: str, png: bytes) -> VisualResult:
+        started = time.perf_counter()
+        result = self._compare(key, png)
+        result.ms = (time.perf_counter() - started) * 1000
+        self.results.append(result)
+        return result
+
+    def _compare(self, key: str, png: bytes) -> VisualResult:
+        digest = hashlib.sha256(png).hexdigest()
+        baseline = self.index.get(key)
+        if baseline and baseline["sha256"] == digest:
+            return VisualResult(key, "exact", 0)
+        image = decode(png)
+        phash = perceptual_hash(image)
+        if baseline is None:
+            self._record(key, png, digest, phash, image.size)
+            return VisualResult(key, "new", 0, detail="baseline recorded")
+        result = self._diff(key, image, phash, baseline)
+        if not result.passed and self.update:
+            self._record(key, png, digest, phash, image.size)
+            result.status, result.detail = "updated", "baseline re-recorded (--visual-update)"
+        return result
+
+    def _diff(self, key: str, image: Image.Image, phash: dict, baseline: dict) -> VisualResult:
+        if list(image.size) == baseline["size"]:
+            distance, tiles = changed_tiles(self._load_hash(baseline["sha256"]), phash)
+            if distance <= Config.VISUAL_HASH_DISTANCE:
+                return VisualResult(key, "hash", 0, distance=distance)
+        with open(self.object_path(baseline["sha256"]), "rb") as f:
+            expected = decode(f.read())
+        if expected.size != image.size:
+            self._attach(key, expected, image, None)
+            return VisualResult(key, "mismatch", 0, detail=f"size {image.size[0]}x{image.size[1]}, "
+                                                           f"baseline {expected.size[0]}x{expected.size[1]}")
+        a = np.asarray(expected, dtype=np.int16)
+        b = np.asarray(image, dtype=np.int16)
+        changed_mask = np.zeros(a.shape[:2], dtype=bool)
+        similarity = 1.0
+        for row, column in tiles:
+            box = (slice(row * TILE, (row + 1) * TILE), slice(column * TILE, (column + 1) * TILE))
+            tile_a, tile_b = a[box], b[box]
+            changed_mask[box] = np.abs(tile_a - tile_b).max(axis=2) > Config.VISUAL_PIXEL_TOLERANCE
+            similarity = min(similarity, ssim(_grayscale(tile_a.astype(np.float64)),
+                                              _grayscale(tile_b.astype(np.float64))))
+        changed = int(changed_mask.sum())
+        result = VisualResult(key, "diff", 0, distance=distance, tiles=len(tiles), changed=changed,
+                              similarity=similarity)
+        if changed > Config.VISUAL_MAX_CHANGED_PIXELS or similarity < Config.VISUAL_SSIM_MIN:
+            self._attach(key, expected, image, changed_mask)
+            result.status = "mismatch"
+            result.detail = f"limits {Config.VISUAL_MAX_CHANGED_PIXELS} pixels, SSIM {Config.VISUAL_SSIM_MIN}"
+        return result
+
+    def _load_hash(self, digest: str) -> dict:
+        try:
+            with np.load(self.object_path(digest, ".hash.npz")) as stored:
+                return {name: stored[name] for name in stored.files}
+        except OSError:
+            # Recorded before the hash had its current form: hash the baseline image instead
+            with open(self.object_path(digest), "rb") as f:
+                return perceptual_hash(decode(f.read()))
+
+    @staticmethod
+    def _attach(key: str, expected: Image.Image, actual: Image.Image, changed_mask):
+        allure.attach(_png(expected), name=f"{key}: baseline", attachment_type=allure.attachment_type.PNG)
+        allure.attach(_png(actual), name=f"{key}: actual", attachment_type=allure.attachment_type.PNG)
+        if changed_mask is not None:
+            # The actual image faded to grey, with every changed pixel in red
+            faded = (np.asarray(actual.convert("L"), dtype=np.uint8) // 3 + 170)[..., None].repeat(3, axis=2)
+            faded[changed_mask] = (255, 0, 0)
+            allure.attach(_png(Image.fromarray(faded)), name=f"{key}: diff", attachment_type=allure.attachment_type.PNG)
+
+    def _record(self, key: str, png: bytes, digest: str, phash: dict, size: tuple):
+        path = self.object_path(digest)
+        if not os.path.exists(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(f"{path}.{os.getpid()}.tmp", "wb") as f:
+                np.savez(f, **phash)
+            os.replace(f"{path}.{os.getpid()}.tmp", self.object_path(digest, ".hash.npz"))
+            with open(f"{path}.{os.getpid()}.tmp", "wb") as f:
+                f.write(png)
+            os.replace(f"{path}.{os.getpid()}.tmp", path)  # last, so an image on disk always has its hash
+        os.makedirs(self.root, exist_ok=True)
+        # Re-read under the lock: parallel workers record other regions into the same index
+        with FileLock(self.index_path + ".lock"):
+            self._index = None
+            index = self.index
+            index[key] = {"sha256": digest, "size": list(size), "recorded": time.time()}
+            tmp = f"{self.index_path}.{os.getpid()}.tmp"
+            with open(tmp, "w", encoding="utf-8") as f:
+                json.dump(index, f, indent=1, sort_keys=True)
+            os.replace(tmp, self.index_path)
+
+    def prune(self) -> int:
+        """Deletes stored images (and their hashes) no region points at any more; returns how many files."""
+        referenced = {entry["sha256"] for entry in self.index.values()}
+        removed = 0
+        objects = os.path.join(self.root, "objects")
+        for folder, _, files in os.walk(objects):
+            for name in files:
+                if name.split(".", 1)[0] not in referenced:
+                    os.remove(os.path.join(folder, name))
+                    removed += 1
+        return removed
+
+    def describe(self) -> str:
+        counts = {}
+        for result in self.results:
+            counts[result.status] = counts.get(result.status, 0) + 1
+        passed = [r.ms for r in self.results if r.status in ("exact", "hash")]
+        line = f"{len(self.results)} check(s): " + ", ".join(f"{n} {status}" for status, n in sorted(counts.items()))
+        if passed:
+            line += f"; unchanged regions took {sum(passed) / len(passed):.1f} ms on average"
+        return "\n".join([line] + [r.describe() for r in self.results if r.status in ("mismatch", "new", "updated")])
+
+
+visual_baselines = VisualBaselines()
+
+
+def main(argv=None) -> int:
+    argv = sys.argv[1:] if argv is None else argv
+    if argv != ["prune"]:
+        print("usage: python -m utils.visual prune")
+        return 2
+    print(f"removed {visual_baselines.prune()} unreferenced baseline image(s)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
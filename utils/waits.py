@@ -0,0 +1,178 @@
+import inspect
+import logging
+import re
+import time
+from dataclasses import dataclass, field
+
+from playwright.sync_api import TimeoutError  # the same class the async API raises
+
+logger = logging.getLogger("rak.waits")
+
+SPINNER_SELECTOR = ".ant-spin-spinning"
+
+# Installs a one-shot MutationObserver on the element; the flag flips on the first change.
+ARM_MUTATION_SCRIPT = """(el) => {
+    window.__rakMutated = false;
+    const observer = new MutationObserver(() => { window.__rakMutated = true; observer.disconnect(); });
+    observer.observe(el, { childList: true, subtree: true, characterData: true, attributes: true });
+}"""
+MUTATION_FIRED_SCRIPT = "() => window.__rakMutated === true"
+
+
+@dataclass
+class WaitRecord:
+    label: str
+    elapsed_ms: float
+    legacy_ms: int
+    fired: bool
+
+    @property
+    def saved_ms(self) -> float:
+        return max(0.0, self.legacy_ms - self.elapsed_ms)
+
+
+@dataclass
+class WaitStats:
+    """Run-wide tally of event-driven waits, compared with the fixed sleeps they replaced."""
+    records: list = field(default_factory=list)
+
+    def add(self, record: WaitRecord):
+        self.records.append(record)
+        logger.info(
+            "%s settled in %.0f ms (%s), saved %.0f ms vs fixed %d ms sleep",
+            record.label, record.elapsed_ms, "signal" if record.fired else "timed out",
+            record.saved_ms, record.legacy_ms,
+        )
+
+    @property
+    def total_saved_ms(self) -> float:
+        return sum(r.saved_ms for r in self.records)
+
+    def summary(self) -> str:
+        timed_out = sum(1 for r in self.records if not r.fired)
+        return (f"{len(self.records)} event-driven waits saved {self.total_saved_ms / 1000:.1f}s "
+                f"vs fixed sleeps ({timed_out} fell back to the full timeout)")
+
+
+wait_stats = WaitStats()
+
+
+def response_matcher(response):
+    """``settle``'s ``response`` signal (URL substring, regex or predicate) as a response predicate."""
+    if callable(response):
+        return response
+    if isinstance(response, re.Pattern):
+        return lambda r: bool(response.search(r.url))
+    return lambda r: response in r.url
+
+
+@dataclass
+class _Enter:
+    manager: object     # page.expect_response(...), sync or async
+
+
+@dataclass
+class _Exit:
+    manager: object
+    error: BaseException = None
+
+
+def settle_steps(page, action, *, legacy_ms: int, response=None, mutation: str = None,
+                 navigation: bool = False, spinner: bool = True, timeout: int = None, label: str = None):
+    """The Playwright calls of one ``settle``, in order, for :func:`run_settle` or :func:`run_settle_async`.
+
+    Each step is yielded as a zero-argument callable (or an expect_response enter/exit), and the
+    driver sends back its result or throws its exception in. So the sync and the async page
+    objects share one copy of the signal logic, and only the drivers differ.
+    """
+    timeout = legacy_ms if timeout is None else timeout
+    start = time.perf_counter()
+
+    def remaining() -> float:
+        return max(1, timeout - (time.perf_counter() - start) * 1000)
+
+    watched = None
+    if mutation:
+        target = page.locator(mutation).first
+        # Nothing to observe yet means the element appearing is the signal
+        if (yield target.count):
+            yield lambda: target.evaluate(ARM_MUTATION_SCRIPT)
+            watched = target
+    url_before = page.url
+
+    waiting = page.expect_response(response_matcher(response), timeout=timeout) if response is not None else None
+    if waiting is not None:
+        yield _Enter(waiting)
+    try:
+        yield action
+    except BaseException as error:
+        # The action itself failed (a click that timed out included): raise it, as the fixed sleep did
+        if waiting is not None:
+            yield _Exit(waiting, error)
+        raise
+
+    fired = True
+    try:
+        if waiting is not None:
+            yield _Exit(waiting)
+        if mutation:
+            if watched is not None:
+                yield lambda: page.wait_for_function(MUTATION_FIRED_SCRIPT, timeout=remaining())
+            else:
+                yield lambda: page.wait_for_selector(mutation, timeout=remaining())
+        if navigation:
+            yield lambda: page.wait_for_url(lambda url: url != url_before, timeout=remaining())
+        if spinner:
+            yield lambda: page.wait_for_selector(SPINNER_SELECTOR, state="hidden", timeout=remaining())
+    except TimeoutError:
+        fired = False
+
+    elapsed_ms = (time.perf_counter() - start) * 1000
+    wait_stats.add(WaitRecord(label or getattr(action, "__name__", "action"), elapsed_ms, legacy_ms, fired))
+    return elapsed_ms
+
+
+def run_settle(steps) -> float:
+    """Drives :func:`settle_steps` with the sync API."""
+    result, error = None, None
+    while True:
+        try:
+            step = steps.throw(error) if error is not None else steps.send(result)
+        except StopIteration as done:
+            return done.value
+        result, error = None, None
+        try:
+            if isinstance(step, _Enter):
+                step.manager.__enter__()
+            elif isinstance(step, _Exit):
+                step.manager.__exit__(*_exc_info(step.error))
+            else:
+                result = step()
+        except Exception as e:
+            error = e
+
+
+async def run_settle_async(steps) -> float:
+    """Drives :func:`settle_steps` with the async API; steps returning awaitables are awaited."""
+    result, error = None, None
+    while True:
+        try:
+            step = steps.throw(error) if error is not None else steps.send(result)
+        except StopIteration as done:
+            return done.value
+        result, error = None, None
+        try:
+            if isinstance(step, _Enter):
+                await step.manager.__aenter__()
+            elif isinstance(step, _Exit):
+                await step.manager.__aexit__(*_exc_info(step.error))
+            else:
+                result = step()
+                if inspect.isawaitable(result):
+                    result = await result
+        except Exception as e:
+            error = e
+
+
+def _exc_info(error) -> tuple:
+    return (None, None, None) if error is None else (type(error), error, error.__traceback__)
@@ -0,0 +1,140 @@
+"""Web-performance capture for page visits and sidebar navigation (``pytest --web-perf``).
+
+After each measured navigation the page's own Performance API is read in one ``evaluate``:
+Navigation Timing (TTFB, DOMContentLoaded, load), paint and LCP entries, bytes transferred
+and the JS heap. Page objects declare budgets next to their selectors::
+
+    class PortfolioPage(BasePage):
+        URL_PATH = "portfolio"
+        PERFORMANCE_BUDGET = {"ttfb_ms": 800, "lcp_ms": 2500}
+
+A navigation that breaks its budget fails the test with ``PerformanceBudgetExceeded``,
+which Allure files under its own "Performance budget exceeded" category.
+"""
+import json
+import os
+import time
+from dataclasses import asdict, dataclass, fields
+
+# ``since`` is a performance.now() mark taken before the action; 0 means a fresh document load
+CAPTURE_SCRIPT = """(since) => {
+    const nav = performance.getEntriesByType('navigation')[0];
+    const paint = {};
+    for (const entry of performance.getEntriesByType('paint')) paint[entry.name] = entry.startTime;
+    let lcp = null;
+    try {
+        // Buffered entries land in the observer's buffer synchronously, so no need to wait for a callback
+        const observer = new PerformanceObserver(() => {});
+        observer.observe({ type: 'largest-contentful-paint', buffered: true });
+        const entries = observer.takeRecords();
+        observer.disconnect();
+        if (entries.length) lcp = entries[entries.length - 1].startTime;
+    } catch (e) {}
+    const resources = performance.getEntriesByType('resource').filter(r => r.startTime >= since);
+    let transfer = resources.reduce((sum, r) => sum + (r.transferSize || 0), 0);
+    if (!since && nav) transfer += nav.transferSize || 0;
+    return {
+        timeOrigin: performance.timeOrigin,
+        ttfb: nav ? nav.responseStart - nav.startTime : null,
+        domContentLoaded: nav ? nav.domContentLoadedEventEnd - nav.startTime : null,
+        load: nav && nav.loadEventEnd ? nav.loadEventEnd - nav.startTime : null,
+        fcp: paint['first-contentful-paint'] ?? null,
+        lcp: lcp,
+        transfer: transfer,
+        resources: resources.length,
+        heap: performance.memory ? performance.memory.usedJSHeapSize : null,
+    };
+}"""
+MARK_SCRIPT = "() => [performance.timeOrigin, performance.now()]"
+CATEGORY_NAME = "Performance budget exceeded"
+
+
+class PerformanceBudgetExceeded(AssertionError):
+    pass
+
+
+@dataclass
+class PerfMetrics:
+    label: str
+    url: str
+    page: str
+    kind: str  # "navigation" (new document) or "soft" (in-app route change)
+    duration_ms: float
+    ttfb_ms: float = None
+    fcp_ms: float = None
+    lcp_ms: float = None
+    dom_content_loaded_ms: float = None
+    load_ms: float = None
+    transfer_bytes: int = None
+    resource_count: int = None
+    js_heap_bytes: int = None
+
+    def violations(self, budget: dict) -> list:
+        problems = []
+        for metric, limit in budget.items():
+            value = getattr(self, metric)
+            if value is not None and value > limit:
+                problems.append(f"{self.page} {metric} {value:.0f} > {limit} ({self.url})")
+        return problems
+
+    def describe(self) -> str:
+        values = ", ".join(f"{f.name}={getattr(self, f.name):.0f}" for f in fields(self)
+                           if f.name.endswith(("_ms", "_bytes", "_count")) and getattr(self, f.name) is not None)
+        return f"[{self.kind}] {self.page} {self.url}: {values}"
+
+
+class WebPerf:
+    def __init__(self):
+        self.enabled = False
+        self.captures = []     # every capture of the run
+        self.violations = []   # budget violations of the current test
+
+    def measure(self, page, action, label: str, budget_for):
+        """Runs ``action`` (a navigation), captures its metrics and checks ``budget_for(url)``."""
+        time_origin, since = page.evaluate(MARK_SCRIPT) if page.url.startswith("http") else (None, 0)
+        start = time.perf_counter()
+        result = action()
+        duration_ms = (time.perf_counter() - start) * 1000
+        try:
+            page.wait_for_load_state("load")
+            raw = page.evaluate(CAPTURE_SCRIPT, 0)
+            soft = raw["timeOrigin"] == time_origin
+            if soft:  # same document: navigation timing belongs to the original load
+                raw = page.evaluate(CAPTURE_SCRIPT, since)
+        except Exception:
+            return result  # page closed or crashed mid-navigation; the test itself will report that
+        page_name, budget = budget_for(page.url)
+        metrics = PerfMetrics(
+            label=label, url=page.url, page=page_name, kind="soft" if soft else "navigation",
+            duration_ms=duration_ms, transfer_bytes=raw["transfer"], resource_count=raw["resources"],
+            js_heap_bytes=raw["heap"],
+            **({} if soft else {"ttfb_ms": raw["ttfb"], "fcp_ms": raw["fcp"], "lcp_ms": raw["lcp"],
+                                "dom_content_loaded_ms": raw["domContentLoaded"], "load_ms": raw["load"]}),
+        )
+        self.captures.append(metrics)
+        self.violations.extend(metrics.violations(budget))
+        return result
+
+    def begin_test(self) -> int:
+        self.violations = []
+        return len(self.captures)
+
+    def write_allure_categories(self, results_dir: str):
+        """Adds the budget category to ``categories.json`` in the Allure results, keeping any others."""
+        path = os.path.join(results_dir, "categories.json")
+        categories = []
+        if os.path.exists(path):
+            with open(path) as f:
+                categories = [c for c in json.load(f) if c.get("name") != CATEGORY_NAME]
+        categories.insert(0, {"name": CATEGORY_NAME, "matchedStatuses": ["failed"],
+                              "messageRegex": f"(?s).*{CATEGORY_NAME}.*"})
+        os.makedirs(results_dir, exist_ok=True)
+        with open(path, "w") as f:
+            json.dump(categories, f, indent=2)
+
+    @staticmethod
+    def as_json(captures: list) -> str:
+        return json.dumps([asdict(c) for c in captures], indent=2)
+
+
+web_perf = WebPerf()